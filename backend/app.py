@@ -9,6 +9,25 @@ try:
 except ImportError:
     ModelView = None  # Placeholder if SQLAlchemy not installed
 from denodo_adapter import get_validated_ideas
+from signal_fanout import SignalFanout, SignalCall, SignalUnavailable
+from idea_embeddings import IdeaEmbeddingSpace
+from github_search import GitHubSearchClient
+from reddit_signals import RedditSignalCollector
+from signal_cache import SignalCache, CREATE_TABLE_SQL as SIGNAL_CACHE_TABLE_SQL
+from trends_scheduler import TrendsScheduler
+from trend_series import TrendSeriesStore, CREATE_TABLE_SQL as TREND_SERIES_TABLE_SQL
+from ttl_cache import TTLSingleFlightCache
+from signal_fixtures import FixtureMissing, fixture_store
+from latency_budget import Deadline, deadline_for, LATENCY_BUDGET_HEADER
+from semantic_reuse import RecentIdeaIndex
+from scoring_math import BatchScorer, confidence_label
+from local_scorer import FastScorer, TfidfCorpus
+from news_counts import NewsCountClient
+from cache_warmer import HotKeywordWarmer, WARMER_ENABLED
+from llm_client import llm_client, LLMError
+from llm_router import LLMRouter
+from llm_cache import LLMResponseCache, LLM_CACHE_ENABLED, CREATE_TABLE_SQL as LLM_CACHE_TABLE_SQL
+from signal_sources import SignalSource, SourceRegistry, SourcePlanner, TIER_COST_LIMITS, DEFAULT_TIER, SCORING_TIER_HEADER
 import json
 import re
 import sqlite3
@@ -31,6 +50,7 @@ import uuid
 import subprocess
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
 from bs4 import BeautifulSoup
 from pytrends.request import TrendReq
@@ -167,6 +187,24 @@ def upgrade_db_schema():
                     except Exception as e:
                         print(f"[upgrade_db_schema] Could not create index: {e}")
 
+            # Persistent external-signal cache (see signal_cache.py)
+            cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='signal_cache'")
+            if not cur.fetchone():
+                cur.execute(SIGNAL_CACHE_TABLE_SQL)
+                print("[upgrade_db_schema] Created signal_cache table")
+
+            # Persisted weekly Google Trends series (see trend_series.py)
+            cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='trend_series'")
+            if not cur.fetchone():
+                cur.execute(TREND_SERIES_TABLE_SQL)
+                print("[upgrade_db_schema] Created trend_series table")
+
+            # Content-addressed LLM response cache (see llm_cache.py)
+            cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='llm_cache'")
+            if not cur.fetchone():
+                cur.execute(LLM_CACHE_TABLE_SQL)
+                print("[upgrade_db_schema] Created llm_cache table")
+
             conn.commit()
             print("[upgrade_db_schema] Database upgrade complete")
     except Exception as e:
@@ -250,32 +288,63 @@ def load_datasets():
     except Exception as e:
         print(f"❌ Error loading datasets: {e}")
 
+def financial_headlines():
+    if 'financial' in datasets and 'Headline' in datasets['financial'].columns:
+        return datasets['financial']['Headline'].dropna().astype(str).tolist()
+    return []
+
+def tech_survey_texts():
+    tech_texts = []
+    if 'tech' in datasets:
+        for col in datasets['tech'].columns:
+            if col and datasets['tech'][col].dtype == 'object':
+                tech_texts.extend(datasets['tech'][col].dropna().astype(str))
+    return tech_texts
+
 def initialize_vectorizers():
     """Initialize TF-IDF vectorizers for text analysis"""
     global vectorizers
     
     try:
         # Financial news vectorizer
-        if 'financial' in datasets and 'Headline' in datasets['financial'].columns:
-            headlines = datasets['financial']['Headline'].dropna().astype(str)
+        headlines = financial_headlines()
+        if headlines:
             vectorizers['financial'] = TfidfVectorizer(max_features=1000, stop_words='english')
             vectorizers['financial'].fit(headlines)
         
         # Tech survey vectorizer
-        if 'tech' in datasets:
-            tech_texts = []
-            for col in datasets['tech'].columns:
-                if col and datasets['tech'][col].dtype == 'object':
-                    tech_texts.extend(datasets['tech'][col].dropna().astype(str))
-            if tech_texts:
-                vectorizers['tech'] = TfidfVectorizer(max_features=500, stop_words='english')
-                vectorizers['tech'].fit(tech_texts)
+        tech_texts = tech_survey_texts()
+        if tech_texts:
+            vectorizers['tech'] = TfidfVectorizer(max_features=500, stop_words='english')
+            vectorizers['tech'].fit(tech_texts)
         
         print("✅ Vectorizers initialized")
         
     except Exception as e:
         print(f"❌ Error initializing vectorizers: {e}")
 
+fast_scorer = None
+_fast_scorer_lock = threading.Lock()
+
+def get_fast_scorer():
+    """
+    Network-free TF-IDF scorer over the local datasets, built on first use.
+    Datasets are only preloaded when app.py runs directly, so under gunicorn
+    the first fast request loads them.
+    """
+    global fast_scorer
+    with _fast_scorer_lock:
+        if fast_scorer is None:
+            if not datasets:
+                load_datasets()
+            headlines = financial_headlines()
+            tech_texts = tech_survey_texts()
+            fast_scorer = FastScorer(
+                TfidfCorpus(headlines, vectorizers.get('financial')) if headlines else None,
+                TfidfCorpus(tech_texts, vectorizers.get('tech'), max_features=500) if tech_texts else None,
+            )
+    return fast_scorer
+
 # Initialize the new validation system
 # Load .env with flexible paths so Validation_score folder is optional
 backend_dir = os.path.dirname(__file__)
@@ -295,7 +364,7 @@ else:
 model = SentenceTransformer('all-MiniLM-L6-v2')
 
 # Initialize external APIs
-pytrends = TrendReq(hl='en-US', tz=360)
+pytrends = TrendReq(hl='en-US', tz=360, timeout=(5, 20))
 news_api_key = os.getenv("NEWS_API_KEY")
 github_token = os.getenv("GITHUB_TOKEN")
 
@@ -310,76 +379,73 @@ reddit = praw.Reddit(
     user_agent=os.getenv("REDDIT_USER_AGENT")
 )
 
+# Base-term and category matrix encoded once; each idea is encoded once and cached
+embedding_space = IdeaEmbeddingSpace(model)
+
 def extract_keywords(idea, top_n=5):
     """Extract keywords from idea using semantic analysis"""
-    words = re.findall(r'\b\w+\b', idea.lower())
-    candidates = [' '.join(words[i:j]) for i in range(len(words)) for j in range(i+1, min(i+4, len(words)+1))]
-    embeddings = model.encode(candidates)
-    norms = [np.linalg.norm(vec) for vec in embeddings]
-    ranked = sorted(zip(candidates, norms), key=lambda x: x[1], reverse=True)
-    return [phrase for phrase, _ in ranked[:top_n]]
+    return embedding_space.context(idea).keywords(top_n)
 
 def simplify_idea(idea):
     """Simplify idea to base terms using semantic similarity"""
-    base_terms = [
-        "AI", "automation", "assistant", "health", "fitness", "education", "finance",
-        "business", "sports", "technology", "medical", "robot", "app", "startup",
-        "doctor", "chatbot", "device", "wearable", "productivity", "marketing", "data"
-    ]
-    idea_vec = model.encode([idea])
-    term_vecs = model.encode(base_terms)
-    similarities = np.dot(term_vecs, idea_vec.T) / (
-        np.linalg.norm(term_vecs, axis=1, keepdims=True) * np.linalg.norm(idea_vec)
-    )
-    top_indices = np.argsort(similarities.flatten())[-3:]
-    top_terms = [base_terms[i] for i in top_indices]
-    return " ".join(top_terms) if top_terms else idea
+    return embedding_space.context(idea).simplified()
 
 # Market Potential Class
 class MarketPotential:
-    def __init__(self, pytrends, reddit, news_api_key):
+    # Longest a pytrends score waits on the shared Trends scheduler (matches its fan-out timeout)
+    TRENDS_TIMEOUT = 25
+    NEWSAPI_TIMEOUT = 10
+
+    def __init__(self, pytrends, reddit, news_api_key, reddit_collector=None, trends_scheduler=None, fixtures=None,
+                 news_client=None):
         self.pytrends = pytrends
+        self.fixtures = fixtures or fixture_store
+        self.trends = trends_scheduler or TrendsScheduler(pytrends)
         self.reddit = reddit
         self.news_api_key = news_api_key
+        self.news = news_client or NewsCountClient(news_api_key, timeout=self.NEWSAPI_TIMEOUT, fixtures=self.fixtures)
         self.categories = {
             "Business": 12, "Health": 45, "Sports": 20, "Technology": 5,
             "Finance": 7, "Education": 74, "Internet": 13,
         }
+        self.reddit_signals = reddit_collector or RedditSignalCollector(reddit, list(self.categories))
 
-    def get_pytrends_score(self, idea):
-        """Get Google Trends score for the idea"""
+    def get_pytrends_score(self, idea, timeout=None):
+        """Get Google Trends score for the idea, waiting at most timeout seconds (TRENDS_TIMEOUT by default)"""
         scores = []
         keywords = [word for word in re.findall(r'\b\w+\b', idea) if len(word) > 2][:3]
         if not keywords:
             keywords = [idea]
         
+        # One payload per category for this idea's keywords alone, coalesced and rate-paced with other ideas'
+        timeout = self.TRENDS_TIMEOUT if timeout is None else min(timeout, self.TRENDS_TIMEOUT)
+        means = self.trends.keyword_means(keywords, self.categories.values(), timeout=timeout)
+        failed = False
         for cat in self.categories.values():
-            try:
-                self.pytrends.build_payload(keywords, cat=cat, timeframe='now 3-y', geo='', gprop='')
-                data = self.pytrends.interest_over_time()
-                if data.empty:
-                    scores.append(40)
-                else:
-                    trend_mean = data[keywords].mean().mean()
-                    scores.append(int(trend_mean))
-            except Exception:
+            cat_means = means.get(cat, {})
+            if len(cat_means) < len(set(keywords)):
+                failed = True  # a Trends request failed or timed out
                 scores.append(40)
+            elif any(m is None for m in cat_means.values()):
+                scores.append(40)
+            else:
+                scores.append(int(np.mean(list(cat_means.values()))))
         
-        return int(np.mean(scores)) if scores else 40
+        score = int(np.mean(scores)) if scores else 40
+        if failed:
+            raise SignalUnavailable(score, "Trends requests failed")
+        return score
 
     def fetch_reddit_posts(self, idea, limit=50):
         """Get Reddit engagement score for the idea"""
         Score2 = []
+        try:
+            stats = self.reddit_signals.collect(idea)
+        except Exception as e:
+            raise SignalUnavailable(40, f"Reddit search failed: {e}")
         for category in self.categories:
-            total_engagement = 0
-            total_posts = 0
-            try:
-                subreddit = self.reddit.subreddit(category.lower())
-                for submission in subreddit.search(idea, limit=limit):
-                    total_engagement += submission.score + submission.num_comments
-                    total_posts += 1
-            except Exception:
-                pass
+            total_engagement = stats.get(category.lower(), {}).get("engagement", 0)
+            total_posts = stats.get(category.lower(), {}).get("posts", 0)
             
             if total_posts == 0:
                 Score2.append(40)
@@ -387,25 +453,18 @@ class MarketPotential:
                 Score2.append(int(total_engagement / total_posts))
         return int(np.mean(Score2)) if Score2 else 40
 
+    def fetch_newsapi_results(self, idea, NEWS_API):
+        """NewsAPI article count for the last 90 days: {"status_code", "totalResults"} (cached for the day)"""
+        return self.news.count(idea, NEWS_API)
+
     def get_newsapi_score(self, idea, NEWS_API):
         """Get News API score for the idea"""
         Score3 = []
-        url = "https://newsapi.org/v2/everything"
-        params = {
-            "q": idea,
-            "from": (datetime.now() - pd.Timedelta(days=90)).strftime("%Y-%m-%d"),
-            "sortBy": "relevancy",
-            "language": "en",
-            "pageSize": 100,
-            "apiKey": NEWS_API
-        }
-
         try:
-            response = requests.get(url, params=params)
-            if response.status_code != 200:
-                Score3.append(40)
+            data = self.fetch_newsapi_results(idea, NEWS_API)
+            if data["status_code"] != 200:
+                raise SignalUnavailable(40, f"NewsAPI returned {data['status_code']}")
             else:
-                data = response.json()
                 total_articles = data.get("totalResults", 0)
                 if total_articles == 0:
                     Score3.append(40)
@@ -417,8 +476,10 @@ class MarketPotential:
                     Score3.append(80)
                 else:
                     Score3.append(100)
-        except Exception:
-            Score3.append(40)
+        except SignalUnavailable:
+            raise
+        except Exception as e:
+            raise SignalUnavailable(40, f"NewsAPI request failed: {e}")
         
         return int(np.mean(Score3)) if Score3 else 40
 
@@ -432,22 +493,18 @@ class MarketPotential:
 
 # Technical Risk Class
 class TechnicalRisk:
-    def __init__(self, GITHUB_TOKEN):
+    def __init__(self, GITHUB_TOKEN, github_client=None):
         self.GITHUB_TOKEN = GITHUB_TOKEN
+        self.github = github_client or GitHubSearchClient(GITHUB_TOKEN)
 
     def github_score(self, idea):
         """Get GitHub repository score for the idea"""
-        url = f"https://api.github.com/search/repositories?q={idea}+in:name,description"
-        headers = {"Authorization": f"token {self.GITHUB_TOKEN}"}
-        
         Score4 = []
         try:
-            response = requests.get(url, headers=headers)
-            if response.status_code != 200:
-                Score4.append(40)
-                return int(np.mean(Score4)) 
+            data = self.github.search(idea)
+            if data["status_code"] != 200:
+                raise SignalUnavailable(40, f"GitHub search returned {data['status_code']}")
             
-            data = response.json()
             total_repos = data.get("total_count", 0)
             repos = data.get("items", [])
 
@@ -472,34 +529,36 @@ class TechnicalRisk:
             total_score = base_score + stars_score + activity_score
             Score4.append(int(total_score))
 
-        except Exception:
-            Score4.append(20)
+        except SignalUnavailable:
+            raise
+        except FixtureMissing as e:
+            # No recorded response is a missing signal, not a failed search: neutral like the other sources
+            raise SignalUnavailable(40, str(e))
+        except Exception as e:
+            raise SignalUnavailable(20, f"GitHub search failed: {e}")
 
         return int(np.mean(Score4)) if Score4 else 40
 
 # Competition Class
 class Competition:
-    def __init__(self, GITHUB_TOKEN, reddit):
+    def __init__(self, GITHUB_TOKEN, reddit, github_client=None, reddit_collector=None):
         self.GITHUB_TOKEN = GITHUB_TOKEN
         self.reddit = reddit
+        self.github = github_client or GitHubSearchClient(GITHUB_TOKEN)
         self.categories = [
             "Business", "Health", "Sports", "Technology",
             "Finance", "Education", "Internet"
         ]
+        self.reddit_signals = reddit_collector or RedditSignalCollector(reddit, self.categories)
 
     def github_score_competition(self, idea):
         """Get competition score from GitHub"""
-        url = f"https://api.github.com/search/repositories?q={idea}+in:name,description"
-        headers = {"Authorization": f"token {self.GITHUB_TOKEN}"}
-
         Score5 = []
         try:
-            response = requests.get(url, headers=headers)
-            if response.status_code != 200:
-                Score5.append(40)
-                return int(np.mean(Score5))
+            data = self.github.search(idea)
+            if data["status_code"] != 200:
+                raise SignalUnavailable(40, f"GitHub search returned {data['status_code']}")
 
-            data = response.json()
             total_repos = data.get("total_count", 0)
             repos = data.get("items", [])[:100]
 
@@ -523,22 +582,22 @@ class Competition:
             else:
                 Score5.append(100)
         
-        except Exception:
-            Score5.append(40)
+        except SignalUnavailable:
+            raise
+        except Exception as e:
+            raise SignalUnavailable(40, f"GitHub search failed: {e}")
 
         return int(np.mean(Score5)) if Score5 else 40
 
     def fetch_reddit_posts_competition(self, idea, limit=50):
         """Get competition score from Reddit"""
         Score6 = []
+        try:
+            stats = self.reddit_signals.collect(idea)
+        except Exception as e:
+            raise SignalUnavailable(40, f"Reddit search failed: {e}")
         for category in self.categories:
-            total_posts = 0
-            try:
-                subreddit = self.reddit.subreddit(category.lower())
-                for submission in subreddit.search(idea, limit=limit):
-                    total_posts += 1
-            except Exception:
-                pass
+            total_posts = stats.get(category.lower(), {}).get("posts", 0)
 
             # Fewer posts = low competition
             if total_posts == 0:
@@ -552,63 +611,384 @@ class Competition:
 
         return int(np.mean(Score6)) if Score6 else 40
 
+# Per-request scoring memo
+class ScoringSession:
+    """
+    Memoizes everything derived while scoring one idea in one request: keywords,
+    the simplified idea, every raw source signal and every component score.
+    analyze_idea, calculate_validation_score and FinalScore share one session so
+    each external API is hit at most once per idea. An optional Deadline bounds
+    every source call made for the session, and the tier ("full", "standard",
+    "economy") caps how many rate-limited sources the planner may spend on it.
+    """
+    def __init__(self, idea, deadline=None, tier=None):
+        self.idea = idea
+        self.deadline = deadline
+        self.tier = tier
+        self.lock = threading.RLock()
+        self._values = {}
+
+    def has(self, key):
+        with self.lock:
+            return key in self._values
+
+    def get(self, key, default=None):
+        with self.lock:
+            return self._values.get(key, default)
+
+    def set(self, key, value):
+        with self.lock:
+            self._values.setdefault(key, value)
+            return self._values[key]
+
+    def memo(self, key, compute):
+        """Return the memoized value for key, computing it at most once"""
+        with self.lock:
+            if key not in self._values:
+                self._values[key] = compute()
+            return self._values[key]
+
+def build_signal_registry(market, technical, competition):
+    """
+    Every external signal FinalScore can use. Each source declares its component,
+    its weight within that component, expected latency (s), rate-limit cost and
+    timeout; components are combined with the weights given to the registry.
+    Register another SignalSource here to add a source.
+    """
+    return SourceRegistry({"market": 0.4, "technical": 0.3, "competition": 0.3}, [
+        SignalSource("pytrends", "market", 0.2, market.get_pytrends_score,
+                     expected_latency=8, cost=2, timeout=25, takes_timeout=True),
+        # Both Reddit sources read one cached multi-subreddit search with the keyword query
+        SignalSource("reddit", "market", 0.4, market.fetch_reddit_posts,
+                     expected_latency=4, cost=1, timeout=15, cost_key="reddit_search"),
+        SignalSource("newsapi", "market", 0.4, lambda query: market.get_newsapi_score(query, market.news_api_key),
+                     expected_latency=1.5, cost=1, timeout=10, prefetch=market.news.prefetch),
+        # Both GitHub sources read one cached repository search with the simplified idea
+        SignalSource("github_technical", "technical", 1.0, technical.github_score, query="simplified",
+                     expected_latency=1.5, cost=1, timeout=10, cost_key="github_search",
+                     prefetch=technical.github.prefetch),
+        SignalSource("github_competition", "competition", 0.6, competition.github_score_competition,
+                     query="simplified", expected_latency=1.5, cost=1, timeout=10, cost_key="github_search",
+                     prefetch=competition.github.prefetch),
+        SignalSource("reddit_competition", "competition", 0.4, competition.fetch_reddit_posts_competition,
+                     expected_latency=4, cost=1, timeout=15, cost_key="reddit_search"),
+    ])
+
 # Final Score Class   
 class FinalScore:
-    def __init__(self, marketpotential, technicalrisk, competition):
-        self.market = marketpotential
-        self.technical = technicalrisk
-        self.competition = competition
+    def __init__(self, registry, fanout=None, signal_cache=None, recent_ideas=None, planner=None):
+        self.registry = registry
+        self.planner = planner or SourcePlanner(registry)
+        self.fanout = fanout or SignalFanout()
+        self.signal_cache = signal_cache
+        self.recent_ideas = recent_ideas
+        self.scorer = BatchScorer(registry.component_source_weights(), registry.component_weights)
+        # Coalesces concurrent fetches of the same (source, query), e.g. ideas in one batch sharing keywords
+        self._inflight = TTLSingleFlightCache(ttl=0, should_cache=lambda value: False)
+
+    def planned_sources(self, session):
+        """
+        Sources chosen for this session from its full latency budget and tier
+        (planned once, at the start of scoring); sources with a fresh cached
+        signal are always kept
+        """
+        def cached(name):
+            if self.signal_cache is None:
+                return False
+            return self.signal_cache.is_fresh(name, self.source_query(self.registry.get(name), session.idea, session))
+
+        def _plan():
+            # The full budget, not what is left of it: a source expected to take exactly the
+            # default budget (pytrends on quick-validate) must not be dropped by a few ms of setup
+            budget = session.deadline.budget if session.deadline is not None else None
+            return self.planner.plan(budget, session.tier, cached)
+        return session.memo('plan', _plan).sources
+
+    def skipped_sources(self, session):
+        """{source: reason} for the sources the planner left out of this session"""
+        return dict(session.get('plan').skipped) if session.has('plan') else {}
+
+    def _last_known(self, name, query):
+        """Most recent cached value for a source, however old (None if never fetched)"""
+        if self.signal_cache is None:
+            return None
+        cached = self.signal_cache.lookup(name, query)
+        return cached[0] if cached else None
 
-    def calculate_final_score_market(self, idea):
-        """Calculate market potential score"""
-        simplified_idea = simplify_idea(idea)
-        keywords = extract_keywords(idea)
-        
-        score1 = self.market.get_pytrends_score(" ".join(keywords))
-        score2 = self.market.fetch_reddit_posts(" ".join(keywords))
-        score3 = self.market.get_newsapi_score(" ".join(keywords), self.market.news_api_key)
+    def _fetch_live(self, source, query, timeout=None):
+        """Call the source directly, recording its latency"""
+        started = time.time()
+        try:
+            if source.takes_timeout and timeout is not None:
+                value = source.fetch(query, timeout=timeout)
+            else:
+                value = source.fetch(query)
+        except Exception:
+            source.record(time.time() - started, ok=False)
+            raise
+        source.record(time.time() - started)
+        return value
+
+    def _cached_source(self, source, query, timeout=None):
+        """
+        Run a source through the persistent signal cache, recording the latency of live fetches.
+        A SignalUnavailable from the source propagates uncached, so the fan-out falls back.
+        timeout (the call's share of the request deadline) reaches sources that take one.
+        """
+        def fetch():
+            if self.signal_cache is None:
+                return self._fetch_live(source, query, timeout)
+            return self.signal_cache.get_or_fetch(source.name, query, lambda: self._fetch_live(source, query, timeout),
+                                                  refresh=lambda: self._fetch_live(source, query))
+        key = source.name + ":" + " ".join(str(query).lower().split())
+        return self._inflight.get_or_load(key, fetch)
+
+    def prefetch(self, ideas, sources=None, deadline=None):
+        """
+        Warm the caches of sources with a batch prefetch hook (one call per
+        shared cost_key) for the ideas whose cached signals are not fresh,
+        stopping when the optional deadline expires.
+        """
+        prefetched = set()
+        for name in sources or self.registry.names(enabled_only=True):
+            source = self.registry.get(name)
+            if source.prefetch is None or source.cost_key in prefetched:
+                continue
+            prefetched.add(source.cost_key)
+            sharing = [s for s in self.registry.names() if self.registry.get(s).cost_key == source.cost_key]
+            queries = []
+            for idea in ideas:
+                query = self.source_query(source, idea)
+                if self.signal_cache is None or not all(self.signal_cache.is_fresh(s, query) for s in sharing):
+                    queries.append(query)
+            if deadline is not None and deadline.expired():
+                break
+            if queries:
+                source.prefetch(queries, deadline=deadline)
+
+    def source_query(self, source, idea, session=None):
+        """The query a source is called with for idea: its keywords or its simplified form"""
+        session = session or ScoringSession(idea)
+        if source.query == "simplified":
+            return session.memo('simplified_idea', lambda: simplify_idea(idea))
+        return " ".join(session.memo('keywords', lambda: extract_keywords(idea)))
+
+    def stale_sources(self, idea, refresh_ahead=0.8):
+        """
+        (source, query) for every enabled source whose cached signal for idea is
+        missing or past refresh_ahead of its TTL (for the background cache warmer)
+        """
+        if self.signal_cache is None:
+            return []
+        session = ScoringSession(idea)
+        stale = []
+        for name in self.registry.names(enabled_only=True):
+            source = self.registry.get(name)
+            query = self.source_query(source, idea, session)
+            cached = self.signal_cache.lookup(name, query)
+            if cached is None or cached[1] >= self.signal_cache.ttl_for(name) * refresh_ahead:
+                stale.append((source, query))
+        return stale
+
+    def refresh_source(self, source, query):
+        """Fetch a source live and store the result in the signal cache"""
+        value = self._fetch_live(source, query)
+        if self.signal_cache is not None:
+            self.signal_cache.store(source.name, query, value)
+        return value
+
+    def source_calls(self, idea, sources=None, session=None):
+        """Build the SignalCalls for the requested sources (the planned ones by default)"""
+        session = session or ScoringSession(idea)
+        sources = [self.registry.get(name) for name in (sources or self.planned_sources(session))]
+
+        calls = {}
+        for source in sources:
+            timeout = source.timeout
+            if session.deadline is not None:
+                timeout = session.deadline.clamp(timeout)
+            query = self.source_query(source, idea, session)
+            calls[source.name] = SignalCall(self._cached_source, (source, query, timeout), timeout=timeout,
+                                            fallback=lambda name=source.name, query=query: self._last_known(name, query))
+        return calls
+
+    def _reuse_similar(self, idea, session):
+        """Seed the session with the signals of a recently scored near-duplicate idea, if any"""
+        if self.recent_ideas is None or session.has('reuse_checked'):
+            return
+        session.set('reuse_checked', True)
+        match = self.recent_ideas.nearest(embedding_space.context(idea).vector)
+        if match is None:
+            return
+        for name, value in match["signals"].items():
+            session.set(('signal', name), value)
+        session.set('reused_from', {"idea": match["idea"], "similarity": round(match["similarity"], 4)})
+
+    def _remember_signals(self, idea, session):
+        """
+        Index a fully and freshly scored idea so its paraphrases can reuse its signals.
+        Only signals whose fetch succeeded count: a timeout, an exception or a
+        scorer's SignalUnavailable fallback keeps the idea out of the index.
+        """
+        if self.recent_ideas is None or session.has('reused_from') or session.has('remembered'):
+            return
+        names = self.registry.names(enabled_only=True)
+        if all(session.has(('signal', n)) and session.has(('fetched', n)) for n in names):
+            session.set('remembered', True)
+            self.recent_ideas.add(idea, embedding_space.context(idea).vector,
+                                  {n: session.get(('signal', n)) for n in names})
+
+    def reuse_info(self, session):
+        """{"idea", "similarity"} of the idea whose signals were reused, or None"""
+        return session.get('reused_from')
+
+    def collect_signals(self, idea, sources=None, session=None):
+        """
+        Fetch the raw per-source scores concurrently, reusing any already in the
+        session. Only planned sources are fetched; the rest are left out of the result.
+        """
+        session = session or ScoringSession(idea)
+        planned = self.planned_sources(session)
+        sources = [name for name in (sources or planned) if name in planned]
+        # Serialize per session so concurrent callers never fetch the same source twice
+        with session.lock:
+            self._reuse_similar(idea, session)
+            missing = [name for name in sources if not session.has(('signal', name))]
+            if missing:
+                fetched, degraded = self.fanout.gather_with_status(self.source_calls(idea, missing, session))
+                for name, value in fetched.items():
+                    session.set(('signal', name), value)
+                    session.set(('degraded', name) if name in degraded else ('fetched', name), True)
+                self._remember_signals(idea, session)
+            return {name: session.get(('signal', name)) for name in sources}
+
+    def iter_signals(self, idea, session=None):
+        """
+        Yield (name, score) for every source as soon as it is available: values
+        already in the session first, then fetched ones in completion order.
+        The session lock is not held across yields, so use a session private to the caller.
+        """
+        session = session or ScoringSession(idea)
+        self._reuse_similar(idea, session)
+        missing = []
+        for name in self.planned_sources(session):
+            if session.has(('signal', name)):
+                yield name, session.get(('signal', name))
+            else:
+                missing.append(name)
+        if not missing:
+            return
+        for name, value, ok in self.fanout.iter_completed(self.source_calls(idea, missing, session)):
+            session.set(('signal', name), value)
+            session.set(('fetched', name) if ok else ('degraded', name), True)
+            yield name, session.get(('signal', name))
+        self._remember_signals(idea, session)
+
+    def component_from_signals(self, signals, component):
+        """Component score from the sources that were fetched, their weights renormalized over them"""
+        row = self.scorer.signal_matrix([signals])
+        return int(self.scorer.partial_component_scores(row)[0, self.scorer.components.index(component)])
+
+    def component_score(self, idea, component, session=None):
+        session = session or ScoringSession(idea)
+        return session.memo(('component', component), lambda: self.component_from_signals(
+            self.collect_signals(idea, self.registry.names(component), session), component))
+
+    def estimate_from_signals(self, signals):
+        """
+        Provisional final score from a partial set of source scores, with the
+        interval it can still move in: (estimate, low, high). See BatchScorer.estimate.
+        Once every source is known all three equal combine_scores.
+        """
+        estimate, low, high = self.scorer.estimate(self.scorer.signal_matrix([signals]))
+        return int(estimate[0]), int(low[0]), int(high[0])
 
-        score1 = self.market.normalize_score(score1)
-        score2 = self.market.normalize_score(score2)
-        score3 = self.market.normalize_score(score3)
+    def combine_components(self, components):
+        """Final score from {"market", "technical", "competition"} component scores"""
+        return int(self.scorer.combine(np.array([[components[c] for c in self.scorer.components]]))[0])
 
-        weights = [0.2, 0.4, 0.4]
-        return int(np.dot([score1, score2, score3], weights))
+    def calculate_final_score_market(self, idea, session=None):
+        """Calculate market potential score"""
+        return self.component_score(idea, "market", session)
 
-    def calculate_final_score_technical(self, idea):
+    def calculate_final_score_technical(self, idea, session=None):
         """Calculate technical feasibility score"""
-        simplified_idea = simplify_idea(idea)
-        score4 = self.technical.github_score(simplified_idea)
-        score4 = self.market.normalize_score(score4)
-        return score4
+        return self.component_score(idea, "technical", session)
     
-    def calculate_final_score_competition(self, idea):
+    def calculate_final_score_competition(self, idea, session=None):
         """Calculate competition score"""
-        simplified_idea = simplify_idea(idea)
-        keywords = extract_keywords(idea)
-        
-        score5 = self.competition.github_score_competition(" ".join([simplified_idea] + keywords))
-        score6 = self.competition.fetch_reddit_posts_competition(" ".join([simplified_idea] + keywords))
+        return self.component_score(idea, "competition", session)
+
+    def combine_scores(self, idea, session=None):
+        """Combine all scores into final validation score (all sources fetched concurrently)"""
+        session = session or ScoringSession(idea)
 
-        score5 = self.market.normalize_score(score5)
-        score6 = self.market.normalize_score(score6)
+        def _combine():
+            # One fan-out for every source, then each component reads from the session
+            self.collect_signals(idea, session=session)
+            market_score = self.calculate_final_score_market(idea, session)
+            technical_score = self.calculate_final_score_technical(idea, session)
+            competition_score = self.calculate_final_score_competition(idea, session)
+            return int(self.scorer.combine(np.array([[market_score, technical_score, competition_score]]))[0])
 
-        weights = [0.6, 0.4]
-        return int(np.dot([score5, score6], weights))
+        return session.memo(('component', 'final'), _combine)
 
-    def combine_scores(self, idea):
-        """Combine all scores into final validation score"""
-        market_score = self.calculate_final_score_market(idea)
-        technical_score = self.calculate_final_score_technical(idea)
-        competition_score = self.calculate_final_score_competition(idea)
-        final_score = int(np.dot([market_score, technical_score, competition_score], [0.4, 0.3, 0.3]))
-        return final_score
+    def degraded_components(self, session):
+        """Components with at least one source that missed its deadline or failed and used a fallback"""
+        return [component for component in self.registry.component_weights
+                if any(session.has(('degraded', name)) for name in self.registry.names(component))]
 
 # Initialize the validation system
-market_obj = MarketPotential(pytrends, reddit, news_api_key)
-technical_obj = TechnicalRisk(github_token)
-competition_obj = Competition(github_token, reddit)
-final_score_calculator = FinalScore(market_obj, technical_obj, competition_obj)
+reddit_collector = RedditSignalCollector(reddit, ["Business", "Health", "Sports", "Technology", "Finance", "Education", "Internet"])
+# Weekly series are stored so re-scoring a keyword only requests the weeks since its last fetch
+trends_scheduler = TrendsScheduler(pytrends, series_store=TrendSeriesStore(DB_PATH) if not fixture_store.active else None)
+market_obj = MarketPotential(pytrends, reddit, news_api_key, reddit_collector, trends_scheduler)
+github_client = GitHubSearchClient(github_token)
+technical_obj = TechnicalRisk(github_token, github_client)
+competition_obj = Competition(github_token, reddit, github_client, reddit_collector)
+# Fixture record/replay must see every source call, so the persistent cache is bypassed then
+signal_cache = SignalCache(DB_PATH) if not fixture_store.active else None
+# Identical LLM prompts (same provider, model, messages and settings) are answered from cache
+if LLM_CACHE_ENABLED:
+    llm_client.cache = LLMResponseCache(DB_PATH)
+    llm_client.cache.start_purging()
+# Casual chat and idea explanations go to whichever of these is currently fastest
+llm_router = LLMRouter(llm_client, [
+    ('groq', 'llama-3.3-70b-versatile'),
+    ('gemini', 'gemini-1.5-flash-latest'),
+    ('perplexity', 'llama-3.1-sonar-small-128k-chat'),
+])
+signal_registry = build_signal_registry(market_obj, technical_obj, competition_obj)
+final_score_calculator = FinalScore(signal_registry, signal_cache=signal_cache, recent_ideas=RecentIdeaIndex())
+
+def recent_idea_rows(limit):
+    rows = db_query("SELECT id, idea_text FROM ideas WHERE idea_text IS NOT NULL AND idea_text != '' "
+                    "ORDER BY id DESC LIMIT ?", (limit,))
+    return [(row['id'], row['idea_text']) for row in rows]
+
+# Keeps the signal cache hot for the most frequent recent themes while the server is idle
+cache_warmer = HotKeywordWarmer(final_score_calculator, recent_idea_rows,
+                                lambda idea: " ".join(sorted(extract_keywords(idea))))
+if WARMER_ENABLED and signal_cache is not None:
+    cache_warmer.start()
+
+@app.before_request
+def note_user_activity():
+    if request.path.startswith('/api/'):
+        cache_warmer.touch()
+
+def request_deadline(endpoint):
+    """Scoring deadline for this request: the X-Latency-Budget-Ms header, else the endpoint default"""
+    return deadline_for(endpoint, request.headers.get(LATENCY_BUDGET_HEADER))
+
+def request_tier():
+    """Scoring tier for this request: the X-Scoring-Tier header or ?tier=, else the default tier"""
+    tier = (request.headers.get(SCORING_TIER_HEADER) or request.args.get('tier') or '').strip().lower()
+    return tier if tier in TIER_COST_LIMITS else DEFAULT_TIER
+
+def new_scoring_session(idea_text, endpoint):
+    """ScoringSession carrying this request's latency budget and tier"""
+    return ScoringSession(idea_text, deadline=request_deadline(endpoint), tier=request_tier())
 
 def get_user_idea_from_request():
     """Get the user's idea from the request data (from resurrect/mutate/build pages)"""
@@ -655,7 +1035,7 @@ def get_user_idea_from_request():
         print(f"Error getting user idea: {e}")
         return None
 
-def analyze_market_trends(idea_text=None):
+def analyze_market_trends(idea_text=None, session=None):
     """Analyze market trends using the new system"""
     try:
         # If no idea provided, try to get from request
@@ -665,7 +1045,7 @@ def analyze_market_trends(idea_text=None):
         if not idea_text:
             return {"error": "No idea provided for market analysis"}
             
-        market_score = final_score_calculator.calculate_final_score_market(idea_text)
+        market_score = final_score_calculator.calculate_final_score_market(idea_text, session)
         return {
             "market_score": market_score,
             "analysis_method": "pytrends_reddit_newsapi",
@@ -675,7 +1055,7 @@ def analyze_market_trends(idea_text=None):
     except Exception as e:
         return {"error": f"Market analysis error: {str(e)}"}
 
-def analyze_tech_trends(idea_text=None):
+def analyze_tech_trends(idea_text=None, session=None):
     """Analyze tech trends using the new system"""
     try:
         # If no idea provided, try to get from request
@@ -685,7 +1065,7 @@ def analyze_tech_trends(idea_text=None):
         if not idea_text:
             return {"error": "No idea provided for tech analysis"}
             
-        tech_score = final_score_calculator.calculate_final_score_technical(idea_text)
+        tech_score = final_score_calculator.calculate_final_score_technical(idea_text, session)
         return {
             "tech_score": tech_score,
             "analysis_method": "github_repository_analysis",
@@ -695,7 +1075,7 @@ def analyze_tech_trends(idea_text=None):
     except Exception as e:
         return {"error": f"Tech analysis error: {str(e)}"}
 
-def analyze_competition(idea_text=None):
+def analyze_competition(idea_text=None, session=None):
     """Analyze competition using the new system"""
     try:
         # If no idea provided, try to get from request
@@ -705,7 +1085,7 @@ def analyze_competition(idea_text=None):
         if not idea_text:
             return {"error": "No idea provided for competition analysis"}
             
-        competition_score = final_score_calculator.calculate_final_score_competition(idea_text)
+        competition_score = final_score_calculator.calculate_final_score_competition(idea_text, session)
         return {
             "competition_score": competition_score,
             "analysis_method": "github_reddit_competition_analysis",
@@ -715,7 +1095,7 @@ def analyze_competition(idea_text=None):
     except Exception as e:
         return {"error": f"Competition analysis error: {str(e)}"}
 
-def calculate_validation_score(idea_text=None, market_analysis=None, tech_analysis=None, competition_analysis=None):
+def calculate_validation_score(idea_text=None, market_analysis=None, tech_analysis=None, competition_analysis=None, session=None):
     """Calculate validation score using the new comprehensive system"""
     try:
         # If no idea provided, try to get from request
@@ -724,22 +1104,26 @@ def calculate_validation_score(idea_text=None, market_analysis=None, tech_analys
         
         if not idea_text:
             return {"error": "No idea provided for validation scoring"}
+
+        # Share one session so every source and component is computed once for this idea
+        session = session or ScoringSession(idea_text)
+        final_score_calculator.collect_signals(idea_text, session=session)
         
         # If no analyses provided, generate them
         if not market_analysis:
-            market_analysis = analyze_market_trends(idea_text)
+            market_analysis = analyze_market_trends(idea_text, session)
         if not tech_analysis:
-            tech_analysis = analyze_tech_trends(idea_text)
+            tech_analysis = analyze_tech_trends(idea_text, session)
         if not competition_analysis:
-            competition_analysis = analyze_competition(idea_text)
+            competition_analysis = analyze_competition(idea_text, session)
         
         # Get the comprehensive score from the new system
-        final_score = final_score_calculator.combine_scores(idea_text)
+        final_score = final_score_calculator.combine_scores(idea_text, session)
         
-        # Extract individual scores for detailed breakdown
-        market_score = final_score_calculator.calculate_final_score_market(idea_text)
-        tech_score = final_score_calculator.calculate_final_score_technical(idea_text)
-        competition_score = final_score_calculator.calculate_final_score_competition(idea_text)
+        # Extract individual scores for detailed breakdown (memoized in the session)
+        market_score = final_score_calculator.calculate_final_score_market(idea_text, session)
+        tech_score = final_score_calculator.calculate_final_score_technical(idea_text, session)
+        competition_score = final_score_calculator.calculate_final_score_competition(idea_text, session)
         
         # Debug: Log the scores
         print(f"DEBUG - Idea: {idea_text[:50]}...")
@@ -749,11 +1133,15 @@ def calculate_validation_score(idea_text=None, market_analysis=None, tech_analys
         print(f"DEBUG - Competition Score: {competition_score}")
         
         # Determine confidence level
-        confidence_level = "High" if final_score > 75 else "Medium" if final_score > 55 else "Low"
+        confidence_level = confidence_label(final_score)
         
         return {
             "validation_score": final_score,
             "confidence_level": confidence_level,
+            "degraded_components": final_score_calculator.degraded_components(session),
+            "skipped_sources": final_score_calculator.skipped_sources(session),
+            "reused_signals_from": final_score_calculator.reuse_info(session),
+            "latency_budget_ms": session.deadline.budget_ms if session.deadline else None,
             "factors_analyzed": [
                 "market_trends", "technical_feasibility", "competition_analysis",
                 "reddit_engagement", "github_activity", "news_coverage"
@@ -948,7 +1336,7 @@ LIFE_GUIDANCE_RESPONSES = {
     ]
 }
 
-def analyze_idea(idea_text=None):
+def analyze_idea(idea_text=None, deadline=None, tier=None):
     """Analyze an idea using live datasets and AI APIs - automatically gets user input from frontend"""
     try:
         # If no idea provided, try to get from request (from resurrect/mutate/build pages)
@@ -958,14 +1346,18 @@ def analyze_idea(idea_text=None):
         if not idea_text:
             return {"error": "No idea provided for analysis"}
         
+        # One scoring session for the whole analysis: every source is fetched once, concurrently
+        session = ScoringSession(idea_text, deadline=deadline, tier=tier)
+        final_score_calculator.collect_signals(idea_text, session=session)
+
         # Perform market analysis using financial data
-        market_analysis = analyze_market_trends(idea_text)
+        market_analysis = analyze_market_trends(idea_text, session)
         
         # Perform tech trend analysis
-        tech_analysis = analyze_tech_trends(idea_text)
+        tech_analysis = analyze_tech_trends(idea_text, session)
         
         # Calculate validation score
-        validation_score_data = calculate_validation_score(idea_text, market_analysis, tech_analysis)
+        validation_score_data = calculate_validation_score(idea_text, market_analysis, tech_analysis, session=session)
         
         # Generate business plan
         business_plan = generate_business_plan(idea_text, validation_score_data.get('validation_score', 50), market_analysis)
@@ -973,17 +1365,8 @@ def analyze_idea(idea_text=None):
         # Enhanced AI analysis using Gemini
         ai_analysis = get_enhanced_ai_analysis(idea_text, market_analysis, tech_analysis)
         
-        # Categorize the idea
-        idea_lower = idea_text.lower()
-        category = "general"
-        if any(word in idea_lower for word in ["app", "software", "website", "tech", "digital", "online"]):
-            category = "technology"
-        elif any(word in idea_lower for word in ["business", "startup", "company", "service", "product"]):
-            category = "business"
-        elif any(word in idea_lower for word in ["art", "creative", "design", "music", "writing", "content"]):
-            category = "creative"
-        elif any(word in idea_lower for word in ["social", "community", "help", "charity", "volunteer"]):
-            category = "social"
+        # Categorize the idea against the precomputed category prototypes
+        category = embedding_space.context(idea_text).category()
         
         return {
             "original_idea": idea_text,
@@ -1013,13 +1396,9 @@ def analyze_idea(idea_text=None):
 def get_perplexity_market_insights(idea_text):
     """Get real-time market insights using Perplexity API"""
     try:
-        response = requests.post(
-            'https://api.perplexity.ai/chat/completions',
-            headers={
-                'Authorization': f'Bearer {PERPLEXITY_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        return llm_client.chat(
+            'perplexity',
+            payload={
                 'model': 'llama-3.1-sonar-small-128k-online',
                 'messages': [
                     {
@@ -1036,12 +1415,6 @@ def get_perplexity_market_insights(idea_text):
             },
             timeout=15
         )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            return "Market insights unavailable"
             
     except Exception as e:
         print(f"Perplexity API error: {e}")
@@ -1065,35 +1438,27 @@ Provide a detailed analysis including:
 
 Format your response as a structured analysis with clear sections."""
         
-        perplexity_response = requests.post(
-            'https://api.perplexity.ai/chat/completions',
-            headers={
-                'Authorization': f'Bearer {PERPLEXITY_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
-                'model': 'llama-3.1-sonar-large-128k-online',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': 'You are an expert business analyst specializing in startup validation and market research. Provide comprehensive, data-driven analysis.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': perplexity_prompt
-                    }
-                ],
-                'temperature': 0.7,
-                'max_tokens': 1500
-            },
-            timeout=20
-        )
-        
-        market_analysis = ""
-        if perplexity_response.ok:
-            market_data = perplexity_response.json()
-            market_analysis = market_data['choices'][0]['message']['content']
-        else:
+        try:
+            market_analysis = llm_client.chat(
+                'perplexity',
+                payload={
+                    'model': 'llama-3.1-sonar-large-128k-online',
+                    'messages': [
+                        {
+                            'role': 'system',
+                            'content': 'You are an expert business analyst specializing in startup validation and market research. Provide comprehensive, data-driven analysis.'
+                        },
+                        {
+                            'role': 'user',
+                            'content': perplexity_prompt
+                        }
+                    ],
+                    'temperature': 0.7,
+                    'max_tokens': 1500
+                },
+                timeout=20
+            )
+        except LLMError:
             market_analysis = "Market analysis unavailable. Please try again."
         
         # Use Deepseek for technical and strategic analysis
@@ -1110,35 +1475,27 @@ Analyze:
 
 Provide actionable insights in clear, structured format."""
         
-        deepseek_response = requests.post(
-            'https://api.deepseek.com/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {DEEPSEEK_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
-                'model': 'deepseek-chat',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': 'You are a technical business strategist. Provide detailed technical and strategic analysis for business ideas.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': deepseek_prompt
-                    }
-                ],
-                'temperature': 0.7,
-                'max_tokens': 1500
-            },
-            timeout=20
-        )
-        
-        technical_analysis = ""
-        if deepseek_response.ok:
-            tech_data = deepseek_response.json()
-            technical_analysis = tech_data['choices'][0]['message']['content']
-        else:
+        try:
+            technical_analysis = llm_client.chat(
+                'deepseek',
+                payload={
+                    'model': 'deepseek-chat',
+                    'messages': [
+                        {
+                            'role': 'system',
+                            'content': 'You are a technical business strategist. Provide detailed technical and strategic analysis for business ideas.'
+                        },
+                        {
+                            'role': 'user',
+                            'content': deepseek_prompt
+                        }
+                    ],
+                    'temperature': 0.7,
+                    'max_tokens': 1500
+                },
+                timeout=20
+            )
+        except LLMError:
             technical_analysis = "Technical analysis unavailable. Please try again."
         
         # Combine analyses
@@ -1210,13 +1567,9 @@ Provide a structured analysis in JSON format with:
 
 Keep each point concise and actionable. Focus on practical business insights."""
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        ai_text = llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -1235,18 +1588,12 @@ Keep each point concise and actionable. Focus on practical business insights."""
             timeout=10
         )
         
-        if response.ok:
-            data = response.json()
-            ai_text = data['choices'][0]['message']['content']
-            
-            # Try to parse JSON response
-            try:
-                return json.loads(ai_text)
-            except:
-                # Fallback: parse the text response
-                return parse_ai_response(ai_text)
-        else:
-            raise Exception(f"Groq API error: {response.status_code}")
+        # Try to parse JSON response
+        try:
+            return json.loads(ai_text)
+        except:
+            # Fallback: parse the text response
+            return parse_ai_response(ai_text)
             
     except Exception as e:
         print(f"AI Analysis Error: {e}")
@@ -1376,34 +1723,23 @@ Guidelines:
 
 Response:"""
 
-            response = requests.post(
-                f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY}',
-                headers={'Content-Type': 'application/json'},
-                json={
+            return llm_client.generate(
+                'gemini-1.5-flash-latest',
+                payload={
                     'contents': [{
                         'role': 'user',
                         'parts': [{'text': prompt}]
                     }]
                 },
-                timeout=10
+                timeout=10,
+                version='v1'
             )
-            
-            if response.ok:
-                data = response.json()
-                return data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', 'I apologize, but I couldn\'t generate a response at this time.')
-            else:
-                print(f"Gemini API error: {response.status_code} - {response.text}")
-                raise Exception(f"Gemini API error: {response.status_code}")
         
         else:
             # Use Perplexity for factual questions and current information
-            response = requests.post(
-                'https://api.perplexity.ai/chat/completions',
-                headers={
-                    'Content-Type': 'application/json',
-                    'Authorization': f'Bearer {PERPLEXITY_API_KEY}'
-                },
-                json={
+            return llm_client.chat(
+                'perplexity',
+                payload={
                     'model': 'llama-3.1-sonar-small-128k-chat',
                     'messages': [
                         {
@@ -1420,12 +1756,6 @@ Response:"""
                 },
                 timeout=10
             )
-            
-            if response.ok:
-                data = response.json()
-                return data.get('choices', [{}])[0].get('message', {}).get('content', 'I apologize, but I couldn\'t generate a response at this time.')
-            else:
-                raise Exception(f"Perplexity API error: {response.status_code}")
                 
     except Exception as e:
         print(f"AI API Error: {e}")
@@ -1434,12 +1764,6 @@ Response:"""
 def get_gemini_response(prompt):
     """Get response from Gemini API"""
     try:
-        url = f"https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY}"
-        
-        headers = {
-            'Content-Type': 'application/json',
-        }
-        
         data = {
             "contents": [{
                 "parts": [{
@@ -1448,19 +1772,14 @@ def get_gemini_response(prompt):
             }]
         }
         
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if 'candidates' in result and len(result['candidates']) > 0:
-                content = result['candidates'][0]['content']['parts'][0]['text']
-                return content.strip()
-            else:
-                return "I'm sorry, I couldn't generate a response right now. Please try again."
-        else:
-            print(f"Gemini API error: {response.status_code} - {response.text}")
-            return "I'm experiencing some technical difficulties. Please try again later."
+        content = llm_client.generate('gemini-1.5-flash-latest', payload=data, timeout=30, version='v1')
+        return content.strip()
             
+    except LLMError as e:
+        if e.status_code == 200:
+            return "I'm sorry, I couldn't generate a response right now. Please try again."
+        print(f"Gemini API error: {e.status_code} - {e.body}")
+        return "I'm experiencing some technical difficulties. Please try again later."
     except requests.exceptions.Timeout:
         return "The request timed out. Please try again with a shorter query."
     except requests.exceptions.RequestException as e:
@@ -1731,7 +2050,7 @@ def analyze_idea_endpoint():
             if api_call_id:
                 db_exec("UPDATE api_calls SET status_code=?, success=?, latency_ms=? WHERE id=?",
                         (200, 1, int((time.time()-start_ts)*1000), api_call_id))
-            return Response(stream_idea_analysis(idea_text),
+            return Response(stream_idea_analysis(idea_text, request_deadline('/api/analyze-idea'), request_tier()),
                             mimetype='text/plain',
                             headers=headers)
 
@@ -1739,7 +2058,7 @@ def analyze_idea_endpoint():
         # Run analysis (this may be heavy)
         # ----------------------------
         try:
-            analysis = analyze_idea(idea_text)
+            analysis = analyze_idea(idea_text, deadline=request_deadline('/api/analyze-idea'), tier=request_tier())
         except Exception as e:
             # If your analysis can be long, consider dispatching to background worker (RQ/Celery)
             print("analysis failed:", e)
@@ -1879,8 +2198,19 @@ def validate_idea_endpoint():
         if not idea_text:
             return jsonify({'error': 'Please provide an idea to validate. You can send it as JSON, form data, or query parameter.'}), 400
         
-        # Calculate validation score
-        validation_result = calculate_validation_score(idea_text)
+        # Calculate validation score within the request's latency budget
+        session = new_scoring_session(idea_text, '/api/validate-idea')
+
+        # Progressive mode: Server-Sent Events refined as each source arrives
+        wants_stream = (str(request.args.get('stream', '')).lower() in ('1', 'true')
+                        or 'text/event-stream' in request.headers.get('Accept', '')
+                        or (request.is_json and bool((request.get_json(silent=True) or {}).get('stream'))))
+        if wants_stream:
+            return Response(stream_validation_events(idea_text, session),
+                            mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+        validation_result = calculate_validation_score(idea_text, session=session)
         
         return jsonify({
             'success': True,
@@ -1891,6 +2221,38 @@ def validate_idea_endpoint():
     except Exception as e:
         return jsonify({'error': f'Validation failed: {str(e)}'}), 500
 
+def sse_event(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+def stream_validation_events(idea_text, session):
+    """
+    Yield a 'provisional' event (score plus interval) each time a source
+    completes, then a 'final' event with the full calculate_validation_score result.
+    """
+    try:
+        signals = {}
+        sources = final_score_calculator.planned_sources(session)
+        for name, value in final_score_calculator.iter_signals(idea_text, session):
+            signals[name] = value
+            estimate, low, high = final_score_calculator.estimate_from_signals(signals)
+            yield sse_event('provisional', {
+                'validation_score': estimate,
+                'confidence_interval': [low, high],
+                'confidence': confidence_label(estimate),
+                'source': name,
+                'sources_completed': list(signals),
+                'sources_pending': [s for s in sources if s not in signals],
+                'degraded_components': final_score_calculator.degraded_components(session)
+            })
+        # Every signal is in the session now, so this only combines them
+        yield sse_event('final', {
+            'success': True,
+            'idea': idea_text,
+            'validation_result': calculate_validation_score(idea_text, session=session)
+        })
+    except Exception as e:
+        yield sse_event('error', {'error': f'Validation failed: {str(e)}'})
+
 @app.route('/api/quick-validate', methods=['POST', 'GET'])
 def quick_validate_endpoint():
     """Quick validation endpoint that returns just the score - for easy frontend integration"""
@@ -1917,20 +2279,125 @@ def quick_validate_endpoint():
         
         if not idea_text:
             return jsonify({'error': 'No idea provided'}), 400
+
+        # Fast mode: local TF-IDF estimate, no network calls (first-pass filter)
+        mode = request.args.get('mode') or ((request.get_json(silent=True) or {}).get('mode') if request.is_json else None)
+        if mode == 'fast':
+            components = get_fast_scorer().component_scores(idea_text)
+            final_score = final_score_calculator.combine_components(components)
+            return jsonify({
+                'success': True,
+                'idea': idea_text,
+                'mode': 'fast',
+                'validation_score': final_score,
+                'confidence': confidence_label(final_score),
+                'market_score': components['market'],
+                'tech_score': components['technical'],
+                'competition_score': components['competition']
+            })
         
-        # Get quick validation score
-        final_score = final_score_calculator.combine_scores(idea_text)
+        # Get quick validation score within the request's latency budget
+        session = new_scoring_session(idea_text, '/api/quick-validate')
+        final_score = final_score_calculator.combine_scores(idea_text, session)
         
         return jsonify({
             'success': True,
             'idea': idea_text,
             'validation_score': final_score,
-            'confidence': "High" if final_score > 75 else "Medium" if final_score > 55 else "Low"
+            'confidence': confidence_label(final_score),
+            'degraded_components': final_score_calculator.degraded_components(session),
+            'skipped_sources': final_score_calculator.skipped_sources(session),
+            'reused_signals_from': final_score_calculator.reuse_info(session)
         })
         
     except Exception as e:
         return jsonify({'error': f'Quick validation failed: {str(e)}'}), 500
 
+# Scores batch ideas in parallel; separate from the signal fan-out pool that each idea's scoring uses
+BATCH_VALIDATE_MAX_IDEAS = int(os.getenv("BATCH_VALIDATE_MAX_IDEAS", "100"))
+batch_executor = ThreadPoolExecutor(max_workers=int(os.getenv("BATCH_VALIDATE_WORKERS", "4")),
+                                    thread_name_prefix="batch")
+
+def normalize_idea_text(text):
+    return " ".join(str(text or "").lower().split())
+
+@app.route('/api/validate-batch', methods=['POST'])
+@monitor_api('/api/validate-batch')
+def validate_batch_endpoint():
+    """
+    Validate many ideas at once. Identical/normalized duplicates are scored once,
+    all ideas are embedded in one batch, and each result is streamed as an
+    NDJSON line as soon as it is ready.
+    """
+    data = request.get_json(silent=True) or {}
+    raw_ideas = data.get('ideas') or []
+    if not isinstance(raw_ideas, list) or not raw_ideas:
+        return jsonify({'error': 'Provide a non-empty "ideas" list'}), 400
+    if len(raw_ideas) > BATCH_VALIDATE_MAX_IDEAS:
+        return jsonify({'error': f'At most {BATCH_VALIDATE_MAX_IDEAS} ideas per batch'}), 400
+
+    ideas = []
+    for item in raw_ideas:
+        if isinstance(item, dict):
+            item = item.get('idea') or item.get('ideaText') or item.get('text') or ''
+        ideas.append(str(item).strip())
+
+    # normalized text -> indexes of every idea that shares it
+    groups = {}
+    for index, idea_text in enumerate(ideas):
+        if idea_text:
+            groups.setdefault(normalize_idea_text(idea_text), []).append(index)
+    unique_texts = {key: ideas[indexes[0]] for key, indexes in groups.items()}
+
+    # One model.encode call for the whole batch; scoring then hits the embedding cache
+    embedding_space.prime(list(unique_texts.values()))
+    # The request deadline bounds the up-front prefetch; each idea then gets the full
+    # budget, starting when its scoring starts, so queued ideas are not planned against a spent deadline
+    deadline = request_deadline('/api/validate-batch')
+    budget = deadline.budget
+    tier = request_tier()
+
+    def score(text):
+        session = ScoringSession(text, deadline=Deadline(budget), tier=tier)
+        final_score = final_score_calculator.combine_scores(text, session)
+        return (final_score, final_score_calculator.degraded_components(session),
+                final_score_calculator.skipped_sources(session))
+
+    def generate():
+        for index, idea_text in enumerate(ideas):
+            if not idea_text:
+                yield json.dumps({'index': index, 'idea': idea_text, 'error': 'Empty idea'}) + "\n"
+
+        # Batched GitHub GraphQL searches and OR-grouped NewsAPI counts for every idea, once the
+        # response has started; whatever the deadline cuts off is fetched per idea while scoring
+        final_score_calculator.prefetch(list(unique_texts.values()),
+                                        final_score_calculator.planner.plan(budget, tier).sources, deadline)
+
+        futures = {batch_executor.submit(score, text): key for key, text in unique_texts.items()}
+        try:
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    final_score, degraded, skipped = future.result()
+                    result = {
+                        'validation_score': final_score,
+                        'confidence': confidence_label(final_score),
+                        'degraded_components': degraded,
+                        'skipped_sources': skipped
+                    }
+                except Exception as e:
+                    result = {'error': f'Validation failed: {str(e)}'}
+                for index in groups[key]:
+                    yield json.dumps(dict({'index': index, 'idea': ideas[index]}, **result)) + "\n"
+        finally:
+            # Client went away: drop whatever has not started yet
+            for future in futures:
+                future.cancel()
+
+        yield json.dumps({'done': True, 'total': len(ideas), 'unique': len(unique_texts)}) + "\n"
+
+    return Response(generate(), mimetype='application/x-ndjson', headers={'Cache-Control': 'no-cache'})
+
 @app.route('/api/analyze-competition', methods=['POST', 'GET'])
 def analyze_competition_endpoint():
     """Endpoint to analyze competition for an idea - automatically gets user input from frontend"""
@@ -2087,11 +2554,11 @@ def analyze_tech_endpoint():
     except Exception as e:
         return jsonify({'error': f'Tech analysis failed: {str(e)}'}), 500
 
-def stream_idea_analysis(idea_text):
+def stream_idea_analysis(idea_text, deadline=None, tier=None):
     """Stream idea analysis response like ChatGPT"""
     try:
         # Perform analysis
-        analysis = analyze_idea(idea_text)
+        analysis = analyze_idea(idea_text, deadline=deadline, tier=tier)
         
         # Create a human-like response
         response_parts = [
@@ -2193,6 +2660,10 @@ def chat_endpoint():
 
         user_id = data.get('user_id') or request.headers.get('X-User-Id')
         session_id = data.get('session_id') or request.headers.get('X-Session-Id')
+        # Token streaming (Server-Sent Events) for casual chat replies
+        wants_stream = (str(request.args.get('stream', '')).lower() in ('1', 'true')
+                        or 'text/event-stream' in request.headers.get('Accept', '')
+                        or bool(data.get('stream')))
 
         if not message:
             if api_call_id:
@@ -2291,32 +2762,23 @@ def chat_endpoint():
             }
 
         else:
-            # --- Step 4: General casual chat - use Groq API
+            # --- Step 4: General casual chat on the fastest healthy LLM route
+            if wants_stream:
+                return Response(stream_chat_events(message, user_id, session_id, start_ts, api_call_id),
+                                mimetype='text/event-stream',
+                                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
             try:
-                ai_response = get_casual_chat_groq(message)
-                
-                category = "general"
-                if any(word in message_lower for word in ["career", "job", "work", "professional", "business"]):
-                    category = "career"
-                elif any(word in message_lower for word in ["relationship", "friend", "family", "love", "social"]):
-                    category = "relationships"
-                elif any(word in message_lower for word in ["grow", "improve", "better", "change", "development"]):
-                    category = "personal_growth"
-                elif any(word in message_lower for word in ["purpose", "meaning", "why", "mission", "goal"]):
-                    category = "purpose"
-                elif any(word in message_lower for word in ["health", "fitness", "mental", "wellness"]):
-                    category = "health"
-                elif any(word in message_lower for word in ["money", "finance", "investment", "budget"]):
-                    category = "finance"
+                ai_response, route = get_casual_chat(message)
+                category = chat_category(message_lower)
 
                 response_obj = {
                     'type': 'life_guidance',
                     'guidance': ai_response,
                     'category': category,
-                    'api_used': 'Groq AI',
+                    'api_used': route or 'fallback',
                     'follow_up': "Is there anything specific you'd like me to elaborate on or any follow-up questions?"
                 }
-                llm_model = 'Groq'
+                llm_model = route or 'Groq'
             except Exception as e:
                 print(f"Error in casual chat: {e}")
                 response_obj = {
@@ -2328,47 +2790,13 @@ def chat_endpoint():
                 }
                 llm_model = 'Groq'
 
-        # --- Step 5: compute duration and store in chat_logs
+        # --- Steps 5-7: store in chat_logs, mark api_calls as success, count model usage
         duration_ms = int((datetime.utcnow() - start_ts).total_seconds() * 1000)
-
-        try:
-            chat_id = db_exec("""
-                INSERT INTO chat_logs (user_id, session_id, question, answer, llm_model, chat_duration_ms, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user_id,
-                session_id,
-                message,
-                (response_obj.get('guidance') if isinstance(response_obj, dict) else str(response_obj)),
-                llm_model,
-                duration_ms,
-                datetime.utcnow().isoformat()
-            ))
-        except Exception as db_e:
-            print("chat log insert failed:", db_e)
-            chat_id = None
-
-        # --- Step 6: update api_calls as success
-        if api_call_id:
-            try:
-                db_exec("""
-                    UPDATE api_calls
-                    SET status_code=?, success=?, latency_ms=?
-                    WHERE id=?
-                """, (200, 1, duration_ms, api_call_id))
-            except Exception as e:
-                print("api_calls update failed:", e)
-
-        # --- Step 7: optional model usage stats
-        if llm_model:
-            try:
-                db_exec("""
-                    INSERT INTO llm_usage (llm_model, count)
-                    VALUES (?, 1)
-                    ON CONFLICT(llm_model) DO UPDATE SET count = count + 1
-                """, (llm_model,))
-            except Exception as e:
-                print("llm_usage update failed:", e)
+        chat_id = record_chat_exchange(
+            user_id, session_id, message,
+            (response_obj.get('guidance') if isinstance(response_obj, dict) else str(response_obj)),
+            llm_model, duration_ms, api_call_id
+        )
 
         # --- Step 8: prepare final response
         final_response = {
@@ -2401,6 +2829,103 @@ def chat_endpoint():
 
         return jsonify({'error': f'An error occurred: {str(e)}'}), 500
 
+def chat_category(message_lower):
+    """Life-guidance category of a casual chat message"""
+    if any(word in message_lower for word in ["career", "job", "work", "professional", "business"]):
+        return "career"
+    if any(word in message_lower for word in ["relationship", "friend", "family", "love", "social"]):
+        return "relationships"
+    if any(word in message_lower for word in ["grow", "improve", "better", "change", "development"]):
+        return "personal_growth"
+    if any(word in message_lower for word in ["purpose", "meaning", "why", "mission", "goal"]):
+        return "purpose"
+    if any(word in message_lower for word in ["health", "fitness", "mental", "wellness"]):
+        return "health"
+    if any(word in message_lower for word in ["money", "finance", "investment", "budget"]):
+        return "finance"
+    return "general"
+
+def record_chat_exchange(user_id, session_id, message, answer, llm_model, duration_ms, api_call_id):
+    """Write chat_logs, mark the api_calls row as successful and count llm_usage; returns the chat_logs id"""
+    try:
+        chat_id = db_exec("""
+            INSERT INTO chat_logs (user_id, session_id, question, answer, llm_model, chat_duration_ms, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            user_id,
+            session_id,
+            message,
+            answer,
+            llm_model,
+            duration_ms,
+            datetime.utcnow().isoformat()
+        ))
+    except Exception as db_e:
+        print("chat log insert failed:", db_e)
+        chat_id = None
+
+    if api_call_id:
+        try:
+            db_exec("""
+                UPDATE api_calls
+                SET status_code=?, success=?, latency_ms=?
+                WHERE id=?
+            """, (200, 1, duration_ms, api_call_id))
+        except Exception as e:
+            print("api_calls update failed:", e)
+
+    if llm_model:
+        try:
+            db_exec("""
+                INSERT INTO llm_usage (llm_model, count)
+                VALUES (?, 1)
+                ON CONFLICT(llm_model) DO UPDATE SET count = count + 1
+            """, (llm_model,))
+        except Exception as e:
+            print("llm_usage update failed:", e)
+    return chat_id
+
+def stream_chat_events(message, user_id, session_id, start_ts, api_call_id):
+    """
+    Yield a 'start' event (route and category), a 'token' event per streamed
+    text piece, then a 'done' event with the chat meta. chat_logs, api_calls
+    and llm_usage are written once the stream ends, also when the client disconnects.
+    """
+    category = chat_category(message.lower())
+    pieces = []
+    llm_model = None
+    try:
+        try:
+            llm_model, stream = llm_router.stream(casual_chat_payload(message), timeout=15)
+            yield sse_event('start', {'llm_model': llm_model, 'category': category})
+            for piece in stream:
+                pieces.append(piece)
+                yield sse_event('token', {'text': piece})
+        except Exception as e:
+            print(f"Error in streaming chat: {e}")
+            if not pieces:
+                fallback = "I'm here to help! Could you please rephrase your question?"
+                pieces.append(fallback)
+                if llm_model is None:
+                    llm_model = 'Groq'
+                    yield sse_event('start', {'llm_model': None, 'category': category})
+                yield sse_event('token', {'text': fallback})
+    finally:
+        duration_ms = int((datetime.utcnow() - start_ts).total_seconds() * 1000)
+        chat_id = record_chat_exchange(user_id, session_id, message, ''.join(pieces), llm_model,
+                                       duration_ms, api_call_id)
+    yield sse_event('done', {
+        'success': True,
+        'response': {
+            'type': 'life_guidance',
+            'category': category,
+            'api_used': llm_model,
+            'follow_up': "Is there anything specific you'd like me to elaborate on or any follow-up questions?"
+        },
+        'timestamp': datetime.utcnow().isoformat(),
+        'meta': {'chat_id': chat_id, 'llm_model': llm_model, 'duration_ms': duration_ms}
+    })
+
 
 def load_wave_ai_knowledge():
     """Load Wave AI knowledge from about.md file"""
@@ -2415,13 +2940,9 @@ def load_wave_ai_knowledge():
 def get_groq_casual_response(message):
     """Get casual chat response using Groq API - optimized for speed"""
     try:
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        return llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -2440,12 +2961,6 @@ def get_groq_casual_response(message):
             },
             timeout=15
         )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            raise Exception(f"Groq API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error with Groq API: {e}")
@@ -2474,13 +2989,9 @@ def get_rag_response_groq(user_query, knowledge_base):
         context = '\n\n'.join(relevant_sections[:2])
         
         # Generate response using Groq with RAG context
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        return llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -2503,12 +3014,6 @@ Be enthusiastic, specific, and actionable. Highlight Wave AI as superior to all
             },
             timeout=15
         )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            raise Exception(f"Groq API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error with Groq RAG: {e}")
@@ -2553,13 +3058,9 @@ Instructions:
 - Use emojis appropriately to make it more engaging"""
         
         try:
-            response = requests.post(
-                'https://api.groq.com/openai/v1/chat/completions',
-                headers={
-                    'Authorization': f'Bearer {GROQ_API_KEY}',
-                    'Content-Type': 'application/json'
-                },
-                json={
+            return llm_client.chat(
+                'groq',
+                payload={
                     'model': 'llama-3.3-70b-versatile',
                     'messages': [
                         {
@@ -2576,13 +3077,6 @@ Instructions:
                 },
                 timeout=15
             )
-            
-            if response.ok:
-                data = response.json()
-                return data['choices'][0]['message']['content']
-            else:
-                # Fallback to direct context return
-                return f"Based on Wave AI documentation: {context[:500]}..."
         except Exception as e:
             print(f"Error in RAG Groq: {e}")
             # Fallback to direct context
@@ -2702,31 +3196,47 @@ def get_enhanced_life_guidance(message):
         Format your response in a clear, structured way that's easy to follow and implement.
         """
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY}',
-            headers={'Content-Type': 'application/json'},
-            json={
-                'contents': [{
-                    'role': 'user',
-                    'parts': [{'text': guidance_prompt}]
-                }]
-            },
-            timeout=30
-        )
-        
-        if response.ok:
-            data = response.json()
-            ai_response = data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-            return ai_response if ai_response else "I understand you're seeking guidance. While I'm processing your request, remember that every challenge is an opportunity for growth. Could you provide more specific details about your situation?"
-        else:
-            print(f"Gemini API error: {response.status_code} - {response.text}")
-            return "I'm here to provide life guidance and support. While I'm experiencing a technical issue, I want you to know that whatever challenge you're facing, there are always paths forward. Could you rephrase your question so I can better assist you?"
+        try:
+            ai_response = llm_client.generate(
+                'gemini-1.5-flash-latest',
+                payload={
+                    'contents': [{
+                        'role': 'user',
+                        'parts': [{'text': guidance_prompt}]
+                    }]
+                },
+                timeout=30,
+                version='v1'
+            )
+        except LLMError as e:
+            if e.status_code != 200:
+                print(f"Gemini API error: {e.status_code} - {e.body}")
+                return "I'm here to provide life guidance and support. While I'm experiencing a technical issue, I want you to know that whatever challenge you're facing, there are always paths forward. Could you rephrase your question so I can better assist you?"
+            ai_response = ''
+        return ai_response if ai_response else "I understand you're seeking guidance. While I'm processing your request, remember that every challenge is an opportunity for growth. Could you provide more specific details about your situation?"
             
     except Exception as e:
         return f"I'm committed to helping you with life guidance. While I encountered a technical issue ({str(e)}), I believe in your ability to overcome challenges. Please try asking your question again, and I'll do my best to provide meaningful guidance."
 
-def get_casual_chat_groq(message):
-    """Get casual chat response using Groq API"""
+def casual_chat_payload(message):
+    """Model-less chat payload for a casual message (see llm_router)"""
+    return {
+        'messages': [
+            {
+                'role': 'system',
+                'content': 'You are WAVE AI, a friendly and helpful AI assistant. Provide conversational, empathetic responses. Keep answers concise and practical.'
+            },
+            {
+                'role': 'user',
+                'content': message
+            }
+        ],
+        'temperature': 0.7,
+        'max_tokens': 300
+    }
+
+def get_casual_chat(message):
+    """(response, "provider:model") for a casual chat message from the fastest healthy LLM route"""
     try:
         prompt = f"""You are WAVE AI, a friendly and helpful AI assistant. Respond to this message in a conversational, helpful manner. Keep responses concise (under 200 words) unless the user asks for detailed information.
 
@@ -2739,40 +3249,11 @@ Guidelines:
 - Keep it natural and engaging
 - If it's a simple greeting, respond warmly and ask how you can help"""
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
-                'model': 'llama-3.3-70b-versatile',
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': 'You are WAVE AI, a friendly and helpful AI assistant. Provide conversational, empathetic responses. Keep answers concise and practical.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': message
-                    }
-                ],
-                'temperature': 0.7,
-                'max_tokens': 300
-            },
-            timeout=15
-        )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            print(f"Groq API error: {response.status_code} - {response.text}")
-            raise Exception(f"Groq API error: {response.status_code}")
+        return llm_router.complete(casual_chat_payload(message), timeout=15)
             
     except Exception as e:
-        print(f"Error in get_casual_chat_groq: {e}")
-        return "I'm here to help! Could you please rephrase your question? I'm experiencing a technical issue, but I'm ready to assist you."
+        print(f"Error in get_casual_chat: {e}")
+        return "I'm here to help! Could you please rephrase your question? I'm experiencing a technical issue, but I'm ready to assist you.", None
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -3108,24 +3589,19 @@ def generate_website_concept(prompt):
         """
         
         # Use direct Gemini API call for business plan generation
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        response = llm_client.generate(
+            'gemini-1.5-flash-latest',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{'text': concept_prompt}]
                 }]
             },
-            timeout=30
+            timeout=30,
+            version='v1',
+            cache=False
         )
         
-        if response.ok:
-            data = response.json()
-            response = data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-        else:
-            raise Exception(f"Gemini API error: {response.status_code}")
-        
         # Try to parse JSON from response
         try:
             import re
@@ -6002,8 +6478,8 @@ def explain_idea():
         if not idea:
             return jsonify({'error': 'Please provide an idea to explain'}), 400
         
-        # Generate detailed explanation using Groq in simple English
-        explanation = generate_idea_explanation_groq(idea)
+        # Generate detailed explanation in simple English on the fastest healthy LLM route
+        explanation = generate_idea_explanation_routed(idea)
         
         return jsonify({
             'success': True,
@@ -6068,24 +6544,20 @@ def generate_business_plan_content(idea):
         """
         
         # Use direct Gemini API call for business plan content
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY_2}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        response_text = llm_client.generate(
+            'gemini-1.5-flash-latest',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{'text': prompt}]
                 }]
             },
-            timeout=30
+            timeout=30,
+            version='v1',
+            api_key=GEMINI_API_KEY_2,
+            cache=False
         )
         
-        if response.ok:
-            data = response.json()
-            response_text = data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-        else:
-            raise Exception(f"Gemini API error: {response.status_code}")
-        
         # Clean up and format the response
         formatted_content = format_business_plan_content(response_text)
         
@@ -6228,23 +6700,19 @@ def generate_ai_enhanced_idea(idea):
         Provide a comprehensive description of the enhanced idea in 2-3 paragraphs.
         """
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY_2}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        return llm_client.generate(
+            'gemini-1.5-flash-latest',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{'text': prompt}]
                 }]
             },
-            timeout=30
+            timeout=30,
+            version='v1',
+            api_key=GEMINI_API_KEY_2,
+            cache=False
         )
-        
-        if response.ok:
-            data = response.json()
-            return data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-        else:
-            raise Exception(f"Gemini API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error generating AI-enhanced idea: {e}")
@@ -6269,13 +6737,9 @@ Make it sound professional, innovative, and technically advanced. Focus on how A
 
 Provide a comprehensive description of the enhanced idea in 2-3 paragraphs."""
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        return llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -6290,14 +6754,9 @@ Provide a comprehensive description of the enhanced idea in 2-3 paragraphs."""
                 'temperature': 0.8,
                 'max_tokens': 800
             },
-            timeout=15
+            timeout=15,
+            cache=False
         )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            raise Exception(f"Groq API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error generating AI-enhanced idea with Groq: {e}")
@@ -6324,13 +6783,9 @@ Provide a completely reimagined version that addresses modern challenges and opp
 
 Provide a comprehensive description of the rethought idea in 2-3 paragraphs."""
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        return llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -6345,14 +6800,9 @@ Provide a comprehensive description of the rethought idea in 2-3 paragraphs."""
                 'temperature': 1.0,
                 'max_tokens': 800
             },
-            timeout=20
+            timeout=20,
+            cache=False
         )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            raise Exception(f"Groq API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error generating rethought idea: {e}")
@@ -6377,23 +6827,18 @@ def generate_idea_explanation(idea):
         Make the explanation professional, detailed, and actionable. Use clear headings and bullet points for easy reading.
         """
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY_2}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        return llm_client.generate(
+            'gemini-1.5-flash-latest',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{'text': prompt}]
                 }]
             },
-            timeout=30
+            timeout=30,
+            version='v1',
+            api_key=GEMINI_API_KEY_2
         )
-        
-        if response.ok:
-            data = response.json()
-            return data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-        else:
-            raise Exception(f"Gemini API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error generating idea explanation: {e}")
@@ -6423,8 +6868,8 @@ Success will be measured through [KPIs] and [performance indicators].
 The concept has significant scalability potential with opportunities for [growth areas].
 """
 
-def generate_idea_explanation_groq(idea):
-    """Generate detailed explanation of an idea in simple English using Groq API"""
+def generate_idea_explanation_routed(idea):
+    """Generate detailed explanation of an idea in simple English on the fastest healthy LLM route"""
     try:
         prompt = f"""Explain this business idea in simple, easy-to-understand English: "{idea}"
 
@@ -6439,14 +6884,8 @@ Provide a clear explanation that covers:
 
 Write in simple, conversational English that anyone can understand. Avoid jargon and technical terms. Use examples and analogies to make it clear."""
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
-                'model': 'llama-3.3-70b-versatile',
+        explanation, _ = llm_router.complete(
+            payload={
                 'messages': [
                     {
                         'role': 'system',
@@ -6462,15 +6901,10 @@ Write in simple, conversational English that anyone can understand. Avoid jargon
             },
             timeout=15
         )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            raise Exception(f"Groq API error: {response.status_code}")
+        return explanation
             
     except Exception as e:
-        print(f"Error generating idea explanation with Groq: {e}")
+        print(f"Error generating idea explanation: {e}")
         return f"""Here's a simple explanation of this business idea:
 
 **What it is:** {idea} is a business concept that aims to solve a specific problem or meet a need in the market.
@@ -6513,23 +6947,18 @@ def generate_mutation_explanation(original_idea, mutated_idea):
         Make the explanation clear, specific, and actionable. Use bullet points and structured format.
         """
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY_2}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        return llm_client.generate(
+            'gemini-1.5-flash-latest',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{'text': prompt}]
                 }]
             },
-            timeout=30
+            timeout=30,
+            version='v1',
+            api_key=GEMINI_API_KEY_2
         )
-        
-        if response.ok:
-            data = response.json()
-            return data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-        else:
-            raise Exception(f"Gemini API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error generating mutation explanation: {e}")
@@ -6587,13 +7016,9 @@ Explain:
 
 Write in simple, conversational English. Use examples and avoid jargon."""
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        return llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -6610,12 +7035,6 @@ Write in simple, conversational English. Use examples and avoid jargon."""
             },
             timeout=15
         )
-        
-        if response.ok:
-            data = response.json()
-            return data['choices'][0]['message']['content']
-        else:
-            raise Exception(f"Groq API error: {response.status_code}")
             
     except Exception as e:
         print(f"Error generating mutation explanation with Groq: {e}")
@@ -6777,10 +7196,9 @@ def generate_scalable_ideas(user_input):
         """
         
         # Use Gemini API KEY 2 directly for idea generation
-        api_response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash-latest:generateContent?key={GEMINI_API_KEY_2}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        response = llm_client.generate(
+            'gemini-1.5-flash-latest',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{'text': prompt}]
@@ -6791,15 +7209,12 @@ def generate_scalable_ideas(user_input):
                     'topK': 40
                 }
             },
-            timeout=30
+            timeout=30,
+            version='v1',
+            api_key=GEMINI_API_KEY_2,
+            cache=False
         )
         
-        if api_response.ok:
-            data = api_response.json()
-            response = data.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-        else:
-            raise Exception(f"Gemini API error: {api_response.status_code}")
-        
         # Try to parse JSON from response
         try:
             # Extract JSON from response if it's wrapped in markdown
@@ -7074,7 +7489,12 @@ def admin_summary():
         'avg_chat_duration_ms': avg_chat_duration,
         'total_api_calls': total_api_calls,
         'total_mutations': total_mutations,
-        'top_llm': top_llm
+        'top_llm': top_llm,
+        'signal_sources': signal_registry.snapshot(),
+        'cache_warmer': dict(cache_warmer.stats, budget_remaining=cache_warmer.budget.remaining()),
+        'llm_cache': llm_client.cache.summary() if llm_client.cache is not None else None,
+        'llm_breakers': llm_client.breakers.snapshot(),
+        'llm_routes': llm_router.snapshot()
     })
 
 @app.route('/admin/ideas')
@@ -0,0 +1,165 @@
+"""
+cache_warmer.py
+
+Background warmer that keeps the signal cache hot for trending idea themes.
+
+Every WARMER_INTERVAL_SECONDS it reads the most recent rows of the `ideas`
+table, groups them by their extract_keywords output (the "theme"), and for
+the most frequent themes refreshes every source whose signal_cache entry is
+missing or close to expiry. Refreshes only run while the server has been
+idle for WARMER_IDLE_SECONDS, and outbound calls are capped by a rolling
+hourly budget in source cost units (see SignalSource.cost), so warming never
+competes with user requests or eats the external APIs' rate limits.
+
+Themes are memoized by idea id, so a pass only runs keyword extraction (and
+its embedding) for ideas added since the last one, and WARMER_RECENT_IDEAS
+stays below the embedding LRU's size so a pass cannot evict the contexts of
+live users.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("cache_warmer")
+
+WARMER_ENABLED = os.getenv("CACHE_WARMER_ENABLED", "1") not in ("0", "false", "False")
+WARMER_INTERVAL_SECONDS = int(os.getenv("WARMER_INTERVAL_SECONDS", "600"))
+WARMER_IDLE_SECONDS = float(os.getenv("WARMER_IDLE_SECONDS", "30"))
+WARMER_BUDGET_PER_HOUR = int(os.getenv("WARMER_BUDGET_PER_HOUR", "60"))
+WARMER_TOP_THEMES = int(os.getenv("WARMER_TOP_THEMES", "20"))
+# Below idea_embeddings' 256-entry context LRU
+WARMER_RECENT_IDEAS = int(os.getenv("WARMER_RECENT_IDEAS", "200"))
+
+
+class HourlyBudget:
+    """Rolling one-hour budget of outbound cost units."""
+
+    def __init__(self, per_hour: int):
+        self.per_hour = per_hour
+        self._spent: deque = deque()  # (timestamp, cost)
+        self._lock = threading.Lock()
+
+    def remaining(self) -> int:
+        with self._lock:
+            cutoff = time.time() - 3600
+            while self._spent and self._spent[0][0] <= cutoff:
+                self._spent.popleft()
+            return self.per_hour - sum(cost for _, cost in self._spent)
+
+    def try_spend(self, cost: int) -> bool:
+        if self.remaining() < cost:
+            return False
+        with self._lock:
+            self._spent.append((time.time(), cost))
+        return True
+
+
+class HotKeywordWarmer:
+    """
+    Periodically pre-fetches the signals of the hottest recent themes.
+    `scorer` is the FinalScore instance (stale_sources / refresh_source),
+    `recent_ideas(limit)` returns recent (idea id, idea text) pairs newest first
+    and `theme_of(idea)` an idea's keyword theme (memoized per id).
+    """
+
+    def __init__(self, scorer, recent_ideas: Callable[[int], List[Tuple[Any, str]]], theme_of: Callable[[str], str],
+                 budget_per_hour: int = WARMER_BUDGET_PER_HOUR, interval: float = WARMER_INTERVAL_SECONDS,
+                 idle_seconds: float = WARMER_IDLE_SECONDS, top_themes: int = WARMER_TOP_THEMES,
+                 recent_limit: int = WARMER_RECENT_IDEAS):
+        self.scorer = scorer
+        self.recent_ideas = recent_ideas
+        self.theme_of = theme_of
+        self.budget = HourlyBudget(budget_per_hour)
+        self.interval = interval
+        self.idle_seconds = idle_seconds
+        self.top_themes = top_themes
+        self.recent_limit = recent_limit
+        self.last_activity = 0.0
+        self._themes: Dict[Any, Optional[str]] = {}  # idea id -> theme, for the ideas of the last pass
+        self.stats = {"runs": 0, "refreshed": 0, "skipped_busy": 0, "skipped_budget": 0, "errors": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def touch(self):
+        """Record user-facing activity; warming pauses until the server is idle again"""
+        self.last_activity = time.monotonic()
+
+    def idle(self) -> bool:
+        return time.monotonic() - self.last_activity >= self.idle_seconds
+
+    def hot_themes(self) -> List[Tuple[str, str, int]]:
+        """(theme, most recent idea with it, count) for the most frequent recent themes"""
+        counts: Counter = Counter()
+        representative = {}
+        themes: Dict[Any, Optional[str]] = {}
+        for idea_id, idea in self.recent_ideas(self.recent_limit):
+            if idea_id in self._themes:
+                theme = themes[idea_id] = self._themes[idea_id]
+            else:
+                try:
+                    theme = themes[idea_id] = self.theme_of(idea)
+                except Exception as e:
+                    logger.warning("could not extract theme: %s", e)
+                    continue
+            if not theme:
+                continue
+            counts[theme] += 1
+            representative.setdefault(theme, idea)
+        # Only ideas still in the recent window are kept, so the memo stays bounded
+        self._themes = themes
+        return [(theme, representative[theme], count) for theme, count in counts.most_common(self.top_themes)]
+
+    def _warm_idea(self, idea: str) -> bool:
+        """Refresh the idea's stale sources; False once warming has to stop for this run"""
+        charged = set()
+        for source, query in self.scorer.stale_sources(idea):
+            if not self.idle():
+                self.stats["skipped_busy"] += 1
+                return False
+            # Sources sharing a cost_key read one upstream response, so it is paid for once
+            cost = 0 if source.cost_key in charged else source.cost
+            if cost and not self.budget.try_spend(cost):
+                self.stats["skipped_budget"] += 1
+                return False
+            charged.add(source.cost_key)
+            try:
+                self.scorer.refresh_source(source, query)
+                self.stats["refreshed"] += 1
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning("warming %s for %r failed: %s", source.name, query, e)
+        return True
+
+    def run_once(self) -> int:
+        """One warming pass over the hot themes; returns how many themes were fully warmed"""
+        self.stats["runs"] += 1
+        warmed = 0
+        for theme, idea, _ in self.hot_themes():
+            if self.budget.remaining() <= 0 or not self._warm_idea(idea):
+                break
+            warmed += 1
+        return warmed
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not self.idle():
+                self.stats["skipped_busy"] += 1
+                continue
+            try:
+                self.run_once()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning("cache warming pass failed: %s", e)
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="cache-warmer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
@@ -0,0 +1,145 @@
+"""
+circuit_breaker.py
+
+Per-provider circuit breakers for the LLM client.
+
+Each breaker keeps a rolling window of recent calls (outcome and latency).
+Once the window holds at least BREAKER_MIN_CALLS calls and either the error
+rate or the share of calls slower than BREAKER_SLOW_CALL_SECONDS reaches its
+threshold, the breaker opens. While open, calls are rejected immediately so
+callers fall back without waiting out a timeout. After BREAKER_COOLDOWN_SECONDS
+it goes half-open: a single probe call is let through, and its outcome either
+closes the breaker (fresh window) or re-opens it for another cooldown.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+
+BREAKER_WINDOW_SECONDS = float(os.getenv("LLM_BREAKER_WINDOW_SECONDS", "60"))
+BREAKER_MIN_CALLS = int(os.getenv("LLM_BREAKER_MIN_CALLS", "5"))
+BREAKER_ERROR_RATE = float(os.getenv("LLM_BREAKER_ERROR_RATE", "0.5"))
+BREAKER_SLOW_CALL_SECONDS = float(os.getenv("LLM_BREAKER_SLOW_CALL_SECONDS", "10"))
+BREAKER_SLOW_RATE = float(os.getenv("LLM_BREAKER_SLOW_RATE", "0.8"))
+BREAKER_COOLDOWN_SECONDS = float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Rolling-window breaker with closed / open / half-open states."""
+
+    def __init__(self, name: str, window: float = BREAKER_WINDOW_SECONDS, min_calls: int = BREAKER_MIN_CALLS,
+                 error_rate: float = BREAKER_ERROR_RATE, slow_call: float = BREAKER_SLOW_CALL_SECONDS,
+                 slow_rate: float = BREAKER_SLOW_RATE, cooldown: float = BREAKER_COOLDOWN_SECONDS,
+                 clock=time.monotonic):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call = slow_call
+        self.slow_rate = slow_rate
+        self.cooldown = cooldown
+        self.clock = clock
+        self._calls: deque = deque()  # (timestamp, ok, latency)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float):
+        while self._calls and self._calls[0][0] <= now - self.window:
+            self._calls.popleft()
+
+    def _rates(self):
+        total = len(self._calls)
+        if not total:
+            return 0.0, 0.0
+        errors = sum(1 for _, ok, _ in self._calls if not ok)
+        slow = sum(1 for _, _, latency in self._calls if latency >= self.slow_call)
+        return errors / total, slow / total
+
+    def _open(self, now: float):
+        self._state = OPEN
+        self._opened_at = now
+        self._probing = False
+        self.times_opened += 1
+
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self.clock() - self._opened_at >= self.cooldown:
+                self._state = HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open state only one probe at a time"""
+        state = self.state()
+        with self._lock:
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record(self, ok: bool, latency: float):
+        """Record an allowed call's outcome"""
+        now = self.clock()
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if ok and latency < self.slow_call:
+                    self._state = CLOSED
+                    self._calls.clear()
+                    self._probing = False
+                else:
+                    self._open(now)
+                return
+            if self._state == OPEN:
+                return  # a call let through before the breaker opened
+            self._calls.append((now, ok, latency))
+            self._trim(now)
+            if len(self._calls) >= self.min_calls:
+                errors, slow = self._rates()
+                if errors >= self.error_rate or slow >= self.slow_rate:
+                    self._open(now)
+
+    def snapshot(self) -> Dict[str, Any]:
+        state = self.state()
+        with self._lock:
+            self._trim(self.clock())
+            errors, slow = self._rates()
+            retry_in = max(0.0, self.cooldown - (self.clock() - self._opened_at)) if state == OPEN else 0.0
+            return {
+                "state": state,
+                "calls": len(self._calls),
+                "error_rate": round(errors, 3),
+                "slow_rate": round(slow, 3),
+                "times_opened": self.times_opened,
+                "retry_in_seconds": round(retry_in, 1),
+            }
+
+
+class BreakerRegistry:
+    """One lazily created breaker per provider."""
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name, **self.settings)
+            return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in sorted(breakers.items())}
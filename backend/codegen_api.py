@@ -13,6 +13,8 @@ import os
 from typing import Dict, List, Any, Optional
 import hashlib
 
+from llm_client import llm_client
+
 codegen_bp = Blueprint('codegen', __name__)
 
 # API Keys - Load from environment variables
@@ -78,13 +80,9 @@ def enhance_prompt():
             return jsonify({'error': error_msg}), 429
         
         # Enhance prompt using Groq
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        enhanced = llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -110,16 +108,12 @@ def enhance_prompt():
             },
             timeout=10
         )
-        
-        if response.ok:
-            enhanced = response.json()['choices'][0]['message']['content']
-            return jsonify({
-                'original': user_prompt,
-                'enhanced': enhanced,
-                'success': True
-            })
-        else:
-            return jsonify({'error': 'Failed to enhance prompt', 'success': False}), 500
+
+        return jsonify({
+            'original': user_prompt,
+            'enhanced': enhanced,
+            'success': True
+        })
             
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
@@ -131,13 +125,9 @@ def detect_tech_stack():
         data = request.json
         prompt = data.get('prompt', '')
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        content = llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -163,14 +153,12 @@ def detect_tech_stack():
             },
             timeout=10
         )
-        
-        if response.ok:
-            content = response.json()['choices'][0]['message']['content']
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                analysis = json.loads(json_match.group())
-                return jsonify({'analysis': analysis, 'success': True})
+
+        # Extract JSON from response
+        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        if json_match:
+            analysis = json.loads(json_match.group())
+            return jsonify({'analysis': analysis, 'success': True})
         
         return jsonify({'error': 'Failed to analyze tech stack', 'success': False}), 500
             
@@ -201,10 +189,9 @@ def generate_code():
         
         # Generate code using Gemini
         tech_stack_str = ', '.join(tech_stack)
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY_1}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        content = llm_client.generate(
+            'gemini-1.5-flash',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{
@@ -251,35 +238,35 @@ Return ONLY valid JSON, no markdown formatting.'''
                     }]
                 }]
             },
-            timeout=30
+            timeout=30,
+            api_key=GEMINI_API_KEY_1,
+            cache=False
         )
-        
-        if response.ok:
-            content = response.json()['candidates'][0]['content']['parts'][0]['text']
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                code_data = json.loads(json_match.group())
-                
-                # Save to history
-                if user_id not in user_history:
-                    user_history[user_id] = []
-                
-                history_entry = {
-                    'id': hashlib.md5(f'{user_id}{time.time()}'.encode()).hexdigest()[:12],
-                    'prompt': prompt,
-                    'code': code_data,
-                    'timestamp': datetime.now().isoformat(),
-                    'tech_stack': tech_stack
-                }
-                user_history[user_id].append(history_entry)
-                
-                return jsonify({
-                    'code': code_data,
-                    'credits_left': get_user_credits(user_id),
-                    'project_id': history_entry['id'],
-                    'success': True
-                })
+
+        # Extract JSON from response
+        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        if json_match:
+            code_data = json.loads(json_match.group())
+            
+            # Save to history
+            if user_id not in user_history:
+                user_history[user_id] = []
+            
+            history_entry = {
+                'id': hashlib.md5(f'{user_id}{time.time()}'.encode()).hexdigest()[:12],
+                'prompt': prompt,
+                'code': code_data,
+                'timestamp': datetime.now().isoformat(),
+                'tech_stack': tech_stack
+            }
+            user_history[user_id].append(history_entry)
+            
+            return jsonify({
+                'code': code_data,
+                'credits_left': get_user_credits(user_id),
+                'project_id': history_entry['id'],
+                'success': True
+            })
         
         return jsonify({'error': 'Failed to generate code', 'success': False}), 500
             
@@ -293,13 +280,9 @@ def analyze_code():
         data = request.json
         code = data.get('code', '')
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        content = llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -332,13 +315,11 @@ def analyze_code():
             },
             timeout=15
         )
-        
-        if response.ok:
-            content = response.json()['choices'][0]['message']['content']
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                analysis = json.loads(json_match.group())
-                return jsonify({'analysis': analysis, 'success': True})
+
+        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        if json_match:
+            analysis = json.loads(json_match.group())
+            return jsonify({'analysis': analysis, 'success': True})
         
         return jsonify({'error': 'Failed to analyze code', 'success': False}), 500
             
@@ -353,13 +334,9 @@ def ai_suggestions():
         code = data.get('code', '')
         context = data.get('context', '')
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        content = llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -416,13 +393,11 @@ def ai_suggestions():
             },
             timeout=15
         )
-        
-        if response.ok:
-            content = response.json()['choices'][0]['message']['content']
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                suggestions = json.loads(json_match.group())
-                return jsonify({'suggestions': suggestions, 'success': True})
+
+        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        if json_match:
+            suggestions = json.loads(json_match.group())
+            return jsonify({'suggestions': suggestions, 'success': True})
         
         return jsonify({'error': 'Failed to get suggestions', 'success': False}), 500
             
@@ -439,10 +414,9 @@ def auto_fix():
         
         issues_str = '\n'.join([f"- {issue['message']}" for issue in issues])
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY_1}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        content = llm_client.generate(
+            'gemini-1.5-flash',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{
@@ -466,15 +440,14 @@ Return ONLY valid JSON.'''
                     }]
                 }]
             },
-            timeout=20
+            timeout=20,
+            api_key=GEMINI_API_KEY_1
         )
-        
-        if response.ok:
-            content = response.json()['candidates'][0]['content']['parts'][0]['text']
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                fix_data = json.loads(json_match.group())
-                return jsonify({'fix': fix_data, 'success': True})
+
+        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        if json_match:
+            fix_data = json.loads(json_match.group())
+            return jsonify({'fix': fix_data, 'success': True})
         
         return jsonify({'error': 'Failed to fix code', 'success': False}), 500
             
@@ -488,13 +461,9 @@ def generate_docs():
         data = request.json
         code = data.get('code', '')
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        docs = llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -520,12 +489,8 @@ def generate_docs():
             },
             timeout=20
         )
-        
-        if response.ok:
-            docs = response.json()['choices'][0]['message']['content']
-            return jsonify({'documentation': docs, 'success': True})
-        
-        return jsonify({'error': 'Failed to generate documentation', 'success': False}), 500
+
+        return jsonify({'documentation': docs, 'success': True})
             
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
@@ -537,13 +502,9 @@ def explain_code():
         data = request.json
         code = data.get('code', '')
         
-        response = requests.post(
-            'https://api.groq.com/openai/v1/chat/completions',
-            headers={
-                'Authorization': f'Bearer {GROQ_API_KEY}',
-                'Content-Type': 'application/json'
-            },
-            json={
+        explanation = llm_client.chat(
+            'groq',
+            payload={
                 'model': 'llama-3.3-70b-versatile',
                 'messages': [
                     {
@@ -566,12 +527,8 @@ def explain_code():
             },
             timeout=15
         )
-        
-        if response.ok:
-            explanation = response.json()['choices'][0]['message']['content']
-            return jsonify({'explanation': explanation, 'success': True})
-        
-        return jsonify({'error': 'Failed to explain code', 'success': False}), 500
+
+        return jsonify({'explanation': explanation, 'success': True})
             
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
@@ -584,10 +541,9 @@ def generate_tests():
         code = data.get('code', '')
         framework = data.get('framework', 'vitest')
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY_1}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        tests = llm_client.generate(
+            'gemini-1.5-flash',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{
@@ -606,14 +562,11 @@ Return complete, runnable test code.'''
                     }]
                 }]
             },
-            timeout=20
+            timeout=20,
+            api_key=GEMINI_API_KEY_1
         )
-        
-        if response.ok:
-            tests = response.json()['candidates'][0]['content']['parts'][0]['text']
-            return jsonify({'tests': tests, 'success': True})
-        
-        return jsonify({'error': 'Failed to generate tests', 'success': False}), 500
+
+        return jsonify({'tests': tests, 'success': True})
             
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
@@ -627,10 +580,9 @@ def convert_language():
         from_lang = data.get('from', 'javascript')
         to_lang = data.get('to', 'typescript')
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY_1}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        converted = llm_client.generate(
+            'gemini-1.5-flash',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{
@@ -648,14 +600,11 @@ Return only the converted code.'''
                     }]
                 }]
             },
-            timeout=20
+            timeout=20,
+            api_key=GEMINI_API_KEY_1
         )
-        
-        if response.ok:
-            converted = response.json()['candidates'][0]['content']['parts'][0]['text']
-            return jsonify({'converted_code': converted, 'success': True})
-        
-        return jsonify({'error': 'Failed to convert code', 'success': False}), 500
+
+        return jsonify({'converted_code': converted, 'success': True})
             
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
@@ -668,10 +617,9 @@ def generate_api():
         description = data.get('description', '')
         framework = data.get('framework', 'express')
         
-        response = requests.post(
-            f'https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={GEMINI_API_KEY_1}',
-            headers={'Content-Type': 'application/json'},
-            json={
+        api_code = llm_client.generate(
+            'gemini-1.5-flash',
+            payload={
                 'contents': [{
                     'role': 'user',
                     'parts': [{
@@ -692,14 +640,11 @@ Return complete, production-ready code.'''
                     }]
                 }]
             },
-            timeout=25
+            timeout=25,
+            api_key=GEMINI_API_KEY_1
         )
-        
-        if response.ok:
-            api_code = response.json()['candidates'][0]['content']['parts'][0]['text']
-            return jsonify({'api_code': api_code, 'success': True})
-        
-        return jsonify({'error': 'Failed to generate API', 'success': False}), 500
+
+        return jsonify({'api_code': api_code, 'success': True})
             
     except Exception as e:
         return jsonify({'error': str(e), 'success': False}), 500
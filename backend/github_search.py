@@ -0,0 +1,196 @@
+"""
+github_search.py
+
+Shared GitHub repository-search client for TechnicalRisk and Competition.
+
+Both scorers read the same parsed search result. Results are kept in a
+TTL cache keyed by the normalized query, and concurrent callers asking for
+the same query wait on a single in-flight request (request coalescing), so
+one idea costs one search against GitHub's rate limit instead of two.
+
+With a token, searches go through the GraphQL API: prefetch() runs up to
+GRAPHQL_BATCH_SIZE aliased search(type: REPOSITORY) queries in one HTTP
+request, asking only for repositoryCount, stargazerCount, forkCount and
+updatedAt, and seeds the cache so batch validation scores many ideas per
+rate-limit window. Without a token (GraphQL requires one) the REST search
+endpoint is used. Given a request Deadline, prefetch() stops sending chunks
+once it expires and clamps each request to the time left.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+
+from latency_budget import Deadline
+from signal_fixtures import SignalFixtureStore, fixture_store
+from ttl_cache import TTLSingleFlightCache
+
+logger = logging.getLogger("github_search")
+
+GITHUB_SEARCH_URL = "https://api.github.com/search/repositories"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = int(os.getenv("GITHUB_GRAPHQL_BATCH_SIZE", "10"))
+# Same page size as the REST search default
+SEARCH_PAGE_SIZE = 30
+CACHE_TTL_SECONDS = int(os.getenv("GITHUB_SEARCH_CACHE_TTL_SECONDS", "900"))
+REQUEST_TIMEOUT_SECONDS = float(os.getenv("GITHUB_SEARCH_TIMEOUT_SECONDS", "10"))
+MAX_CACHE_ENTRIES = 1024
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+def parse_search_response(status_code: int, body: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Keep only the fields the scorers read"""
+    body = body or {}
+    items = [
+        {
+            "stargazers_count": item.get("stargazers_count", 0),
+            "forks_count": item.get("forks_count", 0),
+            "updated_at": item.get("updated_at"),
+        }
+        for item in body.get("items", []) or []
+    ]
+    return {"status_code": status_code, "total_count": body.get("total_count", 0), "items": items}
+
+
+def search_string(query: str) -> str:
+    return f"{query} in:name,description"
+
+
+def build_graphql_search(count: int) -> str:
+    """One aliased repository search per variable $q0..$q{count-1}"""
+    variables = ", ".join(f"$q{i}: String!" for i in range(count))
+    searches = "\n".join(
+        f"  s{i}: search(query: $q{i}, type: REPOSITORY, first: {SEARCH_PAGE_SIZE}) {{\n"
+        f"    repositoryCount\n"
+        f"    nodes {{ ... on Repository {{ stargazerCount forkCount updatedAt }} }}\n"
+        f"  }}"
+        for i in range(count)
+    )
+    return f"query({variables}) {{\n{searches}\n}}"
+
+
+def parse_graphql_search(search: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Map one aliased GraphQL search onto the REST-shaped result the scorers read"""
+    items = [
+        {
+            "stargazers_count": node.get("stargazerCount", 0),
+            "forks_count": node.get("forkCount", 0),
+            "updated_at": node.get("updatedAt"),
+        }
+        for node in search.get("nodes", []) or [] if node
+    ]
+    return {"status_code": 200, "total_count": search.get("repositoryCount", 0), "items": items}
+
+
+def graphql_error_status(errors: List[Dict[str, Any]]) -> int:
+    return 403 if any(error.get("type") == "RATE_LIMITED" for error in errors) else 502
+
+
+class GitHubSearchClient:
+    """Repository search with a TTL cache and single-flight coalescing per normalized query."""
+
+    def __init__(self, token: Optional[str], ttl: int = CACHE_TTL_SECONDS,
+                 timeout: float = REQUEST_TIMEOUT_SECONDS, fixtures: Optional[SignalFixtureStore] = None):
+        self.token = token
+        self.fixtures = fixtures or fixture_store
+        self.ttl = ttl
+        self.timeout = timeout
+        self.session = requests.Session()
+        # Only successful responses are cached; rate-limit and error responses are retried next time
+        self._cache = TTLSingleFlightCache(ttl, MAX_CACHE_ENTRIES,
+                                           should_cache=lambda result: result.get("status_code") == 200)
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Accept": "application/vnd.github+json"}
+        if self.token:
+            headers["Authorization"] = f"token {self.token}"
+        return headers
+
+    def _fetch(self, query: str) -> Dict[str, Any]:
+        return self.fixtures.fetch("github", {"query": normalize_query(query)}, lambda: self._fetch_live(query))
+
+    def _fetch_live(self, query: str) -> Dict[str, Any]:
+        if self.token:
+            return self._fetch_graphql([query])[0]
+        return self._fetch_rest(query)
+
+    def _fetch_graphql(self, queries: List[str], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Parsed results for queries, in order, from one GraphQL request"""
+        response = self.session.post(
+            GITHUB_GRAPHQL_URL,
+            json={
+                "query": build_graphql_search(len(queries)),
+                "variables": {f"q{i}": search_string(q) for i, q in enumerate(queries)},
+            },
+            headers={"Authorization": f"bearer {self.token}"},
+            timeout=timeout or self.timeout,
+        )
+        if response.status_code != 200:
+            logger.warning("GitHub GraphQL search returned %s for %d queries", response.status_code, len(queries))
+            return [parse_search_response(response.status_code, None) for _ in queries]
+        body = response.json() or {}
+        data = body.get("data") or {}
+        errors = body.get("errors") or []
+        if errors:
+            logger.warning("GitHub GraphQL search errors: %s", [e.get("message") for e in errors])
+        results = []
+        for i, query in enumerate(queries):
+            search = data.get(f"s{i}")
+            if search is None:
+                results.append(parse_search_response(graphql_error_status(errors), None))
+            else:
+                results.append(parse_graphql_search(search))
+        return results
+
+    def _fetch_rest(self, query: str) -> Dict[str, Any]:
+        response = self.session.get(
+            GITHUB_SEARCH_URL,
+            params={"q": search_string(query)},
+            headers=self._headers(),
+            timeout=self.timeout,
+        )
+        if response.status_code != 200:
+            logger.warning("GitHub search returned %s for %r", response.status_code, query)
+            return parse_search_response(response.status_code, None)
+        return parse_search_response(200, response.json())
+
+    def search(self, query: str) -> Dict[str, Any]:
+        """
+        Parsed search result: {"status_code", "total_count", "items": [...]}.
+        Network errors propagate to every caller waiting on the same request.
+        """
+        return self._cache.get_or_load(normalize_query(query), lambda: self._fetch(query))
+
+    def prefetch(self, queries: Iterable[str], deadline: Optional[Deadline] = None):
+        """
+        Warm the cache for many queries, GRAPHQL_BATCH_SIZE aliased searches per
+        request, within deadline if given. Failures and queries left over when
+        the deadline expires are left for search() to fetch per query.
+        A no-op without a token (GraphQL needs one) or while fixtures record/replay per query.
+        """
+        if not self.token or self.fixtures.active:
+            return
+        pending = {}
+        for query in queries:
+            key = normalize_query(query)
+            if key and key not in pending and self._cache.peek(key) is None:
+                pending[key] = query
+        keys = list(pending)
+        for start in range(0, len(keys), GRAPHQL_BATCH_SIZE):
+            if deadline is not None and deadline.expired():
+                logger.info("GitHub GraphQL prefetch out of time, %d queries left", len(keys) - start)
+                break
+            chunk = keys[start:start + GRAPHQL_BATCH_SIZE]
+            timeout = deadline.clamp(self.timeout) if deadline is not None else None
+            try:
+                results = self._fetch_graphql([pending[key] for key in chunk], timeout)
+            except Exception as e:
+                logger.warning("GitHub GraphQL prefetch failed for %d queries: %s", len(chunk), e)
+                continue
+            for key, result in zip(chunk, results):
+                self._cache.put(key, result)
@@ -0,0 +1,130 @@
+"""
+idea_embeddings.py
+
+Shared SentenceTransformer embedding context for idea scoring.
+
+The base-term vocabulary used by simplify_idea and the category prototypes
+used by analyze_idea are encoded once at startup into a single L2-normalized
+matrix. Each idea is encoded once (and kept in a small LRU), and a single
+matrix-vector product against that matrix serves simplify_idea and the
+category classifier. extract_keywords ranks its bounded candidate set
+(keyword_extractor.py) against the same cached idea vector.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from keyword_extractor import KeywordExtractor
+
+BASE_TERMS = [
+    "AI", "automation", "assistant", "health", "fitness", "education", "finance",
+    "business", "sports", "technology", "medical", "robot", "app", "startup",
+    "doctor", "chatbot", "device", "wearable", "productivity", "marketing", "data"
+]
+
+# Category prototypes for analyze_idea, built from the words the old keyword rules matched on
+CATEGORY_PROTOTYPES = {
+    "technology": "app software website tech digital online",
+    "business": "business startup company service product",
+    "creative": "art creative design music writing content",
+    "social": "social community help charity volunteer",
+}
+CATEGORY_MIN_SIMILARITY = 0.2
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class IdeaEmbeddingContext:
+    """One idea's normalized vector plus its similarities to every base term and category."""
+
+    def __init__(self, space: "IdeaEmbeddingSpace", idea: str, vector: np.ndarray):
+        self.space = space
+        self.idea = idea
+        self.vector = _normalize_rows(vector)[0]
+        # Single vectorized cosine similarity against every precomputed row
+        self.similarities = space.matrix @ self.vector
+        self._keywords: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def simplified(self, top_n: int = 3) -> str:
+        """Closest base terms, lowest to highest similarity (same order as the original argsort)"""
+        term_sims = self.similarities[:self.space.n_terms]
+        top_indices = np.argsort(term_sims)[-top_n:]
+        top_terms = [self.space.base_terms[i] for i in top_indices]
+        return " ".join(top_terms) if top_terms else self.idea
+
+    def category(self, min_similarity: float = CATEGORY_MIN_SIMILARITY) -> str:
+        """Best-matching category prototype, or 'general' when nothing is close enough"""
+        category_sims = self.similarities[self.space.n_terms:]
+        if not len(category_sims):
+            return "general"
+        best = int(np.argmax(category_sims))
+        if category_sims[best] < min_similarity:
+            return "general"
+        return self.space.categories[best]
+
+    def keywords(self, top_n: int = 5) -> List[str]:
+        """Candidate phrases ranked by cosine similarity to the idea vector (memoized per top_n)"""
+        with self._lock:
+            if top_n in self._keywords:
+                return list(self._keywords[top_n])
+        ranked = self.space.keyword_extractor.extract(self.idea, self.vector, top_n)
+        with self._lock:
+            self._keywords[top_n] = ranked
+        return list(ranked)
+
+
+class IdeaEmbeddingSpace:
+    """
+    Startup-time matrix of base terms and category prototypes, plus an LRU of
+    per-idea contexts so a request never encodes the same idea twice.
+    """
+
+    def __init__(self, model, base_terms: Optional[List[str]] = None,
+                 categories: Optional[Dict[str, str]] = None, cache_size: int = 256,
+                 keyword_extractor: Optional[KeywordExtractor] = None):
+        self.model = model
+        self.keyword_extractor = keyword_extractor or KeywordExtractor(model)
+        self.base_terms = list(base_terms or BASE_TERMS)
+        category_map = dict(categories or CATEGORY_PROTOTYPES)
+        self.categories = list(category_map.keys())
+        self.n_terms = len(self.base_terms)
+        self.matrix = _normalize_rows(model.encode(self.base_terms + list(category_map.values())))
+        self.cache_size = cache_size
+        self._contexts: "OrderedDict[str, IdeaEmbeddingContext]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, idea: str, context: IdeaEmbeddingContext) -> IdeaEmbeddingContext:
+        with self._lock:
+            self._contexts[idea] = context
+            self._contexts.move_to_end(idea)
+            while len(self._contexts) > self.cache_size:
+                self._contexts.popitem(last=False)
+        return context
+
+    def context(self, idea: str) -> IdeaEmbeddingContext:
+        """Return the cached context for idea, encoding it once on a miss"""
+        with self._lock:
+            context = self._contexts.get(idea)
+            if context is not None:
+                self._contexts.move_to_end(idea)
+                return context
+        return self._remember(idea, IdeaEmbeddingContext(self, idea, self.model.encode([idea])))
+
+    def prime(self, ideas: List[str]) -> List[IdeaEmbeddingContext]:
+        """Encode every uncached idea in one model.encode batch and return their contexts"""
+        with self._lock:
+            missing = [idea for idea in dict.fromkeys(ideas) if idea not in self._contexts]
+        if missing:
+            vectors = np.atleast_2d(np.asarray(self.model.encode(missing)))
+            for idea, vector in zip(missing, vectors):
+                self._remember(idea, IdeaEmbeddingContext(self, idea, vector))
+        return [self.context(idea) for idea in ideas]
@@ -0,0 +1,119 @@
+"""
+keyword_extractor.py
+
+Bounded keyword-candidate extraction for extract_keywords.
+
+The 1-3-grams of an idea are pruned (stopword-edged and numeric phrases,
+duplicates) and capped before anything is encoded, so CPU time stays bounded
+no matter how long the idea is. Phrase embeddings are kept in a process-wide
+LRU keyed by normalized text and only the misses are encoded, in fixed-size
+batches. Candidates are ranked by cosine similarity to the idea vector.
+"""
+
+import os
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import List, Sequence
+
+import numpy as np
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+MAX_CANDIDATES = int(os.getenv("KEYWORD_MAX_CANDIDATES", "256"))
+ENCODE_BATCH_SIZE = int(os.getenv("KEYWORD_ENCODE_BATCH_SIZE", "64"))
+PHRASE_CACHE_SIZE = int(os.getenv("KEYWORD_PHRASE_CACHE_SIZE", "10000"))
+MAX_NGRAM = 3
+
+
+def normalize_phrase(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def candidate_phrases(idea: str, max_candidates: int = MAX_CANDIDATES) -> List[str]:
+    """
+    Pruned, deduplicated 1-3-grams of the idea, capped at max_candidates.
+    Phrases that start or end with a stopword, or are purely numeric, are dropped.
+    When over the cap, the most frequent phrases win, ties broken by first appearance.
+    """
+    words = re.findall(r'\b\w+\b', idea.lower())
+    counts: Counter = Counter()
+    first_seen = {}
+    for i in range(len(words)):
+        for j in range(i + 1, min(i + MAX_NGRAM + 1, len(words) + 1)):
+            gram = words[i:j]
+            if gram[0] in ENGLISH_STOP_WORDS or gram[-1] in ENGLISH_STOP_WORDS:
+                continue
+            if all(w.isdigit() for w in gram):
+                continue
+            phrase = ' '.join(gram)
+            counts[phrase] += 1
+            first_seen.setdefault(phrase, len(first_seen))
+
+    phrases = list(first_seen)
+    if not phrases:
+        # Nothing but stopwords/numbers: fall back to the raw words so callers still get a query
+        return list(dict.fromkeys(words))[:max_candidates]
+    if len(phrases) > max_candidates:
+        phrases = sorted(phrases, key=lambda p: (-counts[p], first_seen[p]))[:max_candidates]
+        phrases.sort(key=first_seen.get)
+    return phrases
+
+
+class PhraseEmbeddingCache:
+    """Process-wide LRU of normalized phrase embeddings; misses are encoded in fixed-size batches."""
+
+    def __init__(self, model, capacity: int = PHRASE_CACHE_SIZE, batch_size: int = ENCODE_BATCH_SIZE):
+        self.model = model
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, phrases: Sequence[str]) -> np.ndarray:
+        """Return an L2-normalized (len(phrases), dim) matrix, encoding only uncached phrases"""
+        keys = [normalize_phrase(p) for p in phrases]
+        with self._lock:
+            missing = [k for k in dict.fromkeys(keys) if k not in self._vectors]
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            vectors = np.atleast_2d(np.asarray(self.model.encode(batch), dtype=np.float32))
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            vectors = vectors / norms
+            with self._lock:
+                for key, vec in zip(batch, vectors):
+                    self._vectors[key] = vec
+                    self._vectors.move_to_end(key)
+                while len(self._vectors) > self.capacity:
+                    self._vectors.popitem(last=False)
+
+        # A phrase may have been evicted between batches on a tiny cache; re-encode it directly
+        rows = []
+        with self._lock:
+            for key in keys:
+                vec = self._vectors.get(key)
+                if vec is not None:
+                    self._vectors.move_to_end(key)
+                rows.append(vec)
+        for i, vec in enumerate(rows):
+            if vec is None:
+                vec = np.asarray(self.model.encode([keys[i]]), dtype=np.float32)[0]
+                rows[i] = vec / (np.linalg.norm(vec) or 1.0)
+        return np.vstack(rows)
+
+
+class KeywordExtractor:
+    """Ranks an idea's bounded candidate phrases by cosine similarity to the idea vector."""
+
+    def __init__(self, model, cache: PhraseEmbeddingCache = None, max_candidates: int = MAX_CANDIDATES):
+        self.cache = cache or PhraseEmbeddingCache(model)
+        self.max_candidates = max_candidates
+
+    def extract(self, idea: str, idea_vector: np.ndarray, top_n: int = 5) -> List[str]:
+        candidates = candidate_phrases(idea, self.max_candidates)
+        if not candidates:
+            return []
+        scores = self.cache.encode(candidates) @ idea_vector
+        order = np.argsort(-scores, kind="stable")[:top_n]
+        return [candidates[i] for i in order]
@@ -0,0 +1,70 @@
+"""
+latency_budget.py
+
+Per-request latency budgets for idea scoring.
+
+A Deadline is created when a request starts, from the endpoint's default
+budget or the client's X-Latency-Budget-Ms header, and travels with the
+ScoringSession. Every external source call is bounded by
+min(its own timeout, time left on the deadline); a source that misses it falls
+back to its last cached value (or the neutral 40) and is reported as degraded.
+"""
+
+import math
+import os
+import time
+from typing import Optional
+
+LATENCY_BUDGET_HEADER = "X-Latency-Budget-Ms"
+
+DEFAULT_BUDGET_MS = int(os.getenv("LATENCY_BUDGET_DEFAULT_MS", "20000"))
+MIN_BUDGET_MS = int(os.getenv("LATENCY_BUDGET_MIN_MS", "500"))
+MAX_BUDGET_MS = int(os.getenv("LATENCY_BUDGET_MAX_MS", "60000"))
+
+# Default budget per endpoint (milliseconds)
+ENDPOINT_BUDGETS_MS = {
+    "/api/quick-validate": int(os.getenv("LATENCY_BUDGET_QUICK_VALIDATE_MS", "8000")),
+    "/api/validate-idea": int(os.getenv("LATENCY_BUDGET_VALIDATE_IDEA_MS", "20000")),
+    "/api/analyze-idea": int(os.getenv("LATENCY_BUDGET_ANALYZE_IDEA_MS", "25000")),
+    "/api/validate-batch": int(os.getenv("LATENCY_BUDGET_VALIDATE_BATCH_MS", "20000")),
+}
+
+
+class Deadline:
+    """Absolute point in time by which a request's scoring must finish."""
+
+    def __init__(self, budget_seconds: float):
+        self.budget = budget_seconds
+        self.started = time.monotonic()
+        self.expires_at = self.started + budget_seconds
+
+    @property
+    def budget_ms(self) -> int:
+        return int(self.budget * 1000)
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def clamp(self, timeout: Optional[float]) -> float:
+        """The smaller of timeout and the time left"""
+        remaining = self.remaining()
+        return remaining if timeout is None else min(timeout, remaining)
+
+
+def budget_ms_for(endpoint: str, header_value: Optional[str] = None) -> int:
+    """Header value (clamped to [MIN, MAX]) when a finite number, otherwise the endpoint default"""
+    if header_value:
+        try:
+            value = float(header_value)
+        except ValueError:
+            value = None
+        if value is not None and math.isfinite(value):
+            return max(MIN_BUDGET_MS, min(int(value), MAX_BUDGET_MS))
+    return ENDPOINT_BUDGETS_MS.get(endpoint, DEFAULT_BUDGET_MS)
+
+
+def deadline_for(endpoint: str, header_value: Optional[str] = None) -> Deadline:
+    return Deadline(budget_ms_for(endpoint, header_value) / 1000.0)
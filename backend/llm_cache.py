@@ -0,0 +1,154 @@
+"""
+llm_cache.py
+
+Content-addressed cache of LLM responses for LLMClient.chat/generate.
+
+Entries are keyed by a SHA-256 of (provider, model, canonical request
+payload). The payload carries the messages/contents, temperature, max_tokens
+and any other generation settings, so two calls share an entry only when
+they would send byte-identical requests. A bounded in-memory LRU answers
+repeated prompts in microseconds, and the `llm_cache` table of wave_admin.db
+keeps them across restarts until LLM_CACHE_TTL_SECONDS; a background thread
+deletes expired rows every LLM_CACHE_PURGE_INTERVAL_SECONDS so the table
+stays bounded. Creative call sites opt out per call with cache=False.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("llm_cache")
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") not in ("0", "false", "False")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "512"))
+LLM_CACHE_PURGE_INTERVAL_SECONDS = float(os.getenv("LLM_CACHE_PURGE_INTERVAL_SECONDS", "3600"))
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+  key TEXT PRIMARY KEY,
+  provider TEXT NOT NULL,
+  model TEXT,
+  response TEXT NOT NULL,
+  created_at REAL NOT NULL
+)
+"""
+
+
+def cache_key(provider: str, model: Optional[str], payload: Dict[str, Any]) -> str:
+    """SHA-256 of the provider, model and canonical JSON of the request payload"""
+    canonical = json.dumps({"provider": provider, "model": model, "payload": payload},
+                           sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """In-memory LRU in front of a SQLite table, both expiring after ttl seconds."""
+
+    def __init__(self, db_path: Optional[str], ttl: int = LLM_CACHE_TTL_SECONDS,
+                 max_entries: int = LLM_CACHE_MEMORY_ENTRIES):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()  # key -> (created_at, response)
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "purged": 0}
+        self._stop = threading.Event()
+        self._purger: Optional[threading.Thread] = None
+        if db_path:
+            self.ensure_table()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+
+    def ensure_table(self):
+        with self._connect() as conn:
+            conn.execute(CREATE_TABLE_SQL)
+
+    def _remember(self, key: str, created_at: float, response: str):
+        with self._lock:
+            self._memory[key] = (created_at, response)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for key if younger than the TTL, else None"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+        row = None
+        if self.db_path:
+            try:
+                with self._connect() as conn:
+                    row = conn.execute("SELECT response, created_at FROM llm_cache WHERE key = ?",
+                                       (key,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("llm cache read failed: %s", e)
+        if row is None or now - row[1] >= self.ttl:
+            self.stats["misses"] += 1
+            return None
+        self._remember(key, row[1], row[0])
+        self.stats["disk_hits"] += 1
+        return row[0]
+
+    def put(self, key: str, provider: str, model: Optional[str], response: str):
+        created_at = time.time()
+        self._remember(key, created_at, response)
+        self.stats["stores"] += 1
+        if not self.db_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, provider, model, response, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, provider, model, response, created_at),
+                )
+        except sqlite3.Error as e:
+            logger.warning("llm cache write failed: %s", e)
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from the table; returns how many were removed"""
+        if not self.db_path:
+            return 0
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM llm_cache WHERE created_at < ?",
+                                (time.time() - self.ttl,)).rowcount
+
+    def _purge_loop(self, interval: float):
+        # First purge right away, so rows that expired while the server was down go at startup
+        while True:
+            try:
+                self.stats["purged"] += self.purge_expired()
+            except sqlite3.Error as e:
+                logger.warning("llm cache purge failed: %s", e)
+            if self._stop.wait(interval):
+                return
+
+    def start_purging(self, interval: float = LLM_CACHE_PURGE_INTERVAL_SECONDS):
+        """Delete expired rows now and then every interval seconds, on a daemon thread"""
+        if not self.db_path or (self._purger is not None and self._purger.is_alive()):
+            return
+        self._stop.clear()
+        self._purger = threading.Thread(target=self._purge_loop, args=(interval,), name="llm-cache-purge", daemon=True)
+        self._purger.start()
+
+    def stop_purging(self):
+        self._stop.set()
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._memory)
+        return dict(self.stats, memory_entries=size, ttl_seconds=self.ttl)
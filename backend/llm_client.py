@@ -0,0 +1,391 @@
+"""
+llm_client.py
+
+Shared client for the LLM providers used by app.py and codegen_api.py
+(Groq, Gemini, Perplexity, DeepSeek).
+
+Every provider gets one long-lived requests.Session with its own keep-alive
+connection pool, so consecutive calls reuse an open TCP+TLS connection
+instead of paying a new handshake each time. Timeouts, retries (connection
+errors and 429/5xx, honouring Retry-After) and response parsing are the same
+for every call site:
+
+    text = llm_client.chat("groq", {"model": "llama-3.3-70b-versatile", "messages": messages})
+    text = llm_client.generate("gemini-2.0-flash", {"contents": [{"parts": [{"text": prompt}]}]})
+
+Both raise LLMError when the provider answers with an error status or a
+response that has no text. When a response cache is attached (see
+llm_cache.py) successful texts are cached by request content; pass
+cache=False for creative calls that should vary between identical prompts.
+
+Each provider also has a circuit breaker (see circuit_breaker.py). While a
+provider's breaker is open its calls fail fast with CircuitOpenError, or are
+sent to ALTERNATE_PROVIDERS (request translated between the OpenAI and Gemini
+formats) when that provider's breaker is closed.
+
+stream_chat()/stream_generate() yield the text of a completion chunk by chunk
+as the provider streams it (OpenAI-style SSE deltas, Gemini
+streamGenerateContent?alt=sse); the assembled text is cached like chat().
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import closing
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from circuit_breaker import BreakerRegistry, OPEN
+from llm_cache import LLMResponseCache, cache_key
+
+logger = logging.getLogger("llm_client")
+
+OPENAI_COMPATIBLE_URLS = {
+    "groq": "https://api.groq.com/openai/v1/chat/completions",
+    "perplexity": "https://api.perplexity.ai/chat/completions",
+    "deepseek": "https://api.deepseek.com/v1/chat/completions",
+}
+GEMINI_URL = "https://generativelanguage.googleapis.com/{version}/models/{model}:{method}"
+PROVIDER_KEY_ENV = {
+    "groq": "GROQ_API_KEY",
+    "perplexity": "PERPLEXITY_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+}
+
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "30"))
+CONNECT_TIMEOUT_SECONDS = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5"))
+MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+RETRY_BACKOFF_SECONDS = float(os.getenv("LLM_RETRY_BACKOFF_SECONDS", "0.5"))
+# Longest a retried call sleeps on a provider's Retry-After header
+RETRY_AFTER_MAX_SECONDS = float(os.getenv("LLM_RETRY_AFTER_MAX_SECONDS", "2"))
+POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "10"))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Where a provider's calls go while its breaker is open: provider -> (alternate, model)
+ALTERNATE_PROVIDERS = {
+    "groq": ("gemini", "gemini-1.5-flash-latest"),
+    "perplexity": ("groq", "llama-3.3-70b-versatile"),
+    "deepseek": ("groq", "llama-3.3-70b-versatile"),
+    "gemini": ("groq", "llama-3.3-70b-versatile"),
+}
+
+
+class CappedRetry(Retry):
+    """Retry that honours Retry-After only up to RETRY_AFTER_MAX_SECONDS, so a 429 cannot stall a call"""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX_SECONDS)
+
+
+class LLMError(Exception):
+    """A provider call that failed or returned no usable text."""
+
+    def __init__(self, provider: str, message: str, status_code: Optional[int] = None, body: str = ""):
+        super().__init__(f"{provider} API error: {message}")
+        self.provider = provider
+        self.status_code = status_code
+        self.body = body
+
+
+class CircuitOpenError(LLMError):
+    """The provider's circuit breaker is open, so the call was not attempted."""
+
+    def __init__(self, provider: str):
+        super().__init__(provider, "circuit open")
+
+
+def openai_text(data: Dict[str, Any]) -> Optional[str]:
+    """choices[0].message.content of an OpenAI-style chat completion"""
+    try:
+        return data["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def openai_delta(data: Dict[str, Any]) -> Optional[str]:
+    """choices[0].delta.content of an OpenAI-style stream chunk"""
+    try:
+        return data["choices"][0]["delta"].get("content")
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return None
+
+
+def gemini_text(data: Dict[str, Any]) -> Optional[str]:
+    """Text of the first candidate of a Gemini generateContent response"""
+    try:
+        return data["candidates"][0]["content"]["parts"][0]["text"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+def openai_to_gemini(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """generateContent body equivalent to an OpenAI-style chat payload"""
+    system = [m["content"] for m in payload.get("messages", []) if m.get("role") == "system"]
+    body: Dict[str, Any] = {
+        "contents": [
+            {"role": "model" if m.get("role") == "assistant" else "user", "parts": [{"text": m["content"]}]}
+            for m in payload.get("messages", []) if m.get("role") != "system"
+        ]
+    }
+    if system:
+        body["systemInstruction"] = {"parts": [{"text": "\n\n".join(system)}]}
+    config = {}
+    for src, dst in (("temperature", "temperature"), ("max_tokens", "maxOutputTokens"), ("top_p", "topP")):
+        if src in payload:
+            config[dst] = payload[src]
+    if (payload.get("response_format") or {}).get("type") == "json_object":
+        config["responseMimeType"] = "application/json"
+    if config:
+        body["generationConfig"] = config
+    return body
+
+
+def gemini_to_openai(payload: Dict[str, Any], model: str) -> Dict[str, Any]:
+    """OpenAI-style chat payload equivalent to a generateContent body"""
+    messages = []
+    system = payload.get("systemInstruction") or payload.get("system_instruction")
+    if system:
+        messages.append({"role": "system", "content": "".join(p.get("text", "") for p in system.get("parts", []))})
+    for content in payload.get("contents", []):
+        messages.append({
+            "role": "assistant" if content.get("role") == "model" else "user",
+            "content": "".join(p.get("text", "") for p in content.get("parts", [])),
+        })
+    body: Dict[str, Any] = {"model": model, "messages": messages}
+    config = payload.get("generationConfig") or {}
+    for src, dst in (("temperature", "temperature"), ("maxOutputTokens", "max_tokens"), ("topP", "top_p")):
+        if src in config:
+            body[dst] = config[src]
+    return body
+
+
+class LLMClient:
+    """Pooled, retrying HTTP client for every LLM provider."""
+
+    def __init__(self, api_keys: Optional[Dict[str, Optional[str]]] = None,
+                 timeout: float = DEFAULT_TIMEOUT_SECONDS, max_retries: int = MAX_RETRIES,
+                 pool_size: int = POOL_SIZE, cache: Optional[LLMResponseCache] = None,
+                 breakers: Optional[BreakerRegistry] = None):
+        self.api_keys = {p: k for p, k in (api_keys or {}).items() if k}
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.pool_size = pool_size
+        self.cache = cache
+        self.breakers = breakers or BreakerRegistry()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def session(self, provider: str) -> requests.Session:
+        """The provider's keep-alive session (created on first use)"""
+        with self._lock:
+            session = self._sessions.get(provider)
+            if session is None:
+                # A read timeout may mean the provider is still generating (and billing) the
+                # completion, so only connect errors and 429/5xx answers are retried
+                retry = CappedRetry(
+                    total=self.max_retries,
+                    connect=self.max_retries,
+                    read=False,
+                    status=self.max_retries,
+                    backoff_factor=RETRY_BACKOFF_SECONDS,
+                    status_forcelist=RETRY_STATUSES,
+                    allowed_methods=frozenset(["POST"]),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                self._sessions[provider] = session
+            return session
+
+    def api_key(self, provider: str) -> str:
+        # Read from the environment per call so keys loaded by load_dotenv() after import apply
+        return self.api_keys.get(provider) or os.getenv(PROVIDER_KEY_ENV[provider], "")
+
+    def _timeout(self, timeout: Optional[float]):
+        return (CONNECT_TIMEOUT_SECONDS, timeout or self.timeout)
+
+    def post(self, provider: str, url: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+             headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+        """
+        Raw pooled POST for call sites that need the response itself (e.g. streaming).
+        Raises CircuitOpenError without calling out while the provider's breaker is open.
+        """
+        breaker = self.breakers.get(provider)
+        if not breaker.allow():
+            raise CircuitOpenError(provider)
+        start = time.monotonic()
+        try:
+            response = self.session(provider).post(url, json=payload, headers=headers,
+                                                   timeout=self._timeout(timeout), **kwargs)
+        except requests.RequestException:
+            breaker.record(False, time.monotonic() - start)
+            raise
+        # Client errors (bad key, bad request) say nothing about the provider's health
+        breaker.record(response.status_code not in RETRY_STATUSES, time.monotonic() - start)
+        return response
+
+    def _json(self, provider: str, response: requests.Response) -> Dict[str, Any]:
+        if not response.ok:
+            logger.warning("%s returned %s: %s", provider, response.status_code, response.text[:300])
+            raise LLMError(provider, str(response.status_code), response.status_code, response.text)
+        try:
+            return response.json()
+        except ValueError:
+            raise LLMError(provider, "invalid JSON response", response.status_code, response.text)
+
+    def openai_request(self, provider: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+                       api_key: Optional[str] = None, **kwargs) -> requests.Response:
+        headers = {
+            "Authorization": f"Bearer {api_key or self.api_key(provider)}",
+            "Content-Type": "application/json",
+        }
+        return self.post(provider, OPENAI_COMPATIBLE_URLS[provider], payload, timeout, headers, **kwargs)
+
+    def _alternate(self, provider: str, alternate: bool) -> Optional[Tuple[str, str]]:
+        """(alternate provider, model) to use instead of an unavailable provider, if any"""
+        if not alternate or provider not in ALTERNATE_PROVIDERS:
+            return None
+        target = ALTERNATE_PROVIDERS[provider]
+        if self.breakers.get(target[0]).state() == OPEN or not self.api_key(target[0]):
+            return None
+        logger.info("%s circuit open, sending call to %s", provider, target[0])
+        return target
+
+    def cached_text(self, provider: str, model: Optional[str], payload: Dict[str, Any]) -> Optional[str]:
+        """Cached response for this exact request, without calling the provider (None if absent)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(cache_key(provider, model, payload))
+
+    def store_text(self, provider: str, model: Optional[str], payload: Dict[str, Any], text: str):
+        if self.cache is not None and text:
+            self.cache.put(cache_key(provider, model, payload), provider, model, text)
+
+    def _cached(self, provider: str, model: Optional[str], payload: Dict[str, Any],
+                cache: bool, call: Callable[[], str]) -> str:
+        if not cache or self.cache is None:
+            return call()
+        key = cache_key(provider, model, payload)
+        text = self.cache.get(key)
+        if text is None:
+            text = call()
+            self.cache.put(key, provider, model, text)
+        return text
+
+    def _chat(self, provider: str, payload: Dict[str, Any], timeout: Optional[float],
+              api_key: Optional[str]) -> str:
+        data = self._json(provider, self.openai_request(provider, payload, timeout, api_key))
+        text = openai_text(data)
+        if text is None:
+            raise LLMError(provider, "no choices in response", 200, str(data)[:300])
+        return text
+
+    def chat(self, provider: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+             api_key: Optional[str] = None, cache: bool = True, alternate: bool = True) -> str:
+        """Text of an OpenAI-compatible chat completion (Groq, Perplexity, DeepSeek)"""
+        try:
+            return self._cached(provider, payload.get("model"), payload, cache,
+                                lambda: self._chat(provider, payload, timeout, api_key))
+        except CircuitOpenError:
+            target = self._alternate(provider, alternate)
+            if target is None:
+                raise
+            if target[0] == "gemini":
+                return self.generate(target[1], openai_to_gemini(payload), timeout, cache=cache, alternate=False)
+            return self.chat(target[0], dict(payload, model=target[1]), timeout, cache=cache, alternate=False)
+
+    def gemini_request(self, model: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+                       version: str = "v1beta", api_key: Optional[str] = None, method: str = "generateContent",
+                       **kwargs) -> requests.Response:
+        url = GEMINI_URL.format(version=version, model=model, method=method)
+        headers = {"Content-Type": "application/json",
+                   "x-goog-api-key": api_key or self.api_key("gemini")}
+        return self.post("gemini", url, payload, timeout, headers, **kwargs)
+
+    def _generate(self, model: str, payload: Dict[str, Any], timeout: Optional[float],
+                  version: str, api_key: Optional[str]) -> str:
+        data = self._json("gemini", self.gemini_request(model, payload, timeout, version, api_key))
+        text = gemini_text(data)
+        if text is None:
+            raise LLMError("gemini", "no candidates in response", 200, str(data)[:300])
+        return text
+
+    def generate(self, model: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+                 version: str = "v1beta", api_key: Optional[str] = None, cache: bool = True,
+                 alternate: bool = True) -> str:
+        """Text of a Gemini generateContent call"""
+        try:
+            return self._cached("gemini", model, payload, cache,
+                                lambda: self._generate(model, payload, timeout, version, api_key))
+        except CircuitOpenError:
+            target = self._alternate("gemini", alternate)
+            if target is None:
+                raise
+            return self.chat(target[0], gemini_to_openai(payload, target[1]), timeout, cache=cache, alternate=False)
+
+
+    def _stream(self, provider: str, response: requests.Response,
+                extract: Callable[[Dict[str, Any]], Optional[str]]) -> Iterator[str]:
+        """Text pieces of an SSE response; the connection goes back to the pool when done"""
+        with closing(response):
+            if not response.ok:
+                logger.warning("%s returned %s: %s", provider, response.status_code, response.text[:300])
+                raise LLMError(provider, str(response.status_code), response.status_code, response.text)
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    text = extract(json.loads(data))
+                except ValueError:
+                    continue
+                if text:
+                    yield text
+
+    def _cached_stream(self, provider: str, model: Optional[str], payload: Dict[str, Any], cache: bool,
+                       open_stream: Callable[[], Iterator[str]]) -> Iterator[str]:
+        key = cache_key(provider, model, payload) if cache and self.cache is not None else None
+        if key is not None:
+            text = self.cache.get(key)
+            if text is not None:
+                yield text
+                return
+        pieces = []
+        for piece in open_stream():
+            pieces.append(piece)
+            yield piece
+        if key is not None and pieces:
+            self.cache.put(key, provider, model, "".join(pieces))
+
+    def stream_chat(self, provider: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+                    api_key: Optional[str] = None, cache: bool = True) -> Iterator[str]:
+        """Text pieces of a streamed OpenAI-compatible chat completion"""
+        def open_stream():
+            response = self.openai_request(provider, dict(payload, stream=True), timeout, api_key, stream=True)
+            return self._stream(provider, response, openai_delta)
+
+        return self._cached_stream(provider, payload.get("model"), payload, cache, open_stream)
+
+    def stream_generate(self, model: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+                        version: str = "v1beta", api_key: Optional[str] = None, cache: bool = True) -> Iterator[str]:
+        """Text pieces of a Gemini streamGenerateContent call"""
+        def open_stream():
+            response = self.gemini_request(model, payload, timeout, version, api_key, method="streamGenerateContent",
+                                           params={"alt": "sse"}, stream=True)
+            return self._stream("gemini", response, gemini_text)
+
+        return self._cached_stream("gemini", model, payload, cache, open_stream)
+
+
+llm_client = LLMClient()
@@ -0,0 +1,275 @@
+"""
+llm_router.py
+
+Latency-aware routing of interchangeable chat requests across LLM providers.
+
+For prompts that any of several (provider, model) routes can answer equally
+well (casual chat, idea explanations), LLMRouter keeps an EWMA of latency and
+error rate per route and sends each request to the fastest healthy one. A
+route is unhealthy while its circuit breaker is open, its key is missing or
+its error EWMA is above ROUTER_MAX_ERROR_RATE. Routes without samples yet are
+ranked at ROUTER_PRIOR_LATENCY_SECONDS. The error EWMA also decays toward zero
+with a half-life of ROUTER_ERROR_HALF_LIFE_SECONDS, so a route that was ruled
+out gets a fresh request once it has been left alone long enough.
+
+Responses already in the LLM cache are returned before any route is called
+and do not count towards route statistics, which only describe real calls.
+
+With hedging on, if the chosen route has not answered by its p90 latency a
+second request goes to the next-best route and whichever answers first wins.
+A route that fails outright is replaced by the next one straight away. The
+losing request is left to finish in the background so its latency still
+updates the route's statistics.
+
+stream() picks a route the same way but streams the completion; a route that
+fails before its first token is skipped for the next one.
+
+Requests are OpenAI-style chat payloads without a model; Gemini routes get
+them translated by llm_client.openai_to_gemini.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from circuit_breaker import OPEN
+from llm_client import LLMClient, openai_to_gemini
+
+logger = logging.getLogger("llm_router")
+
+ROUTER_EWMA_ALPHA = float(os.getenv("LLM_ROUTER_EWMA_ALPHA", "0.2"))
+ROUTER_MAX_ERROR_RATE = float(os.getenv("LLM_ROUTER_MAX_ERROR_RATE", "0.5"))
+ROUTER_PRIOR_LATENCY_SECONDS = float(os.getenv("LLM_ROUTER_PRIOR_LATENCY_SECONDS", "2"))
+ROUTER_ERROR_HALF_LIFE_SECONDS = float(os.getenv("LLM_ROUTER_ERROR_HALF_LIFE_SECONDS", "60"))
+ROUTER_HEDGE_ENABLED = os.getenv("LLM_ROUTER_HEDGE", "1") not in ("0", "false", "False")
+ROUTER_HEDGE_MIN_SECONDS = float(os.getenv("LLM_ROUTER_HEDGE_MIN_SECONDS", "0.5"))
+ROUTER_HEDGE_MIN_SAMPLES = 10  # below this the p90 is not trusted and the prior is used
+ROUTER_LATENCY_SAMPLES = 200
+ROUTER_WORKERS = int(os.getenv("LLM_ROUTER_WORKERS", "8"))
+
+
+class RouteStats:
+    """EWMA latency/error rate and recent latencies of one (provider, model) route."""
+
+    def __init__(self, alpha: float = ROUTER_EWMA_ALPHA, error_half_life: float = ROUTER_ERROR_HALF_LIFE_SECONDS,
+                 clock=time.monotonic):
+        self.alpha = alpha
+        self.error_half_life = error_half_life
+        self.clock = clock
+        self.latency: Optional[float] = None
+        self.calls = 0
+        self._error_rate = 0.0
+        self._error_updated = clock()
+        self._recent: deque = deque(maxlen=ROUTER_LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def _decayed_error_rate(self, now: float) -> float:
+        if self.error_half_life <= 0:
+            return self._error_rate
+        return self._error_rate * 0.5 ** ((now - self._error_updated) / self.error_half_life)
+
+    @property
+    def error_rate(self) -> float:
+        """Error EWMA, decayed for the time since the last call"""
+        with self._lock:
+            return self._decayed_error_rate(self.clock())
+
+    def record(self, ok: bool, latency: float):
+        now = self.clock()
+        with self._lock:
+            self.calls += 1
+            error_rate = self._decayed_error_rate(now)
+            self._error_rate = error_rate + self.alpha * ((0.0 if ok else 1.0) - error_rate)
+            self._error_updated = now
+            if ok:
+                self.latency = latency if self.latency is None else self.latency + self.alpha * (latency - self.latency)
+                self._recent.append(latency)
+
+    def p90(self) -> Optional[float]:
+        with self._lock:
+            if len(self._recent) < ROUTER_HEDGE_MIN_SAMPLES:
+                return None
+            ordered = sorted(self._recent)
+        return ordered[int(0.9 * (len(ordered) - 1))]
+
+
+class LLMRouter:
+    """Picks the fastest healthy route per request, optionally hedging slow ones."""
+
+    def __init__(self, client: LLMClient, routes: List[Tuple[str, str]], hedge: bool = ROUTER_HEDGE_ENABLED,
+                 max_error_rate: float = ROUTER_MAX_ERROR_RATE, prior_latency: float = ROUTER_PRIOR_LATENCY_SECONDS,
+                 hedge_min: float = ROUTER_HEDGE_MIN_SECONDS, max_workers: int = ROUTER_WORKERS):
+        self.client = client
+        self.routes = list(routes)
+        self.hedge = hedge
+        self.max_error_rate = max_error_rate
+        self.prior_latency = prior_latency
+        self.hedge_min = hedge_min
+        self.stats: Dict[Tuple[str, str], RouteStats] = {route: RouteStats() for route in self.routes}
+        self.hedges = {"fired": 0, "won": 0}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-router")
+
+    def healthy(self, route: Tuple[str, str]) -> bool:
+        provider = route[0]
+        return (self.client.breakers.get(provider).state() != OPEN and bool(self.client.api_key(provider))
+                and self.stats[route].error_rate < self.max_error_rate)
+
+    def ranked(self) -> List[Tuple[str, str]]:
+        """Healthy routes fastest first (all routes, by error rate, if none is healthy)"""
+        def expected(route):
+            stats = self.stats[route]
+            return stats.latency if stats.latency is not None else self.prior_latency
+
+        healthy = [route for route in self.routes if self.healthy(route)]
+        if healthy:
+            return sorted(healthy, key=expected)
+        return sorted(self.routes, key=lambda route: self.stats[route].error_rate)
+
+    def hedge_delay(self, route: Tuple[str, str]) -> float:
+        p90 = self.stats[route].p90()
+        return max(self.hedge_min, p90 if p90 is not None else self.prior_latency)
+
+    @staticmethod
+    def _request(route: Tuple[str, str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """The payload as sent to this route (also its LLM cache key)"""
+        provider, model = route
+        return openai_to_gemini(payload) if provider == "gemini" else dict(payload, model=model)
+
+    def _cached(self, routes: List[Tuple[str, str]], payload: Dict[str, Any]) -> Optional[Tuple[Tuple[str, str], str]]:
+        """(route, text) of the first route with this prompt in the LLM cache"""
+        for route in routes:
+            text = self.client.cached_text(route[0], route[1], self._request(route, payload))
+            if text is not None:
+                return route, text
+        return None
+
+    def _call(self, route: Tuple[str, str], payload: Dict[str, Any], timeout: Optional[float], cache: bool) -> str:
+        provider, model = route
+        request = self._request(route, payload)
+        start = time.monotonic()
+        try:
+            # The cache is consulted in complete(), so only real provider calls are timed here
+            if provider == "gemini":
+                text = self.client.generate(model, request, timeout, cache=False, alternate=False)
+            else:
+                text = self.client.chat(provider, request, timeout, cache=False, alternate=False)
+        except Exception:
+            self.stats[route].record(False, time.monotonic() - start)
+            raise
+        self.stats[route].record(True, time.monotonic() - start)
+        if cache:
+            self.client.store_text(provider, model, request, text)
+        return text
+
+    def complete(self, payload: Dict[str, Any], timeout: Optional[float] = None, hedge: Optional[bool] = None,
+                 cache: bool = True) -> Tuple[str, str]:
+        """
+        (text, "provider:model") for an OpenAI-style payload without a model.
+        Raises the last route's error when every attempted route fails.
+        """
+        hedge = self.hedge if hedge is None else hedge
+        candidates = self.ranked()
+        hit = self._cached(candidates, payload) if cache else None
+        if hit is not None:
+            return hit[1], f"{hit[0][0]}:{hit[0][1]}"
+        pending = {}
+        hedged = set()
+        last_error: Optional[Exception] = None
+
+        def launch():
+            route = candidates.pop(0)
+            pending[self._executor.submit(self._call, route, payload, timeout, cache)] = route
+            return route
+
+        launch()
+        while pending:
+            # With a single request in flight, wait only as long as its route's p90 before hedging
+            current = next(iter(pending.values()))
+            can_hedge = hedge and candidates and len(pending) == 1
+            done, _ = wait(list(pending), timeout=self.hedge_delay(current) if can_hedge else None,
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                self.hedges["fired"] += 1
+                hedged.add(launch())
+                continue
+            for future in done:
+                route = pending.pop(future)
+                try:
+                    text = future.result()
+                except Exception as e:
+                    logger.warning("%s:%s failed: %s", route[0], route[1], e)
+                    last_error = e
+                    continue
+                if route in hedged:
+                    self.hedges["won"] += 1
+                return text, f"{route[0]}:{route[1]}"
+            if not pending and candidates:
+                launch()
+        raise last_error
+
+    def _open_stream(self, route: Tuple[str, str], payload: Dict[str, Any], timeout: Optional[float]) -> Iterator[str]:
+        provider, model = route
+        if provider == "gemini":
+            return self.client.stream_generate(model, self._request(route, payload), timeout, cache=False)
+        return self.client.stream_chat(provider, self._request(route, payload), timeout, cache=False)
+
+    def _relay(self, route: Tuple[str, str], payload: Dict[str, Any], cache: bool, start: float,
+               first: Optional[str], pieces: Iterator[str]) -> Iterator[str]:
+        text = []
+        try:
+            if first:
+                text.append(first)
+                yield first
+            for piece in pieces:
+                text.append(piece)
+                yield piece
+        except GeneratorExit:
+            # The client went away: not the route's fault, and the text is incomplete
+            pieces.close()
+            raise
+        except Exception:
+            self.stats[route].record(False, time.monotonic() - start)
+            raise
+        self.stats[route].record(True, time.monotonic() - start)
+        if cache:
+            self.client.store_text(route[0], route[1], self._request(route, payload), "".join(text))
+
+    def stream(self, payload: Dict[str, Any], timeout: Optional[float] = None,
+               cache: bool = True) -> Tuple[str, Iterator[str]]:
+        """
+        ("provider:model", text pieces) streamed from the fastest healthy route.
+        Raises the last route's error when every route fails before its first token.
+        """
+        candidates = self.ranked()
+        hit = self._cached(candidates, payload) if cache else None
+        if hit is not None:
+            return f"{hit[0][0]}:{hit[0][1]}", iter([hit[1]])
+        last_error: Optional[Exception] = None
+        for route in candidates:
+            start = time.monotonic()
+            pieces = self._open_stream(route, payload, timeout)
+            try:
+                first = next(pieces, None)
+            except Exception as e:
+                logger.warning("%s:%s stream failed: %s", route[0], route[1], e)
+                self.stats[route].record(False, time.monotonic() - start)
+                last_error = e
+                continue
+            return f"{route[0]}:{route[1]}", self._relay(route, payload, cache, start, first, pieces)
+        raise last_error
+
+    def snapshot(self) -> Dict[str, Any]:
+        routes = {}
+        for route, stats in self.stats.items():
+            routes[f"{route[0]}:{route[1]}"] = {
+                "healthy": self.healthy(route),
+                "ewma_latency_ms": int(stats.latency * 1000) if stats.latency is not None else None,
+                "error_rate": round(stats.error_rate, 3),
+                "p90_ms": int(stats.p90() * 1000) if stats.p90() is not None else None,
+                "calls": stats.calls,
+            }
+        return {"routes": routes, "hedges": dict(self.hedges)}
@@ -0,0 +1,95 @@
+"""
+local_scorer.py
+
+Network-free fast-path scorer for /api/quick-validate?mode=fast.
+
+Market and technical scores are estimated from TF-IDF similarity between the
+idea and the local datasets loaded by load_datasets (financial headlines and
+the tech survey). Each corpus is transformed once into a sparse, L2-normalized
+document matrix, so scoring an idea is one sparse matrix-vector product per
+corpus - tens of milliseconds, suitable as a first-pass filter before the
+live-API path. There is no local competition data, so competition is the
+documented neutral 40.
+"""
+
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+NEUTRAL_SCORE = 40
+# Cosine similarity at which a document counts as a match for the idea
+MATCH_THRESHOLD = float(os.getenv("FAST_SCORE_MATCH_THRESHOLD", "0.2"))
+TOP_K = 5
+
+
+class TfidfCorpus:
+    """A fitted TF-IDF vectorizer plus the precomputed sparse matrix of its documents."""
+
+    def __init__(self, texts: Iterable[str], vectorizer: Optional[TfidfVectorizer] = None, max_features: int = 1000):
+        texts = [t for t in texts if t and t.strip()]
+        if vectorizer is None:
+            vectorizer = TfidfVectorizer(max_features=max_features, stop_words='english')
+            vectorizer.fit(texts)
+        self.vectorizer = vectorizer
+        self.matrix = vectorizer.transform(texts).tocsr()  # rows are L2-normalized
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def similarities(self, text: str) -> np.ndarray:
+        """Cosine similarity of text to every document"""
+        query = self.vectorizer.transform([text])
+        if query.nnz == 0:
+            return np.zeros(self.matrix.shape[0])
+        return (self.matrix @ query.T).toarray().ravel()
+
+
+def match_stats(similarities: np.ndarray, threshold: float = MATCH_THRESHOLD, top_k: int = TOP_K):
+    """(number of documents at or above threshold, mean of the top_k similarities)"""
+    if not len(similarities):
+        return 0, 0.0
+    matches = int(np.count_nonzero(similarities >= threshold))
+    k = min(top_k, len(similarities))
+    top = np.partition(similarities, -k)[-k:]
+    return matches, float(top.mean())
+
+
+class FastScorer:
+    def __init__(self, financial: Optional[TfidfCorpus], tech: Optional[TfidfCorpus]):
+        self.financial = financial
+        self.tech = tech
+
+    def market_score(self, idea: str) -> int:
+        """Headline coverage, bucketed like the NewsAPI article-count score"""
+        if self.financial is None or not len(self.financial):
+            return NEUTRAL_SCORE
+        matches, _ = match_stats(self.financial.similarities(idea))
+        if matches == 0:
+            return 40
+        elif matches < 20:
+            return 50
+        elif matches < 50:
+            return 70
+        elif matches < 75:
+            return 80
+        return 100
+
+    def technical_score(self, idea: str) -> int:
+        """How familiar the tech survey is with the idea: match volume (40) plus closeness of the best matches (60)"""
+        if self.tech is None or not len(self.tech):
+            return NEUTRAL_SCORE
+        matches, top_mean = match_stats(self.tech.similarities(idea))
+        if matches == 0:
+            return NEUTRAL_SCORE
+        volume = min(np.log10(matches + 1) / 3, 1) * 40
+        closeness = min(top_mean / 0.5, 1) * 60
+        return int(volume + closeness)
+
+    def component_scores(self, idea: str) -> Dict[str, int]:
+        return {
+            "market": self.market_score(idea),
+            "technical": self.technical_score(idea),
+            "competition": NEUTRAL_SCORE,
+        }
@@ -0,0 +1,168 @@
+"""
+news_counts.py
+
+NewsAPI article-count client for MarketPotential.get_newsapi_score.
+
+The score only reads totalResults, so every request asks for pageSize=1
+instead of 100 full articles. Counts are cached per normalized query for the
+current day (the 90-day window moves by a day at a time), and concurrent
+callers share one in-flight request.
+
+prefetch() screens many queries with grouped OR queries: a group whose OR
+query finds no articles proves every member's count is zero in one request,
+and non-empty groups are split in half until members are resolved. Keyword
+queries often match nothing, but grouping only saves requests when most
+queries do, so the group size is picked from the zero rate observed so far
+(no grouping until zeros are common enough to pay for it). Given a request
+Deadline, screening stops once it expires and each OR request is clamped to
+the time left; whatever is unresolved is fetched per query while scoring.
+"""
+
+import logging
+import os
+import threading
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from latency_budget import Deadline
+from signal_fixtures import SignalFixtureStore, fixture_store
+from ttl_cache import TTLSingleFlightCache
+
+logger = logging.getLogger("news_counts")
+
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+WINDOW_DAYS = 90
+REQUEST_TIMEOUT_SECONDS = float(os.getenv("NEWSAPI_TIMEOUT_SECONDS", "10"))
+MAX_GROUP_SIZE = int(os.getenv("NEWSAPI_MAX_OR_GROUP", "8"))
+MAX_QUERY_LENGTH = 500  # NewsAPI's limit on q
+ZERO_RATE_PRIOR = float(os.getenv("NEWSAPI_ZERO_RATE_PRIOR", "0.5"))
+ZERO_RATE_ALPHA = 0.05
+MAX_CACHE_ENTRIES = 4096
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+def or_query(queries: List[str]) -> str:
+    return " OR ".join(f"({q})" for q in queries)
+
+
+def group_size(zero_rate: float, max_size: int = MAX_GROUP_SIZE) -> int:
+    """
+    Largest group size g for which one screening request is expected to save
+    requests: the group is all zeros with probability zero_rate**g, and
+    screening a non-empty group costs about one extra request, so g pays off
+    while zero_rate**g > 1/g. Returns 1 (no grouping) otherwise.
+    """
+    best = 1
+    for g in range(2, max_size + 1):
+        if zero_rate ** g > 1.0 / g:
+            best = g
+    return best
+
+
+class NewsCountClient:
+    """totalResults-only NewsAPI client with day-granular caching and OR-group screening."""
+
+    def __init__(self, api_key: Optional[str], timeout: float = REQUEST_TIMEOUT_SECONDS,
+                 fixtures: Optional[SignalFixtureStore] = None, max_group: int = MAX_GROUP_SIZE,
+                 zero_rate: float = ZERO_RATE_PRIOR, today: Callable[[], date] = date.today):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.fixtures = fixtures or fixture_store
+        self.max_group = max_group
+        self.zero_rate = zero_rate
+        self.today = today
+        self.session = requests.Session()
+        self._lock = threading.Lock()
+        # A day's TTL is an upper bound; keys also carry the date so counts roll over at midnight
+        self._cache = TTLSingleFlightCache(24 * 3600, MAX_CACHE_ENTRIES,
+                                           should_cache=lambda result: result.get("status_code") == 200)
+
+    def _key(self, query: str) -> str:
+        return f"{self.today().isoformat()}:{normalize_query(query)}"
+
+    def _observe(self, total: int):
+        with self._lock:
+            self.zero_rate += ZERO_RATE_ALPHA * ((1.0 if total == 0 else 0.0) - self.zero_rate)
+
+    def _request(self, q: str, api_key: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        params = {
+            "q": q,
+            "from": (self.today() - timedelta(days=WINDOW_DAYS)).strftime("%Y-%m-%d"),
+            "language": "en",
+            "pageSize": 1,
+            "apiKey": api_key or self.api_key,
+        }
+        response = self.session.get(NEWSAPI_URL, params=params, timeout=timeout or self.timeout)
+        if response.status_code != 200:
+            logger.warning("NewsAPI returned %s for %r", response.status_code, q)
+            return {"status_code": response.status_code, "totalResults": 0}
+        return {"status_code": 200, "totalResults": response.json().get("totalResults", 0)}
+
+    def _fetch(self, query: str, api_key: Optional[str]) -> Dict[str, Any]:
+        key = {"query": normalize_query(query), "days": WINDOW_DAYS}
+        result = self.fixtures.fetch("newsapi", key, lambda: self._request(query, api_key))
+        if result.get("status_code") == 200:
+            self._observe(result.get("totalResults", 0))
+        return result
+
+    def count(self, query: str, api_key: Optional[str] = None) -> Dict[str, Any]:
+        """{"status_code", "totalResults"} for the last WINDOW_DAYS days (recordable as a fixture)"""
+        return self._cache.get_or_load(self._key(query), lambda: self._fetch(query, api_key))
+
+    def _screen(self, queries: List[str], known_nonzero: bool = False, deadline: Optional[Deadline] = None) -> bool:
+        """
+        Resolve a group: zero for all if its OR query finds nothing, else split it
+        in half. Returns False only when every member is known to be zero.
+        """
+        if deadline is not None and deadline.expired():
+            return True  # out of time: left for count() while scoring
+        if len(queries) == 1:
+            if deadline is not None:
+                return True  # single queries are counted concurrently while scoring
+            return self.count(queries[0]).get("totalResults", 0) > 0
+        if not known_nonzero:
+            timeout = deadline.clamp(self.timeout) if deadline is not None else None
+            result = self._request(or_query(queries), timeout=timeout)
+            if result["status_code"] != 200:
+                return True  # left for count() to retry per query
+            if result["totalResults"] == 0:
+                for query in queries:
+                    self._observe(0)
+                    self._cache.put(self._key(query), {"status_code": 200, "totalResults": 0})
+                return False
+        middle = len(queries) // 2
+        first = self._screen(queries[:middle], deadline=deadline)
+        # A non-empty group whose first half is all zeros needs no probe for its second half
+        self._screen(queries[middle:], known_nonzero=not first, deadline=deadline)
+        return True
+
+    def prefetch(self, queries: Iterable[str], deadline: Optional[Deadline] = None):
+        """
+        Warm the day's cache for many queries, OR-grouping them when the observed
+        zero rate makes that cheaper, within deadline if given. A no-op while
+        fixtures record/replay per query or while zeros are too rare for grouping
+        to pay off.
+        """
+        if self.fixtures.active:
+            return
+        size = group_size(self.zero_rate, self.max_group)
+        if size == 1:
+            return  # per-query counts are fetched concurrently while scoring anyway
+        queries = [q for q in dict.fromkeys(normalize_query(q) for q in queries)
+                   if q and self._cache.peek(self._key(q)) is None]
+        start = 0
+        while start < len(queries) and not (deadline is not None and deadline.expired()):
+            group = [queries[start]]
+            while (len(group) < size and start + len(group) < len(queries)
+                   and len(or_query(group + [queries[start + len(group)]])) <= MAX_QUERY_LENGTH):
+                group.append(queries[start + len(group)])
+            start += len(group)
+            try:
+                self._screen(group, deadline=deadline)
+            except Exception as e:
+                logger.warning("NewsAPI prefetch failed for %d queries: %s", len(group), e)
@@ -0,0 +1,77 @@
+"""
+reddit_signals.py
+
+Single-pass Reddit signal collector for MarketPotential and Competition.
+
+Instead of searching each category subreddit separately (7 paged searches per
+scorer, 14 per idea), one multi-subreddit search (business+health+...) is run
+per query and grouped by subreddit. Both the market engagement average and the
+competition post-count buckets are computed from that one result set, which
+is cached per normalized query.
+
+Each subreddit still counts at most its first 50 results, as the separate
+searches did. If the multi-subreddit listing came back full, large
+subreddits may have crowded smaller ones out of it, so every subreddit below
+its cap is then searched on its own to get its real count.
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional
+
+from signal_fixtures import SignalFixtureStore, fixture_store
+from ttl_cache import TTLSingleFlightCache
+
+logger = logging.getLogger("reddit_signals")
+
+CACHE_TTL_SECONDS = int(os.getenv("REDDIT_SIGNAL_CACHE_TTL_SECONDS", "900"))
+PER_SUBREDDIT_LIMIT = 50
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+class RedditSignalCollector:
+    """Per-subreddit post and engagement counts from one multi-subreddit search."""
+
+    def __init__(self, reddit, subreddits: List[str], per_subreddit_limit: int = PER_SUBREDDIT_LIMIT,
+                 ttl: int = CACHE_TTL_SECONDS, fixtures: Optional[SignalFixtureStore] = None):
+        self.reddit = reddit
+        self.fixtures = fixtures or fixture_store
+        self.subreddits = [s.lower() for s in subreddits]
+        self.per_subreddit_limit = per_subreddit_limit
+        self._cache = TTLSingleFlightCache(ttl)
+
+    def _fetch(self, query: str) -> Dict[str, Dict[str, int]]:
+        key = {"query": normalize_query(query), "subreddits": self.subreddits, "limit": self.per_subreddit_limit}
+        return self.fixtures.fetch("reddit", key, lambda: self._fetch_live(query))
+
+    def _fetch_live(self, query: str) -> Dict[str, Dict[str, int]]:
+        stats = {sub: {"posts": 0, "engagement": 0} for sub in self.subreddits}
+        multi = self.reddit.subreddit("+".join(self.subreddits))
+        limit = self.per_subreddit_limit * len(self.subreddits)
+        seen = 0
+        for submission in multi.search(query, limit=limit):
+            seen += 1
+            self._count(stats, submission)
+        if seen < limit:
+            return stats  # the listing held every match, so no subreddit was crowded out
+        for sub, bucket in stats.items():
+            if bucket["posts"] < self.per_subreddit_limit:
+                stats[sub] = {"posts": 0, "engagement": 0}
+                for submission in self.reddit.subreddit(sub).search(query, limit=self.per_subreddit_limit):
+                    self._count(stats, submission, sub)
+        return stats
+
+    def _count(self, stats: Dict[str, Dict[str, int]], submission, sub: Optional[str] = None):
+        # Listing items already carry subreddit/score/num_comments, so nothing is lazily fetched
+        bucket = stats.get(sub or submission.subreddit.display_name.lower())
+        if bucket is None or bucket["posts"] >= self.per_subreddit_limit:
+            return
+        bucket["posts"] += 1
+        bucket["engagement"] += submission.score + submission.num_comments
+
+    def collect(self, query: str) -> Dict[str, Dict[str, int]]:
+        """{subreddit: {"posts": n, "engagement": score + comments}} for every configured subreddit"""
+        return self._cache.get_or_load(normalize_query(query), lambda: self._fetch(query))
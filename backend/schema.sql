@@ -67,3 +67,29 @@ CREATE TABLE IF NOT EXISTS llm_usage (
   llm_model TEXT UNIQUE,
   count INTEGER DEFAULT 0
 );
+
+CREATE TABLE IF NOT EXISTS signal_cache (
+  source TEXT NOT NULL,
+  query TEXT NOT NULL,
+  params TEXT NOT NULL DEFAULT '{}',
+  value TEXT,
+  fetched_at REAL NOT NULL,
+  PRIMARY KEY (source, query, params)
+);
+
+CREATE TABLE IF NOT EXISTS trend_series (
+  keyword TEXT NOT NULL,
+  cat INTEGER NOT NULL,
+  week TEXT NOT NULL,
+  value REAL NOT NULL,
+  fetched_at REAL NOT NULL,
+  PRIMARY KEY (keyword, cat, week)
+);
+
+CREATE TABLE IF NOT EXISTS llm_cache (
+  key TEXT PRIMARY KEY,
+  provider TEXT NOT NULL,
+  model TEXT,
+  response TEXT NOT NULL,
+  created_at REAL NOT NULL
+);
@@ -0,0 +1,108 @@
+"""
+scoring_math.py
+
+Vectorized scoring core behind FinalScore: component and final scores,
+progressive estimates and confidence labels.
+
+Scores for N ideas are held as an (N, S) array in SOURCE order. Clipping to
+0-100, the per-component source weights, the component combine and the
+confidence labels are each a single NumPy operation. As in the original
+scalar arithmetic each component is truncated to an int, then the weighted
+component sum is truncated to an int. Sums are rounded to TRUNCATE_DECIMALS
+first so float noise (61 computed as 60.9999...) never drops a point, which
+the old per-idea np.dot occasionally did.
+"""
+
+from typing import Iterable, Mapping, Tuple
+
+import numpy as np
+
+NEUTRAL_SCORE = 40
+CONFIDENCE_THRESHOLDS = (75, 55)  # strictly above -> "High", strictly above -> "Medium", else "Low"
+TRUNCATE_DECIMALS = 6
+
+
+def clip_scores(scores: np.ndarray, min_val: float = 0, max_val: float = 100) -> np.ndarray:
+    return np.clip(scores, min_val, max_val)
+
+
+def truncate(values: np.ndarray) -> np.ndarray:
+    """int truncation that is stable against float summation noise"""
+    return np.trunc(np.round(values, TRUNCATE_DECIMALS)).astype(int)
+
+
+def confidence_labels(scores) -> np.ndarray:
+    """'High' above 75, 'Medium' above 55, else 'Low', for every score at once"""
+    scores = np.asarray(scores)
+    high, medium = CONFIDENCE_THRESHOLDS
+    return np.select([scores > high, scores > medium], ["High", "Medium"], default="Low")
+
+
+def confidence_label(score) -> str:
+    return str(confidence_labels([score])[0])
+
+
+class BatchScorer:
+    """Weight matrices built once from FinalScore's source and component weights."""
+
+    def __init__(self, component_source_weights: Mapping[str, Mapping[str, float]],
+                 component_weights: Mapping[str, float]):
+        self.components = list(component_source_weights)
+        self.sources = [s for weights in component_source_weights.values() for s in weights]
+        self.source_index = {s: i for i, s in enumerate(self.sources)}
+        # (S, C): column c holds component c's weights on its own sources, zero elsewhere
+        self.source_weights = np.zeros((len(self.sources), len(self.components)))
+        for c, weights in enumerate(component_source_weights.values()):
+            for source, weight in weights.items():
+                self.source_weights[self.source_index[source], c] = weight
+        self.component_weights = np.array([component_weights[c] for c in self.components], dtype=float)
+
+    def signal_matrix(self, rows: Iterable[Mapping[str, float]], fill: float = np.nan) -> np.ndarray:
+        """(N, S) array from per-idea {source: score} dicts; missing sources get fill"""
+        rows = list(rows)
+        matrix = np.full((len(rows), len(self.sources)), fill, dtype=float)
+        for i, row in enumerate(rows):
+            for source, value in row.items():
+                if source in self.source_index and value is not None:
+                    matrix[i, self.source_index[source]] = value
+        return matrix
+
+    def component_scores(self, signals: np.ndarray) -> np.ndarray:
+        """(N, C) int component scores from a complete (N, S) signal array"""
+        return truncate(clip_scores(signals) @ self.source_weights)
+
+    def combine(self, components: np.ndarray) -> np.ndarray:
+        """(N,) int final scores from (N, C) component scores"""
+        return truncate(components @ self.component_weights)
+
+    def final_scores(self, signals: np.ndarray) -> np.ndarray:
+        return self.combine(self.component_scores(signals))
+
+    def partial_component_scores(self, signals: np.ndarray, neutral: float = NEUTRAL_SCORE) -> np.ndarray:
+        """
+        (N, C) int component scores for partially known (N, S) signals (unknown = NaN).
+        Each component's weights are renormalized over its known sources and a
+        component with none counts as neutral; complete components equal component_scores.
+        """
+        known = ~np.isnan(signals)
+        filled = np.where(known, signals, 0.0)
+        known_weight = known.astype(float) @ self.source_weights           # (N, C) weight mass known
+        weighted = clip_scores(filled) @ self.source_weights                 # (N, C) known contribution
+        total_weight = self.source_weights.sum(axis=0)                       # (C,)
+        complete = np.isclose(known_weight, total_weight)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            renormalized = np.where(known_weight > 0, weighted * total_weight / known_weight, neutral)
+        # Fully known components use the exact weighted sum, so nothing drifts from final_scores
+        return truncate(np.where(complete, weighted, renormalized))
+
+    def estimate(self, signals: np.ndarray, neutral: float = NEUTRAL_SCORE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (estimate, low, high) final scores for partially known (N, S) signals
+        (unknown = NaN): the renormalized estimate, and every unknown source
+        at 0/100. With no unknowns all three equal final_scores.
+        """
+        known = ~np.isnan(signals)
+        estimate = self.combine(self.partial_component_scores(signals, neutral))
+        low = self.final_scores(np.where(known, signals, 0.0))
+        high = self.final_scores(np.where(known, signals, 100.0))
+        return estimate, low, high
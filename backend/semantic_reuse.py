@@ -0,0 +1,61 @@
+"""
+semantic_reuse.py
+
+In-memory embedding index of recently scored ideas, so paraphrases of an idea
+("AI fitness coach app" / "fitness coaching app with AI") reuse its per-source
+signals instead of triggering a fresh round of external fetches.
+
+Vectors are the normalized all-MiniLM-L6-v2 idea vectors from
+idea_embeddings.py, kept in a fixed-size ring buffer; a lookup is one
+matrix-vector product over the live entries.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+SEMANTIC_REUSE_THRESHOLD = float(os.getenv("SEMANTIC_REUSE_THRESHOLD", "0.88"))
+RECENT_IDEA_CAPACITY = int(os.getenv("SEMANTIC_REUSE_CAPACITY", "512"))
+RECENT_IDEA_TTL_SECONDS = int(os.getenv("SEMANTIC_REUSE_TTL_SECONDS", str(6 * 3600)))
+
+
+class RecentIdeaIndex:
+    """Ring buffer of (idea, unit vector, signals) with cosine nearest-neighbour lookup."""
+
+    def __init__(self, capacity: int = RECENT_IDEA_CAPACITY, threshold: float = SEMANTIC_REUSE_THRESHOLD,
+                 ttl: int = RECENT_IDEA_TTL_SECONDS):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self._vectors: Optional[np.ndarray] = None
+        self._expires = np.zeros(capacity)
+        self._entries = [None] * capacity
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def add(self, idea: str, vector: np.ndarray, signals: Dict[str, Any]):
+        vector = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+            slot = self._next
+            self._vectors[slot] = vector
+            self._expires[slot] = time.monotonic() + self.ttl
+            self._entries[slot] = {"idea": idea, "signals": dict(signals)}
+            self._next = (slot + 1) % self.capacity
+
+    def nearest(self, vector: np.ndarray) -> Optional[Dict[str, Any]]:
+        """{"idea", "similarity", "signals"} of the closest live entry at or above the threshold"""
+        with self._lock:
+            if self._vectors is None:
+                return None
+            similarities = self._vectors @ np.asarray(vector, dtype=np.float32)
+            similarities[self._expires <= time.monotonic()] = -1.0
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            entry = self._entries[best]
+            return {"idea": entry["idea"], "similarity": float(similarities[best]), "signals": dict(entry["signals"])}
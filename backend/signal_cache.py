@@ -0,0 +1,159 @@
+"""
+signal_cache.py
+
+Persistent cache of external validation signals (pytrends, NewsAPI, GitHub,
+Reddit) in the `signal_cache` table of wave_admin.db.
+
+Entries are keyed by (source, normalized query, params) and expire after a
+per-source TTL, so results survive restarts and identical ideas are not
+re-fetched minutes apart. In stale-while-revalidate mode an expired entry is
+returned immediately and refreshed on a background thread; only a missing
+(or too old) entry blocks the caller on the live fetch.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("signal_cache")
+
+# Seconds an entry is fresh, per source
+DEFAULT_TTLS = {
+    "pytrends": 24 * 3600,
+    "reddit": 6 * 3600,
+    "newsapi": 6 * 3600,
+    "github_technical": 24 * 3600,
+    "github_competition": 24 * 3600,
+    "reddit_competition": 6 * 3600,
+}
+DEFAULT_TTL = int(os.getenv("SIGNAL_CACHE_DEFAULT_TTL_SECONDS", str(6 * 3600)))
+# How long past its TTL an entry may still be served while it is refreshed
+MAX_STALE_SECONDS = int(os.getenv("SIGNAL_CACHE_MAX_STALE_SECONDS", str(7 * 24 * 3600)))
+SWR_ENABLED = os.getenv("SIGNAL_CACHE_SWR", "1") not in ("0", "false", "False")
+REFRESH_WORKERS = int(os.getenv("SIGNAL_CACHE_REFRESH_WORKERS", "2"))
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS signal_cache (
+  source TEXT NOT NULL,
+  query TEXT NOT NULL,
+  params TEXT NOT NULL DEFAULT '{}',
+  value TEXT,
+  fetched_at REAL NOT NULL,
+  PRIMARY KEY (source, query, params)
+)
+"""
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(params or {}, sort_keys=True, separators=(",", ":"))
+
+
+class SignalCache:
+    """SQLite-backed signal cache with per-source TTLs and stale-while-revalidate."""
+
+    def __init__(self, db_path: str, ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = DEFAULT_TTL, max_stale: int = MAX_STALE_SECONDS,
+                 swr: bool = SWR_ENABLED, refresh_workers: int = REFRESH_WORKERS):
+        self.db_path = db_path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+        self.swr = swr
+        # Refreshes run on their own small pool so they never take fan-out slots from live requests
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="signal-refresh")
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self.ensure_table()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+
+    def ensure_table(self):
+        with self._connect() as conn:
+            conn.execute(CREATE_TABLE_SQL)
+
+    def ttl_for(self, source: str) -> int:
+        return self.ttls.get(source, self.default_ttl)
+
+    def lookup(self, source: str, query: str, params: Optional[Dict[str, Any]] = None) -> Optional[Tuple[Any, float]]:
+        """(value, age_seconds) of the stored entry, or None"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, fetched_at FROM signal_cache WHERE source = ? AND query = ? AND params = ?",
+                    (source, normalize_query(query), _params_key(params)),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("signal cache read failed for %s: %s", source, e)
+            return None
+        if not row:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def is_fresh(self, source: str, query: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        cached = self.lookup(source, query, params)
+        return cached is not None and cached[1] < self.ttl_for(source)
+
+    def store(self, source: str, query: str, value: Any, params: Optional[Dict[str, Any]] = None):
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO signal_cache (source, query, params, value, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                    (source, normalize_query(query), _params_key(params), json.dumps(value), time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning("signal cache write failed for %s: %s", source, e)
+
+    def _refresh(self, key, source: str, query: str, fetch: Callable[[], Any], params):
+        try:
+            self.store(source, query, fetch(), params)
+        except Exception as e:
+            logger.warning("background refresh of %s %r failed: %s", source, query, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def refresh_in_background(self, source: str, query: str, fetch: Callable[[], Any],
+                              params: Optional[Dict[str, Any]] = None) -> bool:
+        """Schedule one refresh per key; returns False if one is already running"""
+        key = (source, normalize_query(query), _params_key(params))
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+        self._refresher.submit(self._refresh, key, source, query, fetch, params)
+        return True
+
+    def get_or_fetch(self, source: str, query: str, fetch: Callable[[], Any],
+                     params: Optional[Dict[str, Any]] = None, swr: Optional[bool] = None,
+                     refresh: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Fresh cached value, else (in SWR mode) the stale value while a background
+        refresh runs, else the result of fetch() stored for next time.
+        Exceptions from fetch() are not cached and propagate to the caller.
+        refresh, when given, is what the background refresh calls instead of fetch
+        (e.g. without the caller's request deadline).
+        """
+        swr = self.swr if swr is None else swr
+        cached = self.lookup(source, query, params)
+        if cached is not None:
+            value, age = cached
+            ttl = self.ttl_for(source)
+            if age < ttl:
+                return value
+            if swr and age < ttl + self.max_stale:
+                self.refresh_in_background(source, query, refresh or fetch, params)
+                return value
+
+        value = fetch()
+        self.store(source, query, value, params)
+        return value
@@ -0,0 +1,123 @@
+"""
+signal_fanout.py
+
+Bounded thread-pool fan-out for the external validation signals used by
+FinalScore (pytrends, Reddit, NewsAPI, GitHub).
+
+Every source call of a scoring pass is submitted at once and gathered with
+its own timeout, so the wall-clock cost of a pass is roughly the slowest
+source instead of the sum of all of them. A source that raises or misses its
+timeout contributes its fallback value (the documented neutral 40 by default).
+Scorers report an upstream failure by raising SignalUnavailable with the score
+they would have used in its place, so a failure is never mistaken for (or
+cached as) a real result.
+iter_completed yields results in completion order for progressive scoring.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+logger = logging.getLogger("signal_fanout")
+
+DEFAULT_MAX_WORKERS = int(os.getenv("SIGNAL_FANOUT_WORKERS", "8"))
+DEFAULT_SOURCE_TIMEOUT = float(os.getenv("SIGNAL_SOURCE_TIMEOUT_SECONDS", "15"))
+NEUTRAL_SCORE = 40
+
+
+class SignalUnavailable(Exception):
+    """The source's upstream call failed; `value` is the score to use when nothing better is known."""
+
+    def __init__(self, value: Any = NEUTRAL_SCORE, reason: str = ""):
+        super().__init__(reason or "signal unavailable")
+        self.value = value
+
+
+class SignalCall:
+    """
+    A single source call: fn(*args), bounded by timeout seconds. On failure the
+    result is fallback() when given (e.g. the last cached value), else the
+    SignalUnavailable value the source raised, else default.
+    """
+
+    def __init__(self, fn: Callable[..., Any], args: Tuple = (),
+                 timeout: float = DEFAULT_SOURCE_TIMEOUT, default: Any = NEUTRAL_SCORE,
+                 fallback: Optional[Callable[[], Any]] = None):
+        self.fn = fn
+        self.args = args
+        self.timeout = timeout
+        self.default = default
+        self.fallback = fallback
+
+    def fallback_value(self, error: Optional[Exception] = None) -> Any:
+        if self.fallback is not None:
+            try:
+                value = self.fallback()
+                if value is not None:
+                    return value
+            except Exception as e:
+                logger.warning("fallback for %s failed: %s", getattr(self.fn, "__name__", self.fn), e)
+        if isinstance(error, SignalUnavailable):
+            return error.value
+        return self.default
+
+
+class SignalFanout:
+    """Runs a batch of SignalCalls concurrently on a shared, bounded thread pool."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="signal")
+
+    def gather(self, calls: Dict[str, SignalCall]) -> Dict[str, Any]:
+        return self.gather_with_status(calls)[0]
+
+    def gather_with_status(self, calls: Dict[str, SignalCall]) -> Tuple[Dict[str, Any], Set[str]]:
+        """
+        Submit every call at once and collect ({name: result}, names that fell back).
+        Each timeout is measured from submission, so a call still queued behind
+        a saturated pool is cancelled once its own budget is spent.
+        """
+        results: Dict[str, Any] = {}
+        degraded: Set[str] = set()
+        for name, value, ok in self.iter_completed(calls):
+            results[name] = value
+            if not ok:
+                degraded.add(name)
+        return results, degraded
+
+    def iter_completed(self, calls: Dict[str, SignalCall]) -> Iterator[Tuple[str, Any, bool]]:
+        """
+        Submit every call at once and yield (name, result, ok) in completion order.
+        ok is False when the call failed or timed out and its fallback was used.
+        """
+        started = time.monotonic()
+        futures = {self._executor.submit(call.fn, *call.args): name for name, call in calls.items()}
+        pending = set(futures)
+        try:
+            while pending:
+                elapsed = time.monotonic() - started
+                for future in [f for f in pending if not f.done() and calls[futures[f]].timeout <= elapsed]:
+                    pending.discard(future)
+                    future.cancel()
+                    name = futures[future]
+                    logger.warning("signal source %s timed out after %.1fs", name, calls[name].timeout)
+                    yield name, calls[name].fallback_value(), False
+                if not pending:
+                    break
+                next_timeout = min(calls[futures[f]].timeout for f in pending) - elapsed
+                done, _ = wait(pending, timeout=max(next_timeout, 0), return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    name = futures[future]
+                    try:
+                        yield name, future.result(), True
+                    except Exception as e:
+                        logger.warning("signal source %s failed: %s", name, e)
+                        yield name, calls[name].fallback_value(e), False
+        finally:
+            # Consumer stopped early (e.g. a closed stream): drop anything not yet started
+            for future in pending:
+                future.cancel()
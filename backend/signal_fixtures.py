@@ -0,0 +1,129 @@
+"""
+signal_fixtures.py
+
+Record/replay store for the raw external-signal responses used by
+MarketPotential, TechnicalRisk and Competition (pytrends, Reddit, NewsAPI,
+GitHub), so scoring can be benchmarked and regression-tested offline.
+
+Modes (SIGNAL_FIXTURE_MODE):
+  off     live calls only (default)
+  record  live calls, each response also written to SIGNAL_FIXTURE_DIR
+  replay  no network; responses are served from SIGNAL_FIXTURE_DIR after a
+          synthetic delay (SIGNAL_FIXTURE_LATENCY_MS, either one number or
+          per-source values such as "pytrends=800,github=150,default=50").
+          A request with no recorded fixture raises FixtureMissing, which the
+          scorers treat like any other source failure (neutral 40).
+
+Fixtures are one JSON file per request under <dir>/<source>/<sha1 of key>.json.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("signal_fixtures")
+
+MODES = ("off", "record", "replay")
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "signals")
+
+
+class FixtureMissing(LookupError):
+    pass
+
+
+def parse_latency(spec: str) -> Dict[str, float]:
+    """'120' -> {'default': 120}; 'pytrends=800,default=50' -> per-source milliseconds"""
+    latencies = {"default": 0.0}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" in part:
+            source, value = part.split("=", 1)
+            latencies[source.strip()] = float(value)
+        else:
+            latencies["default"] = float(part)
+    return latencies
+
+
+class SignalFixtureStore:
+    def __init__(self, mode: str = "off", directory: str = DEFAULT_FIXTURE_DIR,
+                 latency_ms: Optional[Dict[str, float]] = None, jitter_ms: float = 0.0):
+        if mode not in MODES:
+            raise ValueError(f"SIGNAL_FIXTURE_MODE must be one of {MODES}, got {mode!r}")
+        self.mode = mode
+        self.directory = directory
+        self.latency_ms = latency_ms or {"default": 0.0}
+        self.jitter_ms = jitter_ms
+
+    @classmethod
+    def from_env(cls) -> "SignalFixtureStore":
+        return cls(
+            mode=os.getenv("SIGNAL_FIXTURE_MODE", "off").strip().lower() or "off",
+            directory=os.getenv("SIGNAL_FIXTURE_DIR", DEFAULT_FIXTURE_DIR),
+            latency_ms=parse_latency(os.getenv("SIGNAL_FIXTURE_LATENCY_MS", "0")),
+            jitter_ms=float(os.getenv("SIGNAL_FIXTURE_JITTER_MS", "0")),
+        )
+
+    @property
+    def active(self) -> bool:
+        return self.mode != "off"
+
+    def path_for(self, source: str, key: Dict[str, Any]) -> str:
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, source, f"{digest}.json")
+
+    def load(self, source: str, key: Dict[str, Any]) -> Any:
+        path = self.path_for(source, key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except FileNotFoundError:
+            raise FixtureMissing(f"no {source} fixture for {key}")
+
+    def save(self, source: str, key: Dict[str, Any], response: Any):
+        path = self.path_for(source, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        record = {"source": source, "key": key, "recorded_at": datetime.utcnow().isoformat(), "response": response}
+        # Write-then-rename so concurrent recorders never leave a half-written fixture
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def record(self, source: str, key: Dict[str, Any], response: Any):
+        """save() that only logs on failure, so recording never breaks a live call"""
+        try:
+            self.save(source, key, response)
+        except OSError as e:
+            logger.warning("could not record %s fixture: %s", source, e)
+
+    def delay(self, source: str):
+        """Sleep for the configured synthetic latency of source"""
+        delay = self.latency_ms.get(source, self.latency_ms.get("default", 0.0))
+        if self.jitter_ms:
+            delay += random.uniform(0, self.jitter_ms)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+    def fetch(self, source: str, key: Dict[str, Any], live: Callable[[], Any]) -> Any:
+        """
+        live() in off mode; live() plus a saved fixture in record mode; the saved
+        fixture after the synthetic delay in replay mode. The response must be JSON-serializable.
+        """
+        if self.mode == "replay":
+            self.delay(source)
+            return self.load(source, key)
+        response = live()
+        if self.mode == "record":
+            self.record(source, key, response)
+        return response
+
+
+fixture_store = SignalFixtureStore.from_env()
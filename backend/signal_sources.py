@@ -0,0 +1,217 @@
+"""
+signal_sources.py
+
+Signal-source plugins and a cost/latency planner for FinalScore.
+
+Each external signal (pytrends, Reddit, NewsAPI, GitHub, ...) is registered as
+a SignalSource that declares the component it feeds, its weight within that
+component, its expected latency, its rate-limit cost and its timeout, and
+keeps an EWMA of the latencies actually observed. While a source goes
+uncalled its estimate decays back toward the declared expected latency
+(half-life SIGNAL_LATENCY_DECAY_SECONDS), so one slow spell cannot keep it
+out of every later plan. The SourcePlanner picks the sources to query for one
+request from its latency budget and tier; sources it skips (or that are
+disabled, e.g. DISABLED_SIGNAL_SOURCES=pytrends under heavy load) simply drop
+out and their component's weights are renormalized over the sources that
+remain. Sources the signal cache can answer are never skipped for latency or
+cost.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+DISABLED_SOURCES_ENV = "DISABLED_SIGNAL_SOURCES"
+SCORING_TIER_HEADER = "X-Scoring-Tier"
+LATENCY_EWMA_ALPHA = 0.2
+LATENCY_DECAY_HALF_LIFE_SECONDS = float(os.getenv("SIGNAL_LATENCY_DECAY_SECONDS", "300"))
+
+# Max rate-limit cost one request may spend, per tier (None = unlimited)
+TIER_COST_LIMITS = {
+    "full": None,
+    "standard": int(os.getenv("SCORING_TIER_STANDARD_COST", "4")),
+    "economy": int(os.getenv("SCORING_TIER_ECONOMY_COST", "2")),
+}
+DEFAULT_TIER = os.getenv("SCORING_DEFAULT_TIER", "full")
+
+
+class SignalSource:
+    """
+    One signal plugin. fetch(query) returns a 0-100 score; `query` says which
+    query the source is given ("keywords" or "simplified"). Sources sharing a
+    cost_key (e.g. the two GitHub sources reading one cached search) are only
+    charged once per request. An optional prefetch(queries) warms the source's
+    own cache for many queries in one call, for batch scoring; it is given the
+    batch request's Deadline as `deadline` and must stop when it expires.
+    With takes_timeout, fetch is also passed `timeout`: the seconds this call
+    has left under the request's deadline, for sources that wait internally.
+    """
+
+    def __init__(self, name: str, component: str, weight: float, fetch: Callable[[str], Any],
+                 query: str = "keywords", expected_latency: float = 5.0, cost: int = 1,
+                 timeout: float = 15.0, cost_key: Optional[str] = None,
+                 prefetch: Optional[Callable[..., None]] = None, takes_timeout: bool = False,
+                 clock=time.monotonic):
+        self.name = name
+        self.component = component
+        self.weight = weight
+        self.fetch = fetch
+        self.query = query
+        self.expected_latency = expected_latency
+        self.cost = cost
+        self.timeout = timeout
+        self.cost_key = cost_key or name
+        self.prefetch = prefetch
+        self.takes_timeout = takes_timeout
+        self.clock = clock
+        self.observed_latency: Optional[float] = None
+        self._observed_at = 0.0
+        self.calls = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool = True):
+        with self._lock:
+            self.calls += 1
+            if not ok:
+                self.failures += 1
+            # The first sample is blended with the declared latency rather than replacing it
+            estimate = self._decayed_latency(self.clock())
+            self.observed_latency = estimate + LATENCY_EWMA_ALPHA * (latency - estimate)
+            self._observed_at = self.clock()
+
+    def _decayed_latency(self, now: float) -> float:
+        if self.observed_latency is None:
+            return self.expected_latency
+        if LATENCY_DECAY_HALF_LIFE_SECONDS <= 0:
+            return self.observed_latency
+        decay = 0.5 ** ((now - self._observed_at) / LATENCY_DECAY_HALF_LIFE_SECONDS)
+        return self.expected_latency + (self.observed_latency - self.expected_latency) * decay
+
+    @property
+    def estimated_latency(self) -> float:
+        """Observed EWMA, decayed toward expected_latency for the time since the last call"""
+        with self._lock:
+            return self._decayed_latency(self.clock())
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "name": self.name, "component": self.component, "weight": self.weight,
+            "expected_latency": self.expected_latency,
+            "observed_latency": round(self.observed_latency, 3) if self.observed_latency is not None else None,
+            "estimated_latency": round(self.estimated_latency, 3),
+            "cost": self.cost, "timeout": self.timeout, "calls": self.calls, "failures": self.failures,
+        }
+
+
+class SourceRegistry:
+    """Registered sources plus the component combine weights; sources can be disabled at runtime."""
+
+    def __init__(self, component_weights: Dict[str, float], sources: Iterable[SignalSource] = (),
+                 disabled: Optional[Iterable[str]] = None):
+        self.component_weights = dict(component_weights)
+        self._sources: Dict[str, SignalSource] = {}
+        if disabled is None:
+            disabled = [s.strip() for s in os.getenv(DISABLED_SOURCES_ENV, "").split(",") if s.strip()]
+        self._disabled = set(disabled)
+        self._lock = threading.Lock()
+        for source in sources:
+            self.register(source)
+
+    def register(self, source: SignalSource):
+        if source.component not in self.component_weights:
+            raise ValueError(f"unknown component {source.component!r} for source {source.name!r}")
+        with self._lock:
+            self._sources[source.name] = source
+
+    def get(self, name: str) -> SignalSource:
+        return self._sources[name]
+
+    def disable(self, name: str):
+        with self._lock:
+            self._disabled.add(name)
+
+    def enable(self, name: str):
+        with self._lock:
+            self._disabled.discard(name)
+
+    def is_enabled(self, name: str) -> bool:
+        return name in self._sources and name not in self._disabled
+
+    def names(self, component: Optional[str] = None, enabled_only: bool = False) -> List[str]:
+        return [name for name, source in self._sources.items()
+                if (component is None or source.component == component)
+                and (not enabled_only or name not in self._disabled)]
+
+    def component_source_weights(self) -> Dict[str, Dict[str, float]]:
+        """{component: {source: weight}} for every registered source (disabled ones included)"""
+        return {component: {name: self._sources[name].weight for name in self.names(component)}
+                for component in self.component_weights}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [dict(source.snapshot(), enabled=self.is_enabled(name)) for name, source in self._sources.items()]
+
+
+class SourcePlan:
+    def __init__(self, sources: List[str], skipped: Dict[str, str]):
+        self.sources = sources
+        self.skipped = skipped  # name -> "disabled" | "latency" | "tier"
+
+
+class SourcePlanner:
+    """Chooses the sources to query for one request from its latency budget and tier."""
+
+    def __init__(self, registry: SourceRegistry, tier_cost_limits: Optional[Dict[str, Optional[int]]] = None):
+        self.registry = registry
+        self.tier_cost_limits = dict(TIER_COST_LIMITS, **(tier_cost_limits or {}))
+
+    def plan(self, budget_seconds: Optional[float] = None, tier: Optional[str] = None,
+             cached: Optional[Callable[[str], bool]] = None) -> SourcePlan:
+        """
+        Drop disabled sources and those whose estimated latency exceeds the budget,
+        then spend the tier's cost limit on the sources with the highest
+        score weight per unit of cost. cached(name) says whether the signal cache
+        can answer a source; such sources are kept regardless of latency and cost
+        nothing against the tier. It is asked at most once per source.
+        """
+        answers: Dict[str, bool] = {}
+
+        def is_cached(name):
+            if name not in answers:
+                answers[name] = bool(cached and cached(name))
+            return answers[name]
+
+        skipped: Dict[str, str] = {}
+        candidates = []
+        for name in self.registry.names():
+            source = self.registry.get(name)
+            if not self.registry.is_enabled(name):
+                skipped[name] = "disabled"
+            elif budget_seconds is not None and source.estimated_latency > budget_seconds and not is_cached(name):
+                skipped[name] = "latency"
+            else:
+                candidates.append(source)
+
+        cost_limit = self.tier_cost_limits.get(tier or DEFAULT_TIER)
+        if cost_limit is None:
+            return SourcePlan([s.name for s in candidates], skipped)
+
+        def cost_of(source):
+            return 0 if is_cached(source.name) else source.cost
+
+        def value(source):
+            return source.weight * self.registry.component_weights[source.component] / max(cost_of(source), 1)
+
+        chosen, spent, charged = set(), 0, set()
+        for source in sorted(candidates, key=value, reverse=True):
+            cost = 0 if source.cost_key in charged else cost_of(source)
+            if spent + cost <= cost_limit:
+                chosen.add(source.name)
+                spent += cost
+                if cost:
+                    charged.add(source.cost_key)
+            else:
+                skipped[source.name] = "tier"
+        # Keep registration order so fan-out and streaming order stay stable
+        return SourcePlan([s.name for s in candidates if s.name in chosen], skipped)
@@ -0,0 +1,152 @@
+"""
+trend_series.py
+
+Persisted weekly Google Trends series per (keyword, category) in the
+`trend_series` table of wave_admin.db.
+
+The first time a keyword is seen in a category TrendsScheduler downloads its
+full history once and stores it week by week. Afterwards only the window since
+the last stored week (plus a few overlapping weeks) is requested. Trends
+rescales every response to its own 0-100 range, so the delta is rescaled onto
+the stored series by the ratio of the two over the overlapping complete weeks
+before it is merged. The score's mean is then a single AVG over the stored
+weeks in the history window.
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger("trend_series")
+
+HISTORY_DAYS = int(os.getenv("TREND_SERIES_HISTORY_DAYS", str(3 * 365)))
+# Complete weeks re-requested before the last stored week to align a delta's scale
+OVERLAP_WEEKS = int(os.getenv("TREND_SERIES_OVERLAP_WEEKS", "4"))
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS trend_series (
+  keyword TEXT NOT NULL,
+  cat INTEGER NOT NULL,
+  week TEXT NOT NULL,
+  value REAL NOT NULL,
+  fetched_at REAL NOT NULL,
+  PRIMARY KEY (keyword, cat, week)
+)
+"""
+
+
+def week_start(day: date) -> date:
+    """Sunday starting day's week (Trends labels weekly points by their Sunday)"""
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def weekly(series: pd.Series) -> Dict[str, float]:
+    """{week start ISO date: mean value} from a daily or weekly interest_over_time column"""
+    series = series.dropna()
+    if series.empty:
+        return {}
+    weeks = [week_start(ts.date()).isoformat() for ts in pd.to_datetime(series.index)]
+    return {week: float(value) for week, value in series.groupby(weeks).mean().items()}
+
+
+class TrendSeriesStore:
+    """Weekly series store with delta merging and windowed means."""
+
+    def __init__(self, db_path: str, history_days: int = HISTORY_DAYS, overlap_weeks: int = OVERLAP_WEEKS,
+                 today=date.today):
+        self.db_path = db_path
+        self.history_days = history_days
+        self.overlap_weeks = overlap_weeks
+        self.today = today
+        self.ensure_table()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+
+    def ensure_table(self):
+        with self._connect() as conn:
+            conn.execute(CREATE_TABLE_SQL)
+
+    def window_start(self) -> str:
+        return week_start(self.today() - timedelta(days=self.history_days)).isoformat()
+
+    def coverage(self, keyword: str, cat: int) -> Optional[Tuple[str, str]]:
+        """(first week, last week) stored for the pair, or None"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MIN(week), MAX(week) FROM trend_series WHERE keyword = ? AND cat = ?",
+                (keyword, cat),
+            ).fetchone()
+        return (row[0], row[1]) if row and row[0] else None
+
+    def is_current(self, keyword: str, cat: int) -> bool:
+        """Stored up to the current (possibly partial) week"""
+        coverage = self.coverage(keyword, cat)
+        return coverage is not None and coverage[1] >= week_start(self.today()).isoformat()
+
+    def mean(self, keyword: str, cat: int) -> Optional[float]:
+        """Mean weekly interest over the history window (None when nothing is stored)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT AVG(value) FROM trend_series WHERE keyword = ? AND cat = ? AND week >= ?",
+                (keyword, cat, self.window_start()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def delta_timeframe(self, keywords: Iterable[str], cat: int) -> str:
+        """pytrends timeframe covering every keyword's missing weeks plus the overlap"""
+        last_weeks = [c[1] for c in (self.coverage(kw, cat) for kw in keywords) if c]
+        start = date.fromisoformat(min(last_weeks)) - timedelta(weeks=self.overlap_weeks)
+        return f"{start.isoformat()} {self.today().isoformat()}"
+
+    def _write(self, conn, keyword: str, cat: int, series: Dict[str, float]):
+        now = time.time()
+        conn.executemany(
+            "INSERT OR REPLACE INTO trend_series (keyword, cat, week, value, fetched_at) VALUES (?, ?, ?, ?, ?)",
+            [(keyword, cat, week, value, now) for week, value in series.items()],
+        )
+        conn.execute("DELETE FROM trend_series WHERE keyword = ? AND cat = ? AND week < ?",
+                     (keyword, cat, self.window_start()))
+
+    def replace(self, keyword: str, cat: int, series: Dict[str, float]):
+        """Store a full-history download, dropping whatever was stored before"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM trend_series WHERE keyword = ? AND cat = ?", (keyword, cat))
+            self._write(conn, keyword, cat, series)
+
+    def merge_delta(self, keyword: str, cat: int, series: Dict[str, float]) -> bool:
+        """
+        Rescale a recent-window download onto the stored series and merge it.
+        Returns False when the two cannot be aligned (no overlap, or one side
+        all zeros), in which case the caller should download the full history.
+        """
+        coverage = self.coverage(keyword, cat)
+        if coverage is None or not series:
+            return False
+        last_week = coverage[1]
+        with self._connect() as conn:
+            stored = dict(conn.execute(
+                "SELECT week, value FROM trend_series WHERE keyword = ? AND cat = ? AND week >= ?",
+                (keyword, cat, min(series)),
+            ).fetchall())
+        # The last stored week may have been partial, so only earlier weeks anchor the scale
+        overlap = [week for week in series if week in stored and week < last_week]
+        if not overlap:
+            return False
+        stored_total = sum(stored[week] for week in overlap)
+        new_total = sum(series[week] for week in overlap)
+        if stored_total == 0 and new_total == 0:
+            ratio = 1.0
+        elif stored_total == 0 or new_total == 0:
+            return False
+        else:
+            ratio = stored_total / new_total
+        with self._connect() as conn:
+            self._write(conn, keyword, cat,
+                        {week: value * ratio for week, value in series.items() if week >= last_week})
+        return True
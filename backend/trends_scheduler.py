@@ -0,0 +1,230 @@
+"""
+trends_scheduler.py
+
+Throttle-aware scheduler for Google Trends (pytrends).
+
+MarketPotential builds one interest_over_time payload per category for every
+idea (7 calls per idea, each for at most 3 keywords). Here those requests
+from all concurrent ideas go through one queue: identical (keywords,
+category) requests are coalesced into a single payload, and a single
+dispatcher thread owns the shared pytrends session, paces payloads with a
+token bucket, backs off exponentially on HTTP 429 and fans the per-keyword
+means back out to the waiting callers.
+
+Trends scales every payload to 0-100 relative to its largest term, so each
+idea's keywords are always sent in a payload of their own, never packed with
+another idea's; a keyword's mean therefore only depends on its own idea.
+
+With a TrendSeriesStore (trend_series.py) each keyword's weekly series is
+persisted per keyword group (the idea's keywords it was fetched with, which
+fix its scale): groups already stored up to the current week cost no
+request, stale ones are refreshed with one small delta payload, and only new
+groups download the full history.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from signal_fixtures import FixtureMissing, SignalFixtureStore, fixture_store
+from trend_series import TrendSeriesStore, weekly
+
+logger = logging.getLogger("trends_scheduler")
+
+MAX_KEYWORDS_PER_PAYLOAD = 5
+REQUESTS_PER_MINUTE = float(os.getenv("TRENDS_REQUESTS_PER_MINUTE", "20"))
+BURST = int(os.getenv("TRENDS_BURST", "10"))
+MAX_RETRIES = int(os.getenv("TRENDS_MAX_RETRIES", "3"))
+BACKOFF_BASE_SECONDS = float(os.getenv("TRENDS_BACKOFF_BASE_SECONDS", "2"))
+BACKOFF_MAX_SECONDS = 60.0
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """pytrends raises TooManyRequestsError / ResponseError carrying the 429 response"""
+    if type(error).__name__ == "TooManyRequestsError":
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+class TokenBucket:
+    """Blocking token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def drain(self):
+        """Empty the bucket after a 429 so the next payloads are paced from zero"""
+        with self._lock:
+            self.tokens = 0.0
+            self.updated = time.monotonic()
+
+
+Group = Tuple[str, ...]
+
+
+class TrendsScheduler:
+    """Queues (keyword group, category) requests and serves them from coalesced, paced payloads."""
+
+    def __init__(self, pytrends, timeframe: str = 'now 3-y', requests_per_minute: float = REQUESTS_PER_MINUTE,
+                 burst: int = BURST, max_retries: int = MAX_RETRIES, backoff_base: float = BACKOFF_BASE_SECONDS,
+                 fixtures: Optional[SignalFixtureStore] = None, series_store: Optional[TrendSeriesStore] = None):
+        self.pytrends = pytrends
+        self.fixtures = fixtures or fixture_store
+        self.series = series_store
+        self.timeframe = timeframe
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.bucket = TokenBucket(requests_per_minute / 60.0, burst)
+        # (category, group) -> waiting futures, oldest first
+        self._pending: "OrderedDict[Tuple[int, Group], List[Future]]" = OrderedDict()
+        # (category, group) -> futures waiting on a payload that is already being fetched
+        self._inflight: Dict[Tuple[int, Group], List[Future]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def _ensure_dispatcher(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="trends-dispatcher", daemon=True)
+            self._thread.start()
+
+    def submit(self, keywords: Iterable[str], category: int) -> Future:
+        """
+        Future resolving to {keyword: mean interest} (None when Trends has no data)
+        for one idea's keywords in category, fetched together in one payload
+        """
+        group: Group = tuple(dict.fromkeys(keywords))[:MAX_KEYWORDS_PER_PAYLOAD]
+        future: Future = Future()
+        with self._cond:
+            waiting = self._inflight.get((category, group))
+            if waiting is None:
+                waiting = self._pending.setdefault((category, group), [])
+            waiting.append(future)
+            self._ensure_dispatcher()
+            self._cond.notify()
+        return future
+
+    def keyword_means(self, keywords: Iterable[str], categories: Iterable[int],
+                      timeout: Optional[float] = None) -> Dict[int, Dict[str, Optional[float]]]:
+        """
+        {category: {keyword: mean}} for every category. A category whose payload
+        failed or did not finish within timeout maps to an empty dict.
+        """
+        keywords = list(keywords)
+        futures = {cat: self.submit(keywords, cat) for cat in categories}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results: Dict[int, Dict[str, Optional[float]]] = {}
+        for cat, future in futures.items():
+            results[cat] = {}
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                results[cat] = future.result(timeout=remaining)
+            except FutureTimeout:
+                logger.warning("trends request %r (cat %s) timed out", keywords, cat)
+            except Exception as e:
+                logger.warning("trends request %r (cat %s) failed: %s", keywords, cat, e)
+        return results
+
+    def _next_request(self) -> Tuple[int, Group]:
+        """Block until a request is queued, then move the oldest one in flight"""
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            (category, group), futures = self._pending.popitem(last=False)
+            self._inflight[(category, group)] = futures
+            return category, group
+
+    def _fixture_key(self, group: Group, category: int) -> Dict[str, object]:
+        return {"keywords": list(group), "cat": category, "timeframe": self.timeframe}
+
+    @staticmethod
+    def _series_key(group: Group, keyword: str) -> str:
+        """Stored series name: the keyword qualified by the group that fixes its scale"""
+        return keyword if group == (keyword,) else f"{keyword}@{','.join(group)}"
+
+    def _fetch(self, group: Group, category: int) -> Dict[str, Optional[float]]:
+        if self.fixtures.mode == "replay":
+            self.fixtures.delay("pytrends")  # one synthetic round trip per payload
+            return self.fixtures.load("pytrends", self._fixture_key(group, category))
+        means = self._fetch_live(list(group), category)
+        if self.fixtures.mode == "record":
+            self.fixtures.record("pytrends", self._fixture_key(group, category), means)
+        return means
+
+    def _fetch_live(self, group: List[str], category: int) -> Dict[str, Optional[float]]:
+        if self.series is None:
+            data = self._interest_over_time(group, category, self.timeframe)
+            if data.empty:
+                return {kw: None for kw in group}
+            return {kw: float(data[kw].mean()) if kw in data else None for kw in group}
+
+        # The whole group is always requested together so its stored series share one scale
+        keys = [self._series_key(tuple(group), kw) for kw in group]
+
+        def means():
+            return {kw: self.series.mean(key, category) for kw, key in zip(group, keys)}
+
+        if all(self.series.coverage(key, category) is not None for key in keys):
+            if all(self.series.is_current(key, category) for key in keys):
+                return means()
+            data = self._interest_over_time(group, category, self.series.delta_timeframe(keys, category))
+            # An empty delta means no new interest data; the stored series are kept until next time
+            if all(data.empty or keyword not in data or self.series.merge_delta(key, category, weekly(data[keyword]))
+                   for keyword, key in zip(group, keys)):
+                return means()
+        data = self._interest_over_time(group, category, self.timeframe)
+        for keyword, key in zip(group, keys):
+            if not data.empty and keyword in data:
+                self.series.replace(key, category, weekly(data[keyword]))
+        return means()
+
+    def _interest_over_time(self, keywords: List[str], category: int, timeframe: str):
+        """One paced interest_over_time payload, retried with exponential backoff on 429"""
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            try:
+                self.pytrends.build_payload(keywords, cat=category, timeframe=timeframe, geo='', gprop='')
+                return self.pytrends.interest_over_time()
+            except Exception as e:
+                if not is_rate_limited(e) or attempt == self.max_retries:
+                    raise
+                delay = min(self.backoff_base * (2 ** attempt), BACKOFF_MAX_SECONDS)
+                logger.warning("Google Trends rate limited (cat %s), backing off %.1fs", category, delay)
+                self.bucket.drain()
+                time.sleep(delay)
+
+    def _run(self):
+        while True:
+            category, group = self._next_request()
+            try:
+                means = self._fetch(group, category)
+                error = None
+            except Exception as e:
+                means, error = {}, e
+            with self._cond:
+                futures = self._inflight.pop((category, group), [])
+            for future in futures:
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result({kw: means.get(kw) for kw in group})
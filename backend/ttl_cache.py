@@ -0,0 +1,72 @@
+"""
+ttl_cache.py
+
+Small in-process TTL cache with single-flight loading, shared by the
+external signal clients (GitHub search, Reddit collector).
+
+Concurrent callers asking for the same key while it is being loaded wait
+on the one in-flight load instead of issuing their own request.
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class TTLSingleFlightCache:
+    def __init__(self, ttl: float, max_entries: int = 1024,
+                 should_cache: Optional[Callable[[Any], bool]] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.should_cache = should_cache or (lambda value: True)
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Fresh cached value for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+        return None
+
+    def put(self, key: str, value: Any):
+        if not self.should_cache(value):
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            if len(self._entries) > self.max_entries:
+                now = time.monotonic()
+                for k in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+                    del self._entries[k]
+                while len(self._entries) > self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+
+    def get_or_load(self, key: str, load: Callable[[], Any]) -> Any:
+        """Cached value for key, or the result of one shared call to load()"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = load()
+            self.put(key, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)